@@ -2,5 +2,6 @@
 
 from .. import StreamReadWriter, Device, DeviceError
 
+from .common import ControllerError
 from .hxp import HXP
 from .xps import XPS
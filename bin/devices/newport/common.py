@@ -0,0 +1,476 @@
+"""Common routines for the Newport motion controller APIs.
+
+A controller function is called by sending `Name(arg1,arg2,type *,type *)`,
+where every `type *` placeholder asks the controller to fill in one output.
+The reply is the error code followed by the outputs, separated by commas.
+"""
+import asyncio
+import functools
+import re
+import socket
+import sys
+import types
+from collections import deque
+
+from . import DeviceError
+
+class ControllerError(DeviceError):
+    """Raised when the controller returns a nonzero error code."""
+    def __init__(self, error):
+        super().__init__("Device returned error code: {0}".format(error))
+        self.error = error
+
+
+class _BoolTable(dict):
+    """Table of returned boolean fields. Fields not in the table are read
+    as integers."""
+    __slots__ = []
+
+    def __missing__(self, field):
+        return bool(int(field))
+
+
+# The controller returns booleans as 0/1. Converting with the bound
+# __getitem__ of the table is a single C call for the usual fields.
+_BOOLS = _BoolTable({b"0": False, b"1": True, b"false": False, b"true": True,
+                     b"False": False, b"True": True})
+
+
+# Converters for output fields, keyed by their C type.
+_CONVERTERS = {
+    "double": float,
+    "int": int,
+    "unsigned short": int,
+    "bool": _BOOLS.__getitem__,
+    "char": bytes.decode,
+}
+
+# Matches the C type of every output in a prototype like "char *,double *".
+_OUTPUT_TYPE = re.compile(r"(\w+(?: \w+)*) \*")
+
+# Command suffixes such as b',double *,double *)' are shared by many
+# functions, keep a single copy of each.
+_SUFFIXES = {}
+
+# Maximum number of commands cached by a name-only function.
+_COMMAND_CACHE_SIZE = 256
+
+# Parsers compiled for every output prototype, keyed by the C types.
+_PARSERS = {}
+
+
+# Return of a successful function without outputs.
+_NO_OUTPUTS = (0, '')
+
+
+def _parse_none(error, returnedBytes):
+    """Parse the return of a function without outputs. Only successful
+    returns get here, and the usual empty one is shared, so it is neither
+    decoded nor allocated.
+
+    Returns: (0, returnedString)
+    """
+    return _NO_OUTPUTS if not returnedBytes else (0, returnedBytes.decode())
+
+
+def _compile_parser(ctypes):
+    """Compile a parser for the outputs of C types `ctypes`, which splits the
+    returned bytes once and converts every field with its own converter.
+    Numbers are converted from bytes directly, without decoding.
+
+    Every distinct converter is bound as a default argument, so it is read
+    as a fast local instead of a global.
+
+    Returns: a function parse(error, returnedBytes) returning the tuple
+    (error, output1, output2, ...).
+    """
+    if not ctypes:
+        return _parse_none
+    distinct = sorted(set(ctypes), key=ctypes.index)
+    fields = ['f{}'.format(i) for i in range(len(ctypes))]
+    source = ("def parse(error, returnedBytes, {converters}):\n"
+              "    {fields}, = returnedBytes.split(b',', {maxsplit})\n"
+              "    return (error, {outputs})\n").format(
+        converters=', '.join('c{0}=c{0}'.format(i) for i in range(len(distinct))),
+        fields=', '.join(fields), maxsplit=len(fields) - 1,
+        outputs=', '.join('c{}({})'.format(distinct.index(ctype), field)
+                          for ctype, field in zip(ctypes, fields)))
+    namespace = {'c{}'.format(i): _CONVERTERS[ctype] for i, ctype in enumerate(distinct)}
+    exec(source, namespace)
+    return namespace['parse']
+
+
+@functools.lru_cache(maxsize=None)
+def prototype_parser(returns):
+    """Parser of the outputs of the C prototype `returns`, e.g.
+    "char *,double *". Many functions share a prototype, so it is only
+    scanned once, and functions with the same outputs share one parser.
+    Functions returning one output per element, like GroupPositionCurrentGet,
+    get a parser specialized for their number of elements the same way.
+    """
+    ctypes = tuple(_OUTPUT_TYPE.findall(returns))
+    if ctypes not in _PARSERS:
+        _PARSERS[ctypes] = _compile_parser(ctypes)
+    return _PARSERS[ctypes]
+
+
+class Function:
+    """A controller function described by its name, the names of its input
+    arguments and the C prototype of its outputs. An argument name starting
+    with '*' takes a sequence of values.
+    """
+    __slots__ = ["name", "args", "returns", "doc", "parse",
+                 "_template", "_command", "_prefix", "_suffix", "_commands",
+                 "_sequence"]
+
+    def __init__(self, name, args="", returns="", doc=""):
+        self.name = sys.intern(name)
+        self.args = args.split(',') if args else []
+        self.returns = returns.split(',') if returns else []
+        self.doc = doc
+
+        self._template = '{name}({fields})'.format(
+            name=name, fields=','.join(['%s'] * len(self.args) + self.returns))
+        # parse(error, returnedBytes) converts the outputs of this function.
+        self.parse = prototype_parser(returns)
+        self._sequence = bool(self.args) and self.args[-1].startswith('*')
+        # The command of a function without arguments never changes.
+        self._command = None if self.args else self._template.encode()
+        # Most functions only take a positioner or group name. Their command
+        # is built by concatenating the name between a fixed prefix and suffix,
+        # and cached by name as there are only a few of them in a system.
+        if len(self.args) == 1 and not self._sequence:
+            self._prefix, suffix = self._template.encode().split(b'%s')
+            self._suffix = _SUFFIXES.setdefault(suffix, suffix)
+            self._commands = {}
+        else:
+            self._prefix = self._suffix = self._commands = None
+
+    def format(self, args):
+        """Build the command calling this function with `args`.
+
+        Returns: the command as bytes.
+        """
+        if self._command is not None:
+            return self._command
+        prefix = self._prefix
+        if prefix is not None:
+            arg = args[0]
+            if type(arg) is not str:
+                return prefix + str(arg).encode() + self._suffix
+            command = self._commands.get(arg)
+            if command is None:
+                command = prefix + arg.encode() + self._suffix
+                if len(self._commands) >= _COMMAND_CACHE_SIZE:
+                    self._commands.clear()
+                self._commands[arg] = command
+            return command
+        if self._sequence:
+            args = args[:-1] + (','.join(map(str, args[-1])),)
+        # %-formatting all arguments at once and encoding the whole command
+        # is faster than encoding every argument on its own. Floats are sent
+        # as their shortest repr, which round-trips, so targets are never
+        # rounded.
+        return (self._template % args).encode()
+
+
+# Code of the API methods, keyed by their argument names and the device
+# method they call. Functions taking the same arguments share one code object.
+_METHOD_CODES = {}
+
+
+def api_method(function, call="_call"):
+    """Create a method which calls `function` on the controller through the
+    device's `call` method.
+
+    The method is compiled from source with the argument list of the
+    function, so arguments are bound by the interpreter itself. It is a
+    plain function returning the coroutine of the device's `call` method, so
+    a call only creates a single coroutine. The code is compiled once per
+    argument list, and each method only binds it to its own `function`.
+    """
+    names = tuple(arg.lstrip('*') for arg in function.args)
+    code = _METHOD_CODES.get((names, call))
+    if code is None:
+        source = ("def method(self{params}):\n"
+                  "    return self.{call}(function, ({args}))\n").format(
+            params=''.join(', ' + name for name in names), call=call,
+            args=''.join(name + ', ' for name in names))
+        namespace = {}
+        exec(source, namespace)
+        code = _METHOD_CODES[names, call] = namespace['method'].__code__
+    method = types.FunctionType(code, {'function': function}, function.name)
+    method.__doc__ = function.doc
+    return method
+
+
+def add_functions(cls, specs, call="_call"):
+    """Add a method to `cls` for every (name, args, returns, doc) in specs,
+    calling the function through `cls.<call>(function, args)`.
+    The Functions are also registered in `cls._functions` by name.
+    """
+    if '_functions' not in cls.__dict__:
+        cls._functions = {}
+    for spec in specs:
+        function = Function(*spec)
+        cls._functions[function.name] = function
+        method = api_method(function, call)
+        method.__qualname__ = '.'.join((cls.__name__, function.name))
+        setattr(cls, function.name, method)
+
+
+def element_method(name, output, doc=""):
+    """Create a method calling the controller function `name` of a group,
+    which returns `output`, e.g. "double *", once per element of the group.
+    The method takes the group name and its number of elements, and returns
+    the error code followed by the outputs of every element.
+    """
+    template = name + '(%s,%s)'
+
+    async def method(self, GroupName, nbElement):
+        outputs = ','.join([output] * nbElement)
+        command = (template % (GroupName, outputs)).encode()
+        return prototype_parser(outputs)(*self._split_return(await self._receive(command)))
+    method.__name__ = name
+    method.__doc__ = doc
+    return method
+
+
+def add_element_functions(cls, specs):
+    """Add a method to `cls` for every (name, output, doc) in specs, see
+    `element_method()`."""
+    for name, output, doc in specs:
+        method = element_method(name, output, doc)
+        method.__qualname__ = '.'.join((cls.__name__, name))
+        setattr(cls, name, method)
+
+
+def time_out(future):
+    """Fail `future` with asyncio.TimeoutError unless it is done. Scheduled
+    with loop.call_later(), a timeout costs a single timer handle, while
+    wait_for() also wraps the future in a task and chains callbacks.
+    """
+    if not future.done():
+        future.set_exception(asyncio.TimeoutError())
+
+
+class ControllerProtocol(asyncio.Protocol):
+    """Protocol of a TCP connection to a controller.
+
+    Every command is answered by a return ending with ',EndOfAPI', in the
+    order the commands were sent. Returns are cut out of the receive buffer
+    and handed to the futures of the pending commands in that order.
+    """
+    __slots__ = ["_loop", "_transport", "_buffer", "_waiters", "closed"]
+
+    def __init__(self, loop):
+        self._loop = loop
+        self._transport = None
+        self._buffer = bytearray()
+        self._waiters = deque()
+        # Done once the connection is closed.
+        self.closed = loop.create_future()
+
+    def connection_made(self, transport):
+        self._transport = transport
+
+    def connection_lost(self, exc):
+        self._transport = None
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_exception(ConnectionError("Lost connection to device."))
+        if not self.closed.done():
+            self.closed.set_result(None)
+
+    def data_received(self, data):
+        buffer = self._buffer
+        # A read usually holds exactly one whole return. It is handed over
+        # as is, without being copied into the buffer and out again.
+        if not buffer and data.endswith(b",EndOfAPI") \
+                and data.find(b",EndOfAPI") == len(data) - 9:
+            if self._waiters:
+                waiter = self._waiters.popleft()
+                if not waiter.done():
+                    waiter.set_result(data)
+            return
+        buffer += data
+        start = 0
+        end = buffer.find(b",EndOfAPI")
+        # Returns are copied out of the buffer through a view, as slicing the
+        # bytearray itself would copy them twice. The view must be released
+        # before the buffer is resized.
+        with memoryview(buffer) as view:
+            while end >= 0:
+                end += 9
+                if self._waiters:
+                    waiter = self._waiters.popleft()
+                    if not waiter.done():
+                        waiter.set_result(bytes(view[start:end]))
+                start = end
+                end = buffer.find(b",EndOfAPI", start)
+        if start:
+            del buffer[:start]
+
+    def send(self, command):
+        """Send a command (bytes).
+
+        Returns: a future of the raw return.
+        """
+        if self._transport is None:
+            raise ConnectionError("Lost connection to device.")
+        future = self._loop.create_future()
+        self._waiters.append(future)
+        self._transport.write(command)
+        return future
+
+    def send_many(self, commands):
+        """Send commands (bytes) back-to-back.
+
+        Returns: a list of futures of the raw returns, in order.
+        """
+        if self._transport is None:
+            raise ConnectionError("Lost connection to device.")
+        futures = [self._loop.create_future() for _ in commands]
+        self._waiters.extend(futures)
+        self._transport.writelines(commands)
+        return futures
+
+    def get_extra_info(self, name, default=None):
+        return self._transport.get_extra_info(name, default)
+
+    def close(self):
+        if self._transport is not None:
+            self._transport.close()
+
+
+# Connection pools of the controllers in use, keyed by (host, port).
+_POOLS = {}
+# `closed` futures of the connections of closed pools, keyed by (host, port).
+_CLOSING = {}
+
+
+class ConnectionPool:
+    """Connections to the controller at (host, port), shared by every device
+    connected to it, so a controller driven by several devices is not
+    connected to once per device. Idle connections wait in `queue`.
+
+    The pool keeps `size` connections open. When all of them are busy, up to
+    `burst` more are opened on demand instead of waiting, and closed again
+    once the spike is over.
+
+    Get the pool with `ConnectionPool.acquire()` and give it back with
+    `release()`. The connections are closed once no device uses them, and a
+    new pool of the controller waits for them to be closed before connecting.
+    Take a connection with `queue.get_nowait()`, or `get()` if none is
+    idle, and give it back with `put()`.
+    """
+    __slots__ = ["key", "protocols", "queue", "users", "size", "burst", "_loop",
+                 "_timeout", "_opening", "_ready"]
+
+    def __init__(self, loop, key, size, burst, timeout):
+        self.key = key
+        self.protocols = []
+        self.queue = asyncio.Queue()
+        self.users = 0
+        self.size = size
+        self.burst = burst
+        self._loop = loop
+        self._timeout = timeout
+        # Number of burst connections being opened.
+        self._opening = 0
+        # Result is whether the connections were opened.
+        self._ready = loop.create_future()
+
+    @classmethod
+    async def acquire(cls, loop, host, port, size, timeout, burst=0):
+        """Get the pool of the controller at `host`:`port`, opening `size`
+        connections to it unless it is already connected. The first device
+        to connect sets `size`, `burst` and `timeout`, those of later ones
+        are ignored.
+
+        Raises: asyncio.TimeoutError or the error of a failed connection.
+        """
+        key = (host, port)
+        pool = _POOLS.get(key)
+        if pool is None:
+            pool = _POOLS[key] = cls(loop, key, size, burst, timeout)
+            try:
+                # The controller only accepts a limited number of sockets,
+                # wait for the ones of a closed pool to go first.
+                closing = [closed for closed in _CLOSING.pop(key, ()) if not closed.done()]
+                if closing:
+                    await asyncio.wait(closing, timeout=timeout)
+                for i in range(size):
+                    pool.queue.put_nowait(await pool._open())
+            except BaseException:
+                pool.close()
+                pool._ready.set_result(False)
+                raise
+            pool._ready.set_result(True)
+        elif not await asyncio.shield(pool._ready):
+            raise ConnectionError("Failed to connect to {0}:{1}".format(host, port))
+        pool.users += 1
+        return pool
+
+    async def _open(self):
+        """Open one more connection to the controller."""
+        host, port = self.key
+        _, protocol = await asyncio.wait_for(self._loop.create_connection(
+            lambda: ControllerProtocol(self._loop), host, port), timeout=self._timeout)
+        # Commands are small and answered one by one, do not let Nagle's
+        # algorithm hold them back.
+        sock = protocol.get_extra_info('socket')
+        if sock is not None:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.protocols.append(protocol)
+        return protocol
+
+    async def get(self):
+        """Take a connection when none is idle. A burst connection is opened
+        if fewer than `size + burst` are open, otherwise this waits for a
+        connection to be given back.
+        """
+        if len(self.protocols) + self._opening < self.size + self.burst:
+            self._opening += 1
+            try:
+                return await self._open()
+            except (OSError, asyncio.TimeoutError):
+                # The controller may refuse more sockets, wait for one instead.
+                pass
+            finally:
+                self._opening -= 1
+        return await self.queue.get()
+
+    def put(self, protocol):
+        """Give back a connection. Connections beyond `size` are closed
+        instead once other connections are idle again, and all are closed
+        once the pool is."""
+        if self.users <= 0 or (len(self.protocols) > self.size and not self.queue.empty()):
+            self.discard(protocol)
+        else:
+            self.queue.put_nowait(protocol)
+
+    def discard(self, protocol):
+        """Close a taken connection, e.g. after it failed."""
+        protocol.close()
+        if protocol in self.protocols:
+            self.protocols.remove(protocol)
+
+    def release(self):
+        """Give back the pool, closing it if no other device uses it."""
+        self.users -= 1
+        if self.users <= 0:
+            self.close()
+
+    def close(self):
+        """Close all connections of the pool."""
+        if _POOLS.get(self.key) is self:
+            del _POOLS[self.key]
+        if self.protocols:
+            _CLOSING[self.key] = [closed for closed in _CLOSING.get(self.key, ())
+                                  if not closed.done()]
+            _CLOSING[self.key].extend(protocol.closed for protocol in self.protocols)
+        for protocol in self.protocols:
+            protocol.close()
+        self.protocols.clear()
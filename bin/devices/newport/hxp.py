@@ -7,28 +7,51 @@
 # Modified to use asyncio
 
 import asyncio
-from asyncio import wait_for, ensure_future
+from asyncio import ensure_future
 from concurrent.futures import CancelledError
 
-from . import Device, DeviceError, StreamReadWriter
+from . import Device, DeviceError
+from .common import (ConnectionPool, ControllerError, add_element_functions, add_functions,
+                     prototype_parser, time_out)
+
+# Minimum seconds between warnings about bad replies to `HXP._query()`.
+_QUERY_ERROR_INTERVAL = 10
+# Number of polls without any change after which `HXP._query()` slows down
+# to its idle interval.
+_IDLE_POLLS = 5
 
 
 class HXP(Device):
     """Smartlink device for HXP Hexapod Motion Controller"""
-    def __init__(self, name="HXP", interval=0.2, loop=None, queue_size=10):
-        """group_names is a list of group names (eg. Group1) currently in use."""
+    def __init__(self, name="HXP", interval=0.2, loop=None, queue_size=10,
+            burst_size=10, idle_interval=2, max_age=0.05):
+        """Status is polled every `interval` seconds, or every `idle_interval`
+        seconds while nothing changes. Group positions and status read less
+        than `max_age` seconds ago are not read again, unless a command was
+        sent since."""
         super().__init__(name)
         self._loop = loop or asyncio.get_event_loop()
         self._queue_size = queue_size
+        self._burst_size = burst_size
         self._timeout = 60
 
         self._connected = False
-        self._readwriters = []
-        self._queue = asyncio.Queue()
+        self._pool = None
+        self._cache = {}
+        # Shared reads in flight and recent returns of them, see `_receive()`.
+        self._inflight = {}
+        self._max_age = max_age
+        self._recent = {}
+        # Number of commands sent which may move the hexapod, a read started
+        # before one of them is not kept in `_recent`.
+        self._commands_sent = 0
 
         # XPS-Q8 states
         self._interval = interval
+        self._idle_interval = idle_interval
         self._query_task = None
+        # Set to wake `_query()` from idle polling, eg. when a move starts.
+        self._poll_event = asyncio.Event()
         self._comp_amount = 0.01
         self._backlash = False
         self._group_names = ["HEXAPOD.1", "HEXAPOD.2", "HEXAPOD.3", "HEXAPOD.4", "HEXAPOD.5", "HEXAPOD.6"]
@@ -37,8 +60,15 @@ class HXP(Device):
         # X, Y, Z, U, V, W
         self._work_group_names = ["HEXAPOD.X", "HEXAPOD.Y", "HEXAPOD.Z", "HEXAPOD.U", "HEXAPOD.V", "HEXAPOD.W"]
         self._work_names = ['X', 'Y', 'Z', 'U', 'V', 'W']
+        # Commands reading the positions of the work groups.
+        self._work_position_commands = [b'GroupPositionCurrentGet(%s,double *)' % name.encode()
+                                        for name in self._work_group_names]
         self._work_status = [0] * self._group_num
         self._work_positions = [0] * self._group_num
+        # Loop time `_work_positions` were last read at.
+        self._work_positions_time = float('-inf')
+        # Loop time `_query()` last warned about a bad reply at.
+        self._query_error_time = float('-inf')
 
         self._init_smartlink()
 
@@ -62,8 +92,6 @@ class HXP(Device):
                 lambda pos, i=i: self.absolute_move(i, pos), grp=group_name)
             self.add_command("Relative move", "float",
                 lambda pos, i=i: self.relative_move(i, pos), grp=group_name)
-            self.add_command("Relative move", "float",
-                lambda pos, i=i: self.relative_move(i, pos), grp=group_name)
 
     def set_backlash(self, backlash):
         """Enable/disable backlash compensation."""
@@ -73,48 +101,307 @@ class HXP(Device):
         self._comp_amount = amount
 
     async def _sendAndReceive(self, command):
-        """Send command and get return."""
+        """Send command and get return. command can be str or bytes."""
+        error, returnedBytes = self._split_return(await self._receive(command))
+        return (error, returnedBytes.decode())
+
+    # Prefixes of the commands reading values that are polled, eg. by
+    # `_query()` and a client at once. An identical read already in flight
+    # is not sent again, its return is shared instead, unless a command which
+    # may have moved the hexapod was sent or answered since it started.
+    _SHARED = (
+        b'ElapsedTimeGet(',
+        b'GatheringCurrentNumberGet(',
+        b'GPIOAnalogGet(',
+        b'GPIODigitalGet(',
+        b'GroupPositionCurrentGet(',
+        b'GroupPositionSetpointGet(',
+        b'GroupPositionTargetGet(',
+        b'GroupStatusGet(',
+    )
+    # Suffixes of the names of the functions which only read values, like
+    # ErrorStringGet or PositionerErrorRead. Any other command may move the
+    # hexapod, see `_may_move()`.
+    _READS = (b'Get', b'Read')
+    # Prefixes of the shared reads whose values only change with the motion
+    # commands. The return of one done within `_max_age` is shared as well,
+    # under the same condition.
+    _RECENT = (
+        b'GroupPositionCurrentGet(',
+        b'GroupStatusGet(',
+    )
+
+    async def _receive(self, command):
+        """Send command (str or bytes) and get the raw return."""
+        if not self._connected:
+            self._log_error("Not connected.")
+            raise DeviceError
+
+        if type(command) is str:
+            command = command.encode()
+        if command.startswith(self._SHARED):
+            recent = self._recent.get(command)
+            if recent is not None and self._loop.time() < recent[0]:
+                return recent[1]
+            inflight = self._inflight.get(command)
+            if inflight is not None and inflight[2] == self._commands_sent:
+                task, index = inflight[:2]
+            else:
+                task, index = self._share([command]), 0
+            # Shielded, so a cancelled caller does not fail the others.
+            return (await asyncio.shield(task))[index]
+        # Forget the reads from before a command which may move the hexapod,
+        # and again once it is done, as moves only return when they end.
+        # Wake `_query()` both times to follow the move.
+        may_move = self._may_move(command)
+        if may_move:
+            self._forget_reads()
+            self._poll_event.set()
+        try:
+            # Take an idle connection without suspending if there is one.
+            pool = self._pool
+            try:
+                protocol = pool.queue.get_nowait()
+            except asyncio.QueueEmpty:
+                protocol = await pool.get()
+            try:
+                future = protocol.send(command)
+                timer = self._loop.call_later(self._timeout, time_out, future)
+                try:
+                    ret = await future
+                finally:
+                    timer.cancel()
+            except asyncio.TimeoutError:
+                self._log_error("Read timeout.")
+                pool.discard(protocol)
+                self.close_connection()
+                raise DeviceError
+            except ConnectionError:
+                self._log_error("Lost connection to device.")
+                pool.discard(protocol)
+                self.close_connection()
+                raise DeviceError
+            pool.put(protocol)
+            return ret
+        finally:
+            if may_move:
+                self._forget_reads()
+                self._poll_event.set()
+
+    async def _exchange(self, commands):
+        """Send commands (bytes) back-to-back on one connection.
+
+        Returns: a list of the raw returns, in order.
+        """
         if not self._connected:
             self._log_error("Not connected.")
             raise DeviceError
 
-        readwriter = await self._queue.get()
+        pool = self._pool
         try:
-            readwriter.write(command.encode())
-            ret = await wait_for(readwriter.readuntil(b",EndOfAPI"), timeout=self._timeout)
+            protocol = pool.queue.get_nowait()
+        except asyncio.QueueEmpty:
+            protocol = await pool.get()
+        try:
+            future = asyncio.gather(*protocol.send_many(commands))
+            timer = self._loop.call_later(self._timeout, time_out, future)
+            try:
+                rets = await future
+            finally:
+                timer.cancel()
         except asyncio.TimeoutError:
             self._log_error("Read timeout.")
+            pool.discard(protocol)
             self.close_connection()
             raise DeviceError
-        except asyncio.IncompleteReadError:
+        except ConnectionError:
             self._log_error("Lost connection to device.")
+            pool.discard(protocol)
             self.close_connection()
             raise DeviceError
-        except asyncio.LimitOverrunError:
-            self._log_error("Read buffer overrun.")
-            self.close_connection()
-            raise DeviceError
-        self._queue.put_nowait(readwriter)
-
-        ret = ret[:-9]
-        error, returnedString = ret.split(b',', 1)
+        pool.put(protocol)
+        return rets
+
+    def _share(self, commands):
+        """Exchange `commands` in a task, sharing their returns with the
+        `_receive()` of identical commands until it is done.
+
+        Returns: the task.
+        """
+        task = ensure_future(self._exchange(commands))
+        inflight = self._inflight
+        commands_sent = self._commands_sent
+        for index, command in enumerate(commands):
+            inflight[command] = (task, index, commands_sent)
+
+        def done(task):
+            for command in commands:
+                if inflight.get(command, (None,))[0] is task:
+                    del inflight[command]
+            # Retrieve the error, it has been raised to the callers if any.
+            if task.cancelled() or task.exception() is not None:
+                return
+            if self._max_age and self._commands_sent == commands_sent:
+                expires = self._loop.time() + self._max_age
+                for command, ret in zip(commands, task.result()):
+                    if command.startswith(self._RECENT):
+                        self._recent[command] = (expires, ret)
+        task.add_done_callback(done)
+        return task
+
+    def _may_move(self, command):
+        """Whether `command` (bytes) may move the hexapod, which is the case
+        unless it calls a function only reading values."""
+        return not command[:command.find(b'(')].endswith(self._READS)
+
+    def _forget_reads(self):
+        """Stop answering reads from `_recent` or joining the shared reads in
+        flight, before and after a command which may change the values
+        read."""
+        self._commands_sent += 1
+        if self._recent:
+            self._recent.clear()
+
+    def _split_return(self, ret, log=True):
+        """Split a raw return into error code and returned bytes. A nonzero
+        error code is logged, unless `log` is false, and raised."""
+        # Successful returns are by far the most common, take them with a
+        # prefix test and a single slice.
+        if ret.startswith(b'0,'):
+            return (0, ret[2:-9])
+        error, _, returnedBytes = ret[:-9].partition(b',')
         error = int(error)
-        if error != 0:
-            self._log_error("Device returned error code: {0}".format(str(error)))
-            raise DeviceError
-        return (error, returnedString.decode())
+        if error:
+            if log:
+                self._log_error("Device returned error code: {0}".format(str(error)))
+            raise ControllerError(error)
+        return (error, returnedBytes)
+
+    async def _call(self, function, args):
+        """Call the controller `function` with `args` and parse its outputs."""
+        return function.parse(*self._split_return(await self._receive(function.format(args))))
+
+    # Functions whose returns are cached by `_cached_call()`, mapped to the
+    # time to live of a cached return in seconds. None means it is kept until
+    # the connection is closed, as the return never changes in between.
+    _CACHE_TTL = {
+        "ErrorStringGet": None,
+        "FirmwareVersionGet": None,
+    }
+
+    async def _cached_call(self, function, args):
+        """Like `_call()`, but reuse the return of an earlier call with the
+        same arguments while it is younger than its `_CACHE_TTL`."""
+        key = (function.name, args)
+        now = self._loop.time()
+        cached = self._cache.get(key)
+        if cached is not None and (cached[0] is None or now < cached[0]):
+            return cached[1]
+        ret = await self._call(function, args)
+        ttl = self._CACHE_TTL[function.name]
+        self._cache[key] = (None if ttl is None else now + ttl, ret)
+        return ret
+
+    async def call_many(self, calls):
+        """Call several generated functions in a single round trip. `calls`
+        is a sequence of (name, args) pairs, e.g.
+        [("GroupStatusGet", ["HEXAPOD"]), ("PositionerErrorRead", ["HEXAPOD.1"])].
+
+        Returns: a list of the parsed returns, in the order of `calls`.
+        """
+        functions = [self._functions[name] for name, _ in calls]
+        commands = [function.format(tuple(args))
+                    for function, (_, args) in zip(functions, calls)]
+        may_move = any(map(self._may_move, commands))
+        if may_move:
+            self._forget_reads()
+            self._poll_event.set()
+        try:
+            rets = await self._exchange(commands)
+        finally:
+            if may_move:
+                self._forget_reads()
+                self._poll_event.set()
+        return [function.parse(*self._split_return(ret))
+                for function, ret in zip(functions, rets)]
+
+    async def read_errors(self, positioner_names=None):
+        """Read the errors of `positioner_names` (default: the six hexapod
+        actuators) and the status of the hexapod group in a single round trip.
+
+        Returns: a dict mapping "HEXAPOD" and every positioner name to its
+        parsed return.
+        """
+        if positioner_names is None:
+            positioner_names = self._group_names
+        calls = [("GroupStatusGet", ["HEXAPOD"])]
+        calls += [("PositionerErrorRead", [name]) for name in positioner_names]
+        rets = await self.call_many(calls)
+        return dict(zip(["HEXAPOD"] + list(positioner_names), rets))
 
     async def _query(self):
-        """Periodically query group position and status."""
+        """Periodically query group position and status.
+
+        The status and position of all groups are pipelined in one round trip,
+        which is shared with clients reading them meanwhile. After _IDLE_POLLS
+        rounds without any change, the hexapod is idle and is only polled every
+        `_idle_interval` or when `_poll_event` is set.
+        """
+        commands = []
+        for group_name, position_command in zip(self._work_group_names,
+                                                self._work_position_commands):
+            commands.append(b'GroupStatusGet(%s,int *)' % group_name.encode())
+            commands.append(position_command)
+        # The lists are only ever updated in place, bind them and the
+        # methods called every round once.
+        work_status, work_positions = self._work_status, self._work_positions
+        split_return, share, shield = self._split_return, self._share, asyncio.shield
+        time, sleep = self._loop.time, asyncio.sleep
+        poll_event = self._poll_event
+        idle = 0
         try:
             while True:
-                for i in range(self._group_num):
-                    group_name = self._work_group_names[i]
-                    status = await self.GroupStatusGet(group_name)
-                    self._work_status[i] = int(status[1])
-                    position = await self.GroupPositionCurrentGet(group_name, 1)
-                    self._work_positions[i] = float(position[1])
-                await asyncio.sleep(self._interval)
+                rets = iter(await shield(share(commands)))
+                changed = poll_event.is_set()
+                poll_event.clear()
+                # A bad reply leaves the connection and the other replies
+                # usable, the value it was for keeps its old value.
+                error = None
+                positions_read = True
+                for i, (status, position) in enumerate(zip(rets, rets)):
+                    # Each reply holds a single value, take it straight out
+                    # of successful ones.
+                    try:
+                        status = int(status[2:-9] if status.startswith(b'0,')
+                                     else split_return(status, False)[1])
+                    except (ValueError, ControllerError) as e:
+                        error, status = e, work_status[i]
+                    try:
+                        position = float(position[2:-9] if position.startswith(b'0,')
+                                         else split_return(position, False)[1])
+                    except (ValueError, ControllerError) as e:
+                        error, position = e, work_positions[i]
+                        positions_read = False
+                    if status != work_status[i] or position != work_positions[i]:
+                        work_status[i], work_positions[i] = status, position
+                        changed = True
+                if positions_read:
+                    self._work_positions_time = time()
+                if error is not None:
+                    # Keep polling, but warn at most every
+                    # _QUERY_ERROR_INTERVAL seconds.
+                    now = time()
+                    if now - self._query_error_time > _QUERY_ERROR_INTERVAL:
+                        self._log_warning("Failed to read device status: {0!r}".format(error))
+                        self._query_error_time = now
+                idle = 0 if changed else idle + 1
+                if idle < _IDLE_POLLS:
+                    await sleep(self._interval)
+                else:
+                    try:
+                        await asyncio.wait_for(poll_event.wait(), self._idle_interval)
+                    except asyncio.TimeoutError:
+                        pass
         except CancelledError:
             return
         except Exception:
@@ -142,54 +429,75 @@ class HXP(Device):
         await asyncio.gather(
             *[self.GroupKill(group_name) for group_name in self._group_names])
 
+    async def _read_work_positions(self):
+        """Read the positions of all work groups again, unless `_query()`
+        read them within the last interval.
+
+        Returns: `_work_positions`.
+        """
+        if self._loop.time() - self._work_positions_time > self._interval:
+            rets = await self._exchange(self._work_position_commands)
+            for i, ret in enumerate(rets):
+                self._work_positions[i] = float(self._split_return(ret)[1])
+            self._work_positions_time = self._loop.time()
+        return self._work_positions
+
     async def absolute_move(self, i, pos):
-        cmd = self._work_positions
-        if not self._backlash:
-            cmd[i] = pos
-            str_cmd = [str(ax) for ax in cmd]
-            await self.HexapodMoveAbsolute("HEXAPOD", "Work", *str_cmd)
-        else:
-            current_pos = self._work_positions[i]
-            if pos - current_pos < self._comp_amount:
-                cmd[i] = pos - self._comp_amount
-                str_cmd = [str(ax) for ax in cmd]
-                await self.HexapodMoveAbsolute("HEXAPOD", "Work", *str_cmd)
+        cmd = await self._read_work_positions()
+        try:
+            if not self._backlash:
                 cmd[i] = pos
                 str_cmd = [str(ax) for ax in cmd]
                 await self.HexapodMoveAbsolute("HEXAPOD", "Work", *str_cmd)
             else:
-                cmd[i] = pos
-                str_cmd = [str(ax) for ax in cmd]
-                await self.HexapodMoveAbsolute("HEXAPOD", "Work", *str_cmd)
+                current_pos = self._work_positions[i]
+                if pos - current_pos < self._comp_amount:
+                    cmd[i] = pos - self._comp_amount
+                    str_cmd = [str(ax) for ax in cmd]
+                    await self.HexapodMoveAbsolute("HEXAPOD", "Work", *str_cmd)
+                    cmd[i] = pos
+                    str_cmd = [str(ax) for ax in cmd]
+                    await self.HexapodMoveAbsolute("HEXAPOD", "Work", *str_cmd)
+                else:
+                    cmd[i] = pos
+                    str_cmd = [str(ax) for ax in cmd]
+                    await self.HexapodMoveAbsolute("HEXAPOD", "Work", *str_cmd)
+        finally:
+            # The move changed the positions, read them again next time.
+            self._work_positions_time = float('-inf')
 
     async def relative_move(self, i, pos):
         cmd = [0] * 6
-        if not self._backlash:
-            cmd[i] = pos
-            str_cmd = [str(ax) for ax in cmd]
-            await self.HexapodMoveIncremental("HEXAPOD", "Work", *str_cmd)
-        else:
-            if pos < self._comp_amount:
-                cmd[i] = pos - self._comp_amount
-                str_cmd = [str(ax) for ax in cmd]
-                await self.HexapodMoveIncremental("HEXAPOD", "Work", *str_cmd)
-                cmd[i] = self._comp_amount
-                str_cmd = [str(ax) for ax in cmd]
-                await self.HexapodMoveIncremental("HEXAPOD", "Work", *str_cmd)
-            else:
+        try:
+            if not self._backlash:
                 cmd[i] = pos
                 str_cmd = [str(ax) for ax in cmd]
                 await self.HexapodMoveIncremental("HEXAPOD", "Work", *str_cmd)
+            else:
+                if pos < self._comp_amount:
+                    cmd[i] = pos - self._comp_amount
+                    str_cmd = [str(ax) for ax in cmd]
+                    await self.HexapodMoveIncremental("HEXAPOD", "Work", *str_cmd)
+                    cmd[i] = self._comp_amount
+                    str_cmd = [str(ax) for ax in cmd]
+                    await self.HexapodMoveIncremental("HEXAPOD", "Work", *str_cmd)
+                else:
+                    cmd[i] = pos
+                    str_cmd = [str(ax) for ax in cmd]
+                    await self.HexapodMoveIncremental("HEXAPOD", "Work", *str_cmd)
+        finally:
+            # The move changed the positions, read them again next time.
+            self._work_positions_time = float('-inf')
 
     async def open_connection(self, IP, port):
         if self._connected:
             self._log_warning("Already connected.")
             return
+        # Devices of the same controller share its connections.
         try:
-            for i in range(self._queue_size):
-                readwriter = StreamReadWriter(*await wait_for(asyncio.open_connection(IP, port), timeout=self._timeout))
-                self._readwriters.append(readwriter)
-                self._queue.put_nowait(readwriter)
+            self._pool = await ConnectionPool.acquire(
+                self._loop, IP, port, self._queue_size, self._timeout,
+                self._burst_size)
         except asyncio.TimeoutError:
             self._log_error("Connection timeout.")
             self.close_connection()
@@ -198,6 +506,11 @@ class HXP(Device):
             self._log_exception("Failed to connect to {host}:{port}".format(host=IP, port=port))
             self.close_connection()
             raise DeviceError
+        if (self._pool.size, self._pool.burst) != (self._queue_size, self._burst_size):
+            self._log_warning(
+                "Sharing the connections to {host}:{port} of another device, with "
+                "queue_size={size} and burst_size={burst}.".format(
+                    host=IP, port=port, size=self._pool.size, burst=self._pool.burst))
         self._connected = True
         await self.init_device()
 
@@ -210,1560 +523,443 @@ class HXP(Device):
         if self._query_task is not None:
             self._query_task.cancel()
             self._query_task = None
-        for readwriter in self._readwriters:
-            readwriter.close()
-        self._readwriters.clear()
-        self._queue = asyncio.Queue()
+        if self._pool is not None:
+            self._pool.release()
+            self._pool = None
+        self._cache.clear()
+        self._forget_reads()
 
     # GetLibraryVersion
     async def GetLibraryVersion(self):
         return ['HXP Firmware V2.1.x']
 
-    # ControllerMotionKernelTimeLoadGet :  Get controller motion kernel time
-    # load
-    async def ControllerMotionKernelTimeLoadGet(self):
-        command = 'ControllerMotionKernelTimeLoadGet(double *,double *,double *,double *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        if (error != 0):
-            return (error, returnedString)
-
-        i, j, retList = 0, 0, [error]
-        for paramNb in range(4):
-            while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-                j += 1
-            retList.append(eval(returnedString[i:i + j]))
-            i, j = i + j + 1, 0
-
-        return retList
-
-    # ElapsedTimeGet :  Return elapsed time from controller power on
-    async def ElapsedTimeGet(self):
-        command = 'ElapsedTimeGet(double *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        if (error != 0):
-            return (error, returnedString)
-
-        i, j, retList = 0, 0, [error]
-        while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-            j += 1
-        retList.append(eval(returnedString[i:i + j]))
-
-        return retList
-
-    # ErrorStringGet :  Return the error string corresponding to the error code
-    async def ErrorStringGet(self, ErrorCode):
-        command = 'ErrorStringGet(' + str(ErrorCode) + ',char *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # FirmwareVersionGet :  Return firmware version
-    async def FirmwareVersionGet(self):
-        command = 'FirmwareVersionGet(char *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # TCLScriptExecute :  Execute a TCL script from a TCL file
-    async def TCLScriptExecute(self, TCLFileName, TaskName, ParametersList):
-        command = 'TCLScriptExecute(' + TCLFileName + \
-            ',' + TaskName + ',' + ParametersList + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # TCLScriptExecuteAndWait :  Execute a TCL script from a TCL file and wait
-    # the end of execution to return
-    async def TCLScriptExecuteAndWait(self, TCLFileName, TaskName, InputParametersList):
-        command = 'TCLScriptExecuteAndWait(' + TCLFileName + \
-            ',' + TaskName + ',' + InputParametersList + ',char *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # TCLScriptKill :  Kill TCL Task
-    async def TCLScriptKill(self, TaskName):
-        command = 'TCLScriptKill(' + TaskName + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # TCLScriptKillAll :  Kill all TCL Tasks
-    async def TCLScriptKillAll(self):
-        command = 'TCLScriptKillAll()'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # TimerGet :  Get a timer
-    async def TimerGet(self, TimerName):
-        command = 'TimerGet(' + TimerName + ',int *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        if (error != 0):
-            return (error, returnedString)
-
-        i, j, retList = 0, 0, [error]
-        while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-            j += 1
-        retList.append(eval(returnedString[i:i + j]))
-
-        return retList
-
-    # TimerSet :  Set a timer
-    async def TimerSet(self, TimerName, FrequencyTicks):
-        command = 'TimerSet(' + TimerName + ',' + str(FrequencyTicks) + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # Reboot :  Reboot the controller
-    async def Reboot(self):
-        command = 'Reboot()'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # Login :  Log in
-    async def Login(self, Name, Password):
-        command = 'Login(' + Name + ',' + Password + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # CloseAllOtherSockets :  Close all socket beside the one used to send
-    # this command
-    async def CloseAllOtherSockets(self):
-        command = 'CloseAllOtherSockets()'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # EventAdd :  ** OBSOLETE ** Add an event
-    async def EventAdd(self, PositionerName, EventName, EventParameter, ActionName, ActionParameter1, ActionParameter2, ActionParameter3):
-        command = 'EventAdd(' + PositionerName + ',' + EventName + ',' + EventParameter + ',' + \
-            ActionName + ',' + ActionParameter1 + ',' + \
-            ActionParameter2 + ',' + ActionParameter3 + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # EventGet :  ** OBSOLETE ** Read events and actions list
-    async def EventGet(self, PositionerName):
-        command = 'EventGet(' + PositionerName + ',char *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # EventRemove :  ** OBSOLETE ** Delete an event
-    async def EventRemove(self, PositionerName, EventName, EventParameter):
-        command = 'EventRemove(' + PositionerName + ',' + \
-            EventName + ',' + EventParameter + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # EventWait :  ** OBSOLETE ** Wait an event
-    async def EventWait(self, PositionerName, EventName, EventParameter):
-        command = 'EventWait(' + PositionerName + ',' + \
-            EventName + ',' + EventParameter + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
     # EventExtendedConfigurationTriggerSet :  Configure one or several events
     async def EventExtendedConfigurationTriggerSet(self, ExtendedEventName, EventParameter1, EventParameter2, EventParameter3, EventParameter4):
-        command = 'EventExtendedConfigurationTriggerSet('
-        for i in range(len(ExtendedEventName)):
-            if (i > 0):
-                command += ','
-            command += ExtendedEventName[i] + ',' + EventParameter1[i] + ',' + \
-                EventParameter2[i] + ',' + \
-                EventParameter3[i] + ',' + EventParameter4[i]
-        command += ')'
-
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # EventExtendedConfigurationTriggerGet :  Read the event configuration
-    async def EventExtendedConfigurationTriggerGet(self):
-        command = 'EventExtendedConfigurationTriggerGet(char *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
+        command = 'EventExtendedConfigurationTriggerSet(%s)' % ','.join(
+            [','.join(map(str, event)) for event in zip(
+                ExtendedEventName, EventParameter1, EventParameter2, EventParameter3,
+                EventParameter4)])
+        return await self._sendAndReceive(command)
 
     # EventExtendedConfigurationActionSet :  Configure one or several actions
     async def EventExtendedConfigurationActionSet(self, ExtendedActionName, ActionParameter1, ActionParameter2, ActionParameter3, ActionParameter4):
-        command = 'EventExtendedConfigurationActionSet('
-        for i in range(len(ExtendedActionName)):
-            if (i > 0):
-                command += ','
-            command += ExtendedActionName[i] + ',' + ActionParameter1[i] + ',' + \
-                ActionParameter2[i] + ',' + \
-                ActionParameter3[i] + ',' + ActionParameter4[i]
-        command += ')'
-
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # EventExtendedConfigurationActionGet :  Read the action configuration
-    async def EventExtendedConfigurationActionGet(self):
-        command = 'EventExtendedConfigurationActionGet(char *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # EventExtendedStart :  Launch the last event and action configuration and
-    # return an ID
-    async def EventExtendedStart(self):
-        command = 'EventExtendedStart(int *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        if (error != 0):
-            return (error, returnedString)
-
-        i, j, retList = 0, 0, [error]
-        while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-            j += 1
-        retList.append(eval(returnedString[i:i + j]))
-
-        return retList
-
-    # EventExtendedAllGet :  Read all event and action configurations
-    async def EventExtendedAllGet(self):
-        command = 'EventExtendedAllGet(char *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # EventExtendedGet :  Read the event and action configuration defined by ID
-    async def EventExtendedGet(self, ID):
-        command = 'EventExtendedGet(' + str(ID) + ',char *,char *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # EventExtendedRemove :  Remove the event and action configuration defined
-    # by ID
-    async def EventExtendedRemove(self, ID):
-        command = 'EventExtendedRemove(' + str(ID) + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # EventExtendedWait :  Wait events from the last event configuration
-    async def EventExtendedWait(self):
-        command = 'EventExtendedWait()'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # GatheringConfigurationGet :  Read different mnemonique type
-    async def GatheringConfigurationGet(self):
-        command = 'GatheringConfigurationGet(char *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # GatheringConfigurationSet :  Configuration acquisition
-    async def GatheringConfigurationSet(self, Type):
-        command = 'GatheringConfigurationSet('
-        for i in range(len(Type)):
-            if (i > 0):
-                command += ','
-            command += Type[i]
-        command += ')'
-
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # GatheringCurrentNumberGet :  Maximum number of samples and current
-    # number during acquisition
-    async def GatheringCurrentNumberGet(self):
-        command = 'GatheringCurrentNumberGet(int *,int *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        if (error != 0):
-            return (error, returnedString)
-
-        i, j, retList = 0, 0, [error]
-        for paramNb in range(2):
-            while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-                j += 1
-            retList.append(eval(returnedString[i:i + j]))
-            i, j = i + j + 1, 0
-
-        return retList
-
-    # GatheringStopAndSave :  Stop acquisition and save data
-    async def GatheringStopAndSave(self):
-        command = 'GatheringStopAndSave()'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # GatheringDataAcquire :  Acquire a configured data
-    async def GatheringDataAcquire(self):
-        command = 'GatheringDataAcquire()'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # GatheringDataGet :  Get a data line from gathering buffer
-    async def GatheringDataGet(self, IndexPoint):
-        command = 'GatheringDataGet(' + str(IndexPoint) + ',char *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # GatheringReset :  Empty the gathered data in memory to start new
-    # gathering from scratch
-    async def GatheringReset(self):
-        command = 'GatheringReset()'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # GatheringRun :  Start a new gathering
-    async def GatheringRun(self, DataNumber, Divisor):
-        command = 'GatheringRun(' + str(DataNumber) + ',' + str(Divisor) + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # GatheringStop :  Stop the data gathering (without saving to file)
-    async def GatheringStop(self):
-        command = 'GatheringStop()'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # GatheringExternalConfigurationSet :  Configuration acquisition
-    async def GatheringExternalConfigurationSet(self, Type):
-        command = 'GatheringExternalConfigurationSet('
-        for i in range(len(Type)):
-            if (i > 0):
-                command += ','
-            command += Type[i]
-        command += ')'
-
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # GatheringExternalConfigurationGet :  Read different mnemonique type
-    async def GatheringExternalConfigurationGet(self):
-        command = 'GatheringExternalConfigurationGet(char *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # GatheringExternalCurrentNumberGet :  Maximum number of samples and
-    # current number during acquisition
-    async def GatheringExternalCurrentNumberGet(self):
-        command = 'GatheringExternalCurrentNumberGet(int *,int *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        if (error != 0):
-            return (error, returnedString)
-
-        i, j, retList = 0, 0, [error]
-        for paramNb in range(2):
-            while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-                j += 1
-            retList.append(eval(returnedString[i:i + j]))
-            i, j = i + j + 1, 0
-
-        return retList
-
-    # GatheringExternalStopAndSave :  Stop acquisition and save data
-    async def GatheringExternalStopAndSave(self):
-        command = 'GatheringExternalStopAndSave()'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # GlobalArrayGet :  Get global array value
-    async def GlobalArrayGet(self, Number):
-        command = 'GlobalArrayGet(' + str(Number) + ',char *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # GlobalArraySet :  Set global array value
-    async def GlobalArraySet(self, Number, ValueString):
-        command = 'GlobalArraySet(' + str(Number) + ',' + ValueString + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # DoubleGlobalArrayGet :  Get double global array value
-    async def DoubleGlobalArrayGet(self, Number):
-        command = 'DoubleGlobalArrayGet(' + str(Number) + ',double *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        if (error != 0):
-            return (error, returnedString)
-
-        i, j, retList = 0, 0, [error]
-        while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-            j += 1
-        retList.append(eval(returnedString[i:i + j]))
-
-        return retList
-
-    # DoubleGlobalArraySet :  Set double global array value
-    async def DoubleGlobalArraySet(self, Number, DoubleValue):
-        command = 'DoubleGlobalArraySet(' + \
-            str(Number) + ',' + str(DoubleValue) + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
+        command = 'EventExtendedConfigurationActionSet(%s)' % ','.join(
+            [','.join(map(str, action)) for action in zip(
+                ExtendedActionName, ActionParameter1, ActionParameter2, ActionParameter3,
+                ActionParameter4)])
+        return await self._sendAndReceive(command)
 
     # GPIOAnalogGet :  Read analog input or analog output for one or few input
     async def GPIOAnalogGet(self, GPIOName):
-        command = 'GPIOAnalogGet('
-        for i in range(len(GPIOName)):
-            if (i > 0):
-                command += ','
-            command += GPIOName[i] + ',' + 'double *'
-        command += ')'
-
-        (error, returnedString) = await self._sendAndReceive(command)
-        if (error != 0):
-            return (error, returnedString)
-
-        i, j, retList = 0, 0, [error]
-        for paramNb in range(len(GPIOName)):
-            while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-                j += 1
-            retList.append(eval(returnedString[i:i + j]))
-            i, j = i + j + 1, 0
-
-        return retList
+        command = b'GPIOAnalogGet(%s)' % b','.join([name.encode() + b',double *'
+                                                     for name in GPIOName])
+        outputs = ','.join(['double *'] * len(GPIOName))
+        return prototype_parser(outputs)(*self._split_return(await self._receive(command)))
 
     # GPIOAnalogSet :  Set analog output for one or few output
     async def GPIOAnalogSet(self, GPIOName, AnalogOutputValue):
-        command = 'GPIOAnalogSet('
-        for i in range(len(GPIOName)):
-            if (i > 0):
-                command += ','
-            command += GPIOName[i] + ',' + str(AnalogOutputValue[i])
-        command += ')'
-
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
+        command = 'GPIOAnalogSet(%s)' % ','.join(
+            ['%s,%s' % output for output in zip(GPIOName, AnalogOutputValue)])
+        return await self._sendAndReceive(command)
 
     # GPIOAnalogGainGet :  Read analog input gain (1, 2, 4 or 8) for one or
     # few input
     async def GPIOAnalogGainGet(self, GPIOName):
-        command = 'GPIOAnalogGainGet('
-        for i in range(len(GPIOName)):
-            if (i > 0):
-                command += ','
-            command += GPIOName[i] + ',' + 'int *'
-        command += ')'
-
-        (error, returnedString) = await self._sendAndReceive(command)
-        if (error != 0):
-            return (error, returnedString)
-
-        i, j, retList = 0, 0, [error]
-        for paramNb in range(len(GPIOName)):
-            while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-                j += 1
-            retList.append(eval(returnedString[i:i + j]))
-            i, j = i + j + 1, 0
-
-        return retList
+        command = b'GPIOAnalogGainGet(%s)' % b','.join([name.encode() + b',int *'
+                                                         for name in GPIOName])
+        outputs = ','.join(['int *'] * len(GPIOName))
+        return prototype_parser(outputs)(*self._split_return(await self._receive(command)))
 
     # GPIOAnalogGainSet :  Set analog input gain (1, 2, 4 or 8) for one or few
     # input
     async def GPIOAnalogGainSet(self, GPIOName, AnalogInputGainValue):
-        command = 'GPIOAnalogGainSet('
-        for i in range(len(GPIOName)):
-            if (i > 0):
-                command += ','
-            command += GPIOName[i] + ',' + str(AnalogInputGainValue[i])
-        command += ')'
-
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # GPIODigitalGet :  Read digital output or digital input
-    async def GPIODigitalGet(self, GPIOName):
-        command = 'GPIODigitalGet(' + GPIOName + ',unsigned short *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        if (error != 0):
-            return (error, returnedString)
-
-        i, j, retList = 0, 0, [error]
-        while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-            j += 1
-        retList.append(eval(returnedString[i:i + j]))
-
-        return retList
-
-    # GPIODigitalSet :  Set Digital Output for one or few output TTL
-    async def GPIODigitalSet(self, GPIOName, Mask, DigitalOutputValue):
-        command = 'GPIODigitalSet(' + GPIOName + ',' + \
-            str(Mask) + ',' + str(DigitalOutputValue) + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # GroupCorrectorOutputGet :  Return corrector outputs
-    async def GroupCorrectorOutputGet(self, GroupName, nbElement):
-        command = 'GroupCorrectorOutputGet(' + GroupName + ','
-        for i in range(nbElement):
-            if (i > 0):
-                command += ','
-            command += 'double *'
-        command += ')'
-
-        (error, returnedString) = await self._sendAndReceive(command)
-        if (error != 0):
-            return (error, returnedString)
-
-        i, j, retList = 0, 0, [error]
-        for paramNb in range(nbElement):
-            while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-                j += 1
-            retList.append(eval(returnedString[i:i + j]))
-            i, j = i + j + 1, 0
-
-        return retList
-
-    # GroupHomeSearch :  Start home search sequence
-    async def GroupHomeSearch(self, GroupName):
-        command = 'GroupHomeSearch(' + GroupName + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # GroupHomeSearchAndRelativeMove :  Start home search sequence and execute
-    # a displacement
-    async def GroupHomeSearchAndRelativeMove(self, GroupName, TargetDisplacement):
-        command = 'GroupHomeSearchAndRelativeMove(' + GroupName + ','
-        for i in range(len(TargetDisplacement)):
-            if (i > 0):
-                command += ','
-            command += str(TargetDisplacement[i])
-        command += ')'
-
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # GroupReadyAtPosition :  Go to READY state with the users positions
-    async def GroupReadyAtPosition(self, GroupName, EncoderPosition1, EncoderPosition2, EncoderPosition3, EncoderPosition4, EncoderPosition5, EncoderPosition6):
-        command = 'GroupReadyAtPosition(' + GroupName + ',' + str(EncoderPosition1) + ',' + str(EncoderPosition2) + ',' + str(
-            EncoderPosition3) + ',' + str(EncoderPosition4) + ',' + str(EncoderPosition5) + ',' + str(EncoderPosition6) + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # GroupInitialize :  Start the initialization
-    async def GroupInitialize(self, GroupName):
-        command = 'GroupInitialize(' + GroupName + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # GroupInitializeWithEncoderCalibration :  Start the initialization with
-    # encoder calibration
-    async def GroupInitializeWithEncoderCalibration(self, GroupName):
-        command = 'GroupInitializeWithEncoderCalibration(' + GroupName + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # GroupKill :  Kill the group
-    async def GroupKill(self, GroupName):
-        command = 'GroupKill(' + GroupName + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # GroupMoveAbort :  Abort a move
-    async def GroupMoveAbort(self, GroupName):
-        command = 'GroupMoveAbort(' + GroupName + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # GroupMoveAbsolute :  Do an absolute move
-    async def GroupMoveAbsolute(self, GroupName, TargetPosition):
-        command = 'GroupMoveAbsolute(' + GroupName + ','
-        for i in range(len(TargetPosition)):
-            if (i > 0):
-                command += ','
-            command += str(TargetPosition[i])
-        command += ')'
-
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # GroupMoveRelative :  Do a relative move
-    async def GroupMoveRelative(self, GroupName, TargetDisplacement):
-        command = 'GroupMoveRelative(' + GroupName + ','
-        for i in range(len(TargetDisplacement)):
-            if (i > 0):
-                command += ','
-            command += str(TargetDisplacement[i])
-        command += ')'
-
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # GroupMotionDisable :  Set Motion disable on selected group
-    async def GroupMotionDisable(self, GroupName):
-        command = 'GroupMotionDisable(' + GroupName + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # GroupMotionEnable :  Set Motion enable on selected group
-    async def GroupMotionEnable(self, GroupName):
-        command = 'GroupMotionEnable(' + GroupName + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # GroupPositionCorrectedProfilerGet :  Return corrected profiler positions
-    async def GroupPositionCorrectedProfilerGet(self, GroupName, PositionX, PositionY):
-        command = 'GroupPositionCorrectedProfilerGet(' + GroupName + ',' + str(
-            PositionX) + ',' + str(PositionY) + ',double *,double *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        if (error != 0):
-            return (error, returnedString)
-
-        i, j, retList = 0, 0, [error]
-        for paramNb in range(2):
-            while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-                j += 1
-            retList.append(eval(returnedString[i:i + j]))
-            i, j = i + j + 1, 0
-
-        return retList
-
-    # GroupPositionCurrentGet :  Return current positions
-    async def GroupPositionCurrentGet(self, GroupName, nbElement):
-        command = 'GroupPositionCurrentGet(' + GroupName + ','
-        for i in range(nbElement):
-            if (i > 0):
-                command += ','
-            command += 'double *'
-        command += ')'
-
-        (error, returnedString) = await self._sendAndReceive(command)
-        if (error != 0):
-            return (error, returnedString)
-
-        i, j, retList = 0, 0, [error]
-        for paramNb in range(nbElement):
-            while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-                j += 1
-            retList.append(eval(returnedString[i:i + j]))
-            i, j = i + j + 1, 0
-
-        return retList
-
-    # GroupPositionSetpointGet :  Return setpoint positions
-    async def GroupPositionSetpointGet(self, GroupName, nbElement):
-        command = 'GroupPositionSetpointGet(' + GroupName + ','
-        for i in range(nbElement):
-            if (i > 0):
-                command += ','
-            command += 'double *'
-        command += ')'
-
-        (error, returnedString) = await self._sendAndReceive(command)
-        if (error != 0):
-            return (error, returnedString)
-
-        i, j, retList = 0, 0, [error]
-        for paramNb in range(nbElement):
-            while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-                j += 1
-            retList.append(eval(returnedString[i:i + j]))
-            i, j = i + j + 1, 0
-
-        return retList
-
-    # GroupPositionTargetGet :  Return target positions
-    async def GroupPositionTargetGet(self, GroupName, nbElement):
-        command = 'GroupPositionTargetGet(' + GroupName + ','
-        for i in range(nbElement):
-            if (i > 0):
-                command += ','
-            command += 'double *'
-        command += ')'
-
-        (error, returnedString) = await self._sendAndReceive(command)
-        if (error != 0):
-            return (error, returnedString)
-
-        i, j, retList = 0, 0, [error]
-        for paramNb in range(nbElement):
-            while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-                j += 1
-            retList.append(eval(returnedString[i:i + j]))
-            i, j = i + j + 1, 0
-
-        return retList
-
-    # GroupStatusGet :  Return group status
-    async def GroupStatusGet(self, GroupName):
-        command = 'GroupStatusGet(' + GroupName + ',int *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        if (error != 0):
-            return (error, returnedString)
-
-        i, j, retList = 0, 0, [error]
-        while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-            j += 1
-        retList.append(eval(returnedString[i:i + j]))
-
-        return retList
-
-    # GroupStatusStringGet :  Return the group status string corresponding to
-    # the group status code
-    async def GroupStatusStringGet(self, GroupStatusCode):
-        command = 'GroupStatusStringGet(' + str(GroupStatusCode) + ',char *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # KillAll :  Put all groups in 'Not initialized' state
-    async def KillAll(self):
-        command = 'KillAll()'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # RestartApplication :  Restart the Controller
-    async def RestartApplication(self):
-        command = 'RestartApplication()'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # PositionerBacklashGet :  Read backlash value and status
-    async def PositionerBacklashGet(self, PositionerName):
-        command = 'PositionerBacklashGet(' + \
-            PositionerName + ',double *,char *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        if (error != 0):
-            return (error, returnedString)
-
-        i, j, retList = 0, 0, [error]
-        for paramNb in range(2):
-            while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-                j += 1
-            retList.append(eval(returnedString[i:i + j]))
-            i, j = i + j + 1, 0
-
-        return retList
-
-    # PositionerBacklashSet :  Set backlash value
-    async def PositionerBacklashSet(self, PositionerName, BacklashValue):
-        command = 'PositionerBacklashSet(' + PositionerName + \
-            ',' + str(BacklashValue) + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # PositionerBacklashEnable :  Enable the backlash
-    async def PositionerBacklashEnable(self, PositionerName):
-        command = 'PositionerBacklashEnable(' + PositionerName + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # PositionerBacklashDisable :  Disable the backlash
-    async def PositionerBacklashDisable(self, PositionerName):
-        command = 'PositionerBacklashDisable(' + PositionerName + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # PositionerCorrectorNotchFiltersSet :  Update filters parameters
-    async def PositionerCorrectorNotchFiltersSet(self, PositionerName, NotchFrequency1, NotchBandwith1, NotchGain1, NotchFrequency2, NotchBandwith2, NotchGain2):
-        command = 'PositionerCorrectorNotchFiltersSet(' + PositionerName + ',' + str(NotchFrequency1) + ',' + str(
-            NotchBandwith1) + ',' + str(NotchGain1) + ',' + str(NotchFrequency2) + ',' + str(NotchBandwith2) + ',' + str(NotchGain2) + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # PositionerCorrectorNotchFiltersGet :  Read filters parameters
-    async def PositionerCorrectorNotchFiltersGet(self, PositionerName):
-        command = 'PositionerCorrectorNotchFiltersGet(' + PositionerName + \
-            ',double *,double *,double *,double *,double *,double *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        if (error != 0):
-            return (error, returnedString)
-
-        i, j, retList = 0, 0, [error]
-        for paramNb in range(6):
-            while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-                j += 1
-            retList.append(eval(returnedString[i:i + j]))
-            i, j = i + j + 1, 0
-
-        return retList
-
-    # PositionerCorrectorPIDFFAccelerationSet :  Update corrector parameters
-    async def PositionerCorrectorPIDFFAccelerationSet(self, PositionerName, ClosedLoopStatus, KP, KI, KD, KS, IntegrationTime, DerivativeFilterCutOffFrequency, GKP, GKI, GKD, KForm, FeedForwardGainAcceleration):
-        command = 'PositionerCorrectorPIDFFAccelerationSet(' + PositionerName + ',' + str(ClosedLoopStatus) + ',' + str(KP) + ',' + str(KI) + ',' + str(KD) + ',' + str(KS) + ',' + str(
-            IntegrationTime) + ',' + str(DerivativeFilterCutOffFrequency) + ',' + str(GKP) + ',' + str(GKI) + ',' + str(GKD) + ',' + str(KForm) + ',' + str(FeedForwardGainAcceleration) + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # PositionerCorrectorPIDFFAccelerationGet :  Read corrector parameters
-    async def PositionerCorrectorPIDFFAccelerationGet(self, PositionerName):
-        command = 'PositionerCorrectorPIDFFAccelerationGet(' + PositionerName + \
-            ',bool *,double *,double *,double *,double *,double *,double *,double *,double *,double *,double *,double *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        if (error != 0):
-            return (error, returnedString)
-
-        i, j, retList = 0, 0, [error]
-        for paramNb in range(12):
-            while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-                j += 1
-            retList.append(eval(returnedString[i:i + j]))
-            i, j = i + j + 1, 0
-
-        return retList
-
-    # PositionerCorrectorPIDFFVelocitySet :  Update corrector parameters
-    async def PositionerCorrectorPIDFFVelocitySet(self, PositionerName, ClosedLoopStatus, KP, KI, KD, KS, IntegrationTime, DerivativeFilterCutOffFrequency, GKP, GKI, GKD, KForm, FeedForwardGainVelocity):
-        command = 'PositionerCorrectorPIDFFVelocitySet(' + PositionerName + ',' + str(ClosedLoopStatus) + ',' + str(KP) + ',' + str(KI) + ',' + str(KD) + ',' + str(KS) + ',' + str(
-            IntegrationTime) + ',' + str(DerivativeFilterCutOffFrequency) + ',' + str(GKP) + ',' + str(GKI) + ',' + str(GKD) + ',' + str(KForm) + ',' + str(FeedForwardGainVelocity) + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # PositionerCorrectorPIDFFVelocityGet :  Read corrector parameters
-    async def PositionerCorrectorPIDFFVelocityGet(self, PositionerName):
-        command = 'PositionerCorrectorPIDFFVelocityGet(' + PositionerName + \
-            ',bool *,double *,double *,double *,double *,double *,double *,double *,double *,double *,double *,double *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        if (error != 0):
-            return (error, returnedString)
-
-        i, j, retList = 0, 0, [error]
-        for paramNb in range(12):
-            while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-                j += 1
-            retList.append(eval(returnedString[i:i + j]))
-            i, j = i + j + 1, 0
-
-        return retList
-
-    # PositionerCorrectorPIDDualFFVoltageSet :  Update corrector parameters
-    async def PositionerCorrectorPIDDualFFVoltageSet(self, PositionerName, ClosedLoopStatus, KP, KI, KD, KS, IntegrationTime, DerivativeFilterCutOffFrequency, GKP, GKI, GKD, KForm, FeedForwardGainVelocity, FeedForwardGainAcceleration, Friction):
-        command = 'PositionerCorrectorPIDDualFFVoltageSet(' + PositionerName + ',' + str(ClosedLoopStatus) + ',' + str(KP) + ',' + str(KI) + ',' + str(KD) + ',' + str(KS) + ',' + str(IntegrationTime) + ',' + str(
-            DerivativeFilterCutOffFrequency) + ',' + str(GKP) + ',' + str(GKI) + ',' + str(GKD) + ',' + str(KForm) + ',' + str(FeedForwardGainVelocity) + ',' + str(FeedForwardGainAcceleration) + ',' + str(Friction) + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # PositionerCorrectorPIDDualFFVoltageGet :  Read corrector parameters
-    async def PositionerCorrectorPIDDualFFVoltageGet(self, PositionerName):
-        command = 'PositionerCorrectorPIDDualFFVoltageGet(' + PositionerName + \
-            ',bool *,double *,double *,double *,double *,double *,double *,double *,double *,double *,double *,double *,double *,double *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        if (error != 0):
-            return (error, returnedString)
-
-        i, j, retList = 0, 0, [error]
-        for paramNb in range(14):
-            while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-                j += 1
-            retList.append(eval(returnedString[i:i + j]))
-            i, j = i + j + 1, 0
-
-        return retList
-
-    # PositionerCorrectorPIPositionSet :  Update corrector parameters
-    async def PositionerCorrectorPIPositionSet(self, PositionerName, ClosedLoopStatus, KP, KI, IntegrationTime):
-        command = 'PositionerCorrectorPIPositionSet(' + PositionerName + ',' + str(
-            ClosedLoopStatus) + ',' + str(KP) + ',' + str(KI) + ',' + str(IntegrationTime) + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # PositionerCorrectorPIPositionGet :  Read corrector parameters
-    async def PositionerCorrectorPIPositionGet(self, PositionerName):
-        command = 'PositionerCorrectorPIPositionGet(' + \
-            PositionerName + ',bool *,double *,double *,double *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        if (error != 0):
-            return (error, returnedString)
-
-        i, j, retList = 0, 0, [error]
-        for paramNb in range(4):
-            while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-                j += 1
-            retList.append(eval(returnedString[i:i + j]))
-            i, j = i + j + 1, 0
-
-        return retList
-
-    # PositionerCorrectorTypeGet :  Read corrector type
-    async def PositionerCorrectorTypeGet(self, PositionerName):
-        command = 'PositionerCorrectorTypeGet(' + PositionerName + ',char *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # PositionerCurrentVelocityAccelerationFiltersSet :  Set current velocity
-    # and acceleration cut off frequencies
-    async def PositionerCurrentVelocityAccelerationFiltersSet(self, PositionerName, CurrentVelocityCutOffFrequency, CurrentAccelerationCutOffFrequency):
-        command = 'PositionerCurrentVelocityAccelerationFiltersSet(' + PositionerName + ',' + str(
-            CurrentVelocityCutOffFrequency) + ',' + str(CurrentAccelerationCutOffFrequency) + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # PositionerCurrentVelocityAccelerationFiltersGet :  Get current velocity
-    # and acceleration cut off frequencies
-    async def PositionerCurrentVelocityAccelerationFiltersGet(self, PositionerName):
-        command = 'PositionerCurrentVelocityAccelerationFiltersGet(' + \
-            PositionerName + ',double *,double *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        if (error != 0):
-            return (error, returnedString)
-
-        i, j, retList = 0, 0, [error]
-        for paramNb in range(2):
-            while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-                j += 1
-            retList.append(eval(returnedString[i:i + j]))
-            i, j = i + j + 1, 0
-
-        return retList
-
-    # PositionerDriverStatusGet :  Read positioner driver status
-    async def PositionerDriverStatusGet(self, PositionerName):
-        command = 'PositionerDriverStatusGet(' + PositionerName + ',int *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        if (error != 0):
-            return (error, returnedString)
-
-        i, j, retList = 0, 0, [error]
-        while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-            j += 1
-        retList.append(eval(returnedString[i:i + j]))
-
-        return retList
-
-    # PositionerDriverStatusStringGet :  Return the positioner driver status
-    # string corresponding to the positioner error code
-    async def PositionerDriverStatusStringGet(self, PositionerDriverStatus):
-        command = 'PositionerDriverStatusStringGet(' + str(
-            PositionerDriverStatus) + ',char *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # PositionerEncoderAmplitudeValuesGet :  Read analog interpolated encoder
-    # amplitude values
-    async def PositionerEncoderAmplitudeValuesGet(self, PositionerName):
-        command = 'PositionerEncoderAmplitudeValuesGet(' + \
-            PositionerName + ',double *,double *,double *,double *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        if (error != 0):
-            return (error, returnedString)
-
-        i, j, retList = 0, 0, [error]
-        for paramNb in range(4):
-            while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-                j += 1
-            retList.append(eval(returnedString[i:i + j]))
-            i, j = i + j + 1, 0
-
-        return retList
-
-    # PositionerEncoderCalibrationParametersGet :  Read analog interpolated
-    # encoder calibration parameters
-    async def PositionerEncoderCalibrationParametersGet(self, PositionerName):
-        command = 'PositionerEncoderCalibrationParametersGet(' + \
-            PositionerName + ',double *,double *,double *,double *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        if (error != 0):
-            return (error, returnedString)
-
-        i, j, retList = 0, 0, [error]
-        for paramNb in range(4):
-            while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-                j += 1
-            retList.append(eval(returnedString[i:i + j]))
-            i, j = i + j + 1, 0
-
-        return retList
-
-    # PositionerErrorGet :  Read and clear positioner error code
-    async def PositionerErrorGet(self, PositionerName):
-        command = 'PositionerErrorGet(' + PositionerName + ',int *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        if (error != 0):
-            return (error, returnedString)
-
-        i, j, retList = 0, 0, [error]
-        while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-            j += 1
-        retList.append(eval(returnedString[i:i + j]))
-
-        return retList
-
-    # PositionerErrorRead :  Read only positioner error code without clear it
-    async def PositionerErrorRead(self, PositionerName):
-        command = 'PositionerErrorRead(' + PositionerName + ',int *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        if (error != 0):
-            return (error, returnedString)
-
-        i, j, retList = 0, 0, [error]
-        while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-            j += 1
-        retList.append(eval(returnedString[i:i + j]))
-
-        return retList
-
-    # PositionerErrorStringGet :  Return the positioner status string
-    # corresponding to the positioner error code
-    async def PositionerErrorStringGet(self, PositionerErrorCode):
-        command = 'PositionerErrorStringGet(' + \
-            str(PositionerErrorCode) + ',char *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # PositionerHardwareStatusGet :  Read positioner hardware status
-    async def PositionerHardwareStatusGet(self, PositionerName):
-        command = 'PositionerHardwareStatusGet(' + PositionerName + ',int *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        if (error != 0):
-            return (error, returnedString)
-
-        i, j, retList = 0, 0, [error]
-        while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-            j += 1
-        retList.append(eval(returnedString[i:i + j]))
-
-        return retList
-
-    # PositionerHardwareStatusStringGet :  Return the positioner hardware
-    # status string corresponding to the positioner error code
-    async def PositionerHardwareStatusStringGet(self, PositionerHardwareStatus):
-        command = 'PositionerHardwareStatusStringGet(' + str(
-            PositionerHardwareStatus) + ',char *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # PositionerHardInterpolatorFactorGet :  Get hard interpolator parameters
-    async def PositionerHardInterpolatorFactorGet(self, PositionerName):
-        command = 'PositionerHardInterpolatorFactorGet(' + \
-            PositionerName + ',int *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        if (error != 0):
-            return (error, returnedString)
-
-        i, j, retList = 0, 0, [error]
-        while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-            j += 1
-        retList.append(eval(returnedString[i:i + j]))
-
-        return retList
-
-    # PositionerHardInterpolatorFactorSet :  Set hard interpolator parameters
-    async def PositionerHardInterpolatorFactorSet(self, PositionerName, InterpolationFactor):
-        command = 'PositionerHardInterpolatorFactorSet(' + PositionerName + ',' + str(
-            InterpolationFactor) + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # PositionerMaximumVelocityAndAccelerationGet :  Return maximum velocity
-    # and acceleration of the positioner
-    async def PositionerMaximumVelocityAndAccelerationGet(self, PositionerName):
-        command = 'PositionerMaximumVelocityAndAccelerationGet(' + \
-            PositionerName + ',double *,double *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        if (error != 0):
-            return (error, returnedString)
-
-        i, j, retList = 0, 0, [error]
-        for paramNb in range(2):
-            while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-                j += 1
-            retList.append(eval(returnedString[i:i + j]))
-            i, j = i + j + 1, 0
-
-        return retList
-
-    # PositionerMotionDoneGet :  Read motion done parameters
-    async def PositionerMotionDoneGet(self, PositionerName):
-        command = 'PositionerMotionDoneGet(' + PositionerName + \
-            ',double *,double *,double *,double *,double *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        if (error != 0):
-            return (error, returnedString)
-
-        i, j, retList = 0, 0, [error]
-        for paramNb in range(5):
-            while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-                j += 1
-            retList.append(eval(returnedString[i:i + j]))
-            i, j = i + j + 1, 0
-
-        return retList
-
-    # PositionerMotionDoneSet :  Update motion done parameters
-    async def PositionerMotionDoneSet(self, PositionerName, PositionWindow, VelocityWindow, CheckingTime, MeanPeriod, TimeOut):
-        command = 'PositionerMotionDoneSet(' + PositionerName + ',' + str(PositionWindow) + ',' + str(
-            VelocityWindow) + ',' + str(CheckingTime) + ',' + str(MeanPeriod) + ',' + str(TimeOut) + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # PositionerSGammaExactVelocityAjustedDisplacementGet :  Return adjusted
-    # displacement to get exact velocity
-    async def PositionerSGammaExactVelocityAjustedDisplacementGet(self, PositionerName, DesiredDisplacement):
-        command = 'PositionerSGammaExactVelocityAjustedDisplacementGet(' + PositionerName + ',' + str(
-            DesiredDisplacement) + ',double *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        if (error != 0):
-            return (error, returnedString)
-
-        i, j, retList = 0, 0, [error]
-        while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-            j += 1
-        retList.append(eval(returnedString[i:i + j]))
-
-        return retList
-
-    # PositionerSGammaParametersGet :  Read dynamic parameters for one axe of
-    # a group for a future displacement
-    async def PositionerSGammaParametersGet(self, PositionerName):
-        command = 'PositionerSGammaParametersGet(' + PositionerName + \
-            ',double *,double *,double *,double *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        if (error != 0):
-            return (error, returnedString)
-
-        i, j, retList = 0, 0, [error]
-        for paramNb in range(4):
-            while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-                j += 1
-            retList.append(eval(returnedString[i:i + j]))
-            i, j = i + j + 1, 0
-
-        return retList
-
-    # PositionerSGammaParametersSet :  Update dynamic parameters for one axe
-    # of a group for a future displacement
-    async def PositionerSGammaParametersSet(self, PositionerName, Velocity, Acceleration, MinimumTjerkTime, MaximumTjerkTime):
-        command = 'PositionerSGammaParametersSet(' + PositionerName + ',' + str(Velocity) + ',' + str(
-            Acceleration) + ',' + str(MinimumTjerkTime) + ',' + str(MaximumTjerkTime) + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # PositionerSGammaParametersDistanceGet :  Returns distance during
-    # acceleration phase and distance during constant velocity phase
-    async def PositionerSGammaParametersDistanceGet(self, PositionerName, Displacement, Velocity, Acceleration, MinJerkTime, MaxJerkTime):
-        command = 'PositionerSGammaParametersDistanceGet(' + PositionerName + ',' + str(Displacement) + ',' + str(
-            Velocity) + ',' + str(Acceleration) + ',' + str(MinJerkTime) + ',' + str(MaxJerkTime) + ',double *,double *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        if (error != 0):
-            return (error, returnedString)
-
-        i, j, retList = 0, 0, [error]
-        for paramNb in range(2):
-            while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-                j += 1
-            retList.append(eval(returnedString[i:i + j]))
-            i, j = i + j + 1, 0
-
-        return retList
-
-    # PositionerSGammaPreviousMotionTimesGet :  Read SettingTime and
-    # SettlingTime
-    async def PositionerSGammaPreviousMotionTimesGet(self, PositionerName):
-        command = 'PositionerSGammaPreviousMotionTimesGet(' + \
-            PositionerName + ',double *,double *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        if (error != 0):
-            return (error, returnedString)
-
-        i, j, retList = 0, 0, [error]
-        for paramNb in range(2):
-            while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-                j += 1
-            retList.append(eval(returnedString[i:i + j]))
-            i, j = i + j + 1, 0
-
-        return retList
-
-    # PositionerStageParameterGet :  Return the stage parameter
-    async def PositionerStageParameterGet(self, PositionerName, ParameterName):
-        command = 'PositionerStageParameterGet(' + \
-            PositionerName + ',' + ParameterName + ',char *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # PositionerStageParameterSet :  Save the stage parameter
-    async def PositionerStageParameterSet(self, PositionerName, ParameterName, ParameterValue):
-        command = 'PositionerStageParameterSet(' + PositionerName + \
-            ',' + ParameterName + ',' + ParameterValue + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # PositionerUserTravelLimitsGet :  Read UserMinimumTarget and
-    # UserMaximumTarget
-    async def PositionerUserTravelLimitsGet(self, PositionerName):
-        command = 'PositionerUserTravelLimitsGet(' + \
-            PositionerName + ',double *,double *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        if (error != 0):
-            return (error, returnedString)
-
-        i, j, retList = 0, 0, [error]
-        for paramNb in range(2):
-            while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-                j += 1
-            retList.append(eval(returnedString[i:i + j]))
-            i, j = i + j + 1, 0
-
-        return retList
-
-    # PositionerUserTravelLimitsSet :  Update UserMinimumTarget and
-    # UserMaximumTarget
-    async def PositionerUserTravelLimitsSet(self, PositionerName, UserMinimumTarget, UserMaximumTarget):
-        command = 'PositionerUserTravelLimitsSet(' + PositionerName + ',' + str(
-            UserMinimumTarget) + ',' + str(UserMaximumTarget) + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # HexapodMoveAbsolute :  Hexapod absolute move in a specific coordinate
-    # system
-    async def HexapodMoveAbsolute(self, GroupName, CoordinateSystem, X, Y, Z, U, V, W):
-        command = 'HexapodMoveAbsolute(' + GroupName + ',' + CoordinateSystem + ',' + str(
-            X) + ',' + str(Y) + ',' + str(Z) + ',' + str(U) + ',' + str(V) + ',' + str(W) + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # HexapodMoveIncremental :  Hexapod incremental move in a specific
-    # coordinate system
-    async def HexapodMoveIncremental(self, GroupName, CoordinateSystem, dX, dY, dZ, dU, dV, dW):
-        command = 'HexapodMoveIncremental(' + GroupName + ',' + CoordinateSystem + ',' + str(
-            dX) + ',' + str(dY) + ',' + str(dZ) + ',' + str(dU) + ',' + str(dV) + ',' + str(dW) + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # HexapodCoordinatesGet :  Get coordinates in a specific coordinate system
-    # of a point specified in another coordinate system
-    async def HexapodCoordinatesGet(self, GroupName, CoordinateSystemIn, CoordinateSystemOut, Xin, Yin, Zin, Uin, Vin, Win):
-        command = 'HexapodCoordinatesGet(' + GroupName + ',' + CoordinateSystemIn + ',' + CoordinateSystemOut + ',' + str(Xin) + ',' + str(
-            Yin) + ',' + str(Zin) + ',' + str(Uin) + ',' + str(Vin) + ',' + str(Win) + ',double *,double *,double *,double *,double *,double *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        if (error != 0):
-            return (error, returnedString)
-
-        i, j, retList = 0, 0, [error]
-        for paramNb in range(6):
-            while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-                j += 1
-            retList.append(eval(returnedString[i:i + j]))
-            i, j = i + j + 1, 0
-
-        return retList
-
-    # HexapodCoordinateSystemSet :  Modify the position of a coordinate system
-    async def HexapodCoordinateSystemSet(self, GroupName, CoordinateSystem, X, Y, Z, U, V, W):
-        command = 'HexapodCoordinateSystemSet(' + GroupName + ',' + CoordinateSystem + ',' + str(
-            X) + ',' + str(Y) + ',' + str(Z) + ',' + str(U) + ',' + str(V) + ',' + str(W) + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # HexapodCoordinateSystemGet :  Get the position of a coordinate system
-    async def HexapodCoordinateSystemGet(self, GroupName, CoordinateSystem):
-        command = 'HexapodCoordinateSystemGet(' + GroupName + ',' + CoordinateSystem + \
-            ',double *,double *,double *,double *,double *,double *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        if (error != 0):
-            return (error, returnedString)
-
-        i, j, retList = 0, 0, [error]
-        for paramNb in range(6):
-            while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-                j += 1
-            retList.append(eval(returnedString[i:i + j]))
-            i, j = i + j + 1, 0
-
-        return retList
-
-    # HexapodMoveIncrementalControl :  Hexapod trajectory (Line, Arc or
-    # Rotation) execution with the maximum velocity
-    async def HexapodMoveIncrementalControl(self, GroupName, CoordinateSystem, HexapodTrajectoryType, dX, dY, dZ):
-        command = 'HexapodMoveIncrementalControl(' + GroupName + ',' + CoordinateSystem + \
-            ',' + HexapodTrajectoryType + ',' + \
-            str(dX) + ',' + str(dY) + ',' + str(dZ) + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # HexapodMoveIncrementalControlWithTargetVelocity :  Hexapod trajectory
-    # (Line, Arc or Rotation) execution with a target velocity
-    async def HexapodMoveIncrementalControlWithTargetVelocity(self, GroupName, CoordinateSystem, HexapodTrajectoryType, dX, dY, dZ, Velocity):
-        command = 'HexapodMoveIncrementalControlWithTargetVelocity(' + GroupName + ',' + CoordinateSystem + ',' + HexapodTrajectoryType + ',' + str(
-            dX) + ',' + str(dY) + ',' + str(dZ) + ',' + str(Velocity) + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # HexapodMoveIncrementalControlPulseAndGatheringSet :  Configure gathering
-    # with pulses : gathered data are X, Y, Z, U, V, W and pulses will be
-    # generated during only constant velocity
-    async def HexapodMoveIncrementalControlPulseAndGatheringSet(self, GroupName, Divisor):
-        command = 'HexapodMoveIncrementalControlPulseAndGatheringSet(' + GroupName + ',' + str(
-            Divisor) + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # HexapodMoveIncrementalControlLimitGet :  Returns the maximum velocity of
-    # carriage and the percent of the trajectory executable
-    async def HexapodMoveIncrementalControlLimitGet(self, GroupName, CoordinateSystem, HexapodTrajectoryType, dX, dY, dZ):
-        command = 'HexapodMoveIncrementalControlLimitGet(' + GroupName + ',' + CoordinateSystem + ',' + \
-            HexapodTrajectoryType + ',' + \
-            str(dX) + ',' + str(dY) + ',' + str(dZ) + ',double *,double *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        if (error != 0):
-            return (error, returnedString)
-
-        i, j, retList = 0, 0, [error]
-        for paramNb in range(2):
-            while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-                j += 1
-            retList.append(eval(returnedString[i:i + j]))
-            i, j = i + j + 1, 0
-
-        return retList
-
-    # HexapodSGammaParametersDistanceGet :  Returns distance during
-    # acceleration phase and distance during constant velocity phase for a
-    # virtual SGamma profiler
-    async def HexapodSGammaParametersDistanceGet(self, PositionerName, Displacement, Velocity, Acceleration, MinJerkTime, MaxJerkTime):
-        command = 'HexapodSGammaParametersDistanceGet(' + PositionerName + ',' + str(Displacement) + ',' + str(
-            Velocity) + ',' + str(Acceleration) + ',' + str(MinJerkTime) + ',' + str(MaxJerkTime) + ',double *,double *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        if (error != 0):
-            return (error, returnedString)
-
-        i, j, retList = 0, 0, [error]
-        for paramNb in range(2):
-            while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-                j += 1
-            retList.append(eval(returnedString[i:i + j]))
-            i, j = i + j + 1, 0
-
-        return retList
-
-    # OptionalModuleExecute :  Execute an optional module
-    async def OptionalModuleExecute(self, ModuleFileName, TaskName):
-        command = 'OptionalModuleExecute(' + \
-            ModuleFileName + ',' + TaskName + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # OptionalModuleKill :  Kill an optional module
-    async def OptionalModuleKill(self, TaskName):
-        command = 'OptionalModuleKill(' + TaskName + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # ControllerStatusGet :  Read controller current status
-    async def ControllerStatusGet(self):
-        command = 'ControllerStatusGet(int *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        if (error != 0):
-            return (error, returnedString)
-
-        i, j, retList = 0, 0, [error]
-        while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-            j += 1
-        retList.append(eval(returnedString[i:i + j]))
-
-        return retList
-
-    # ControllerStatusStringGet :  Return the controller status string
-    # corresponding to the controller status code
-    async def ControllerStatusStringGet(self, ControllerStatusCode):
-        command = 'ControllerStatusStringGet(' + \
-            str(ControllerStatusCode) + ',char *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # EEPROMCIESet :  Set CIE EEPROM reference string
-    async def EEPROMCIESet(self, CardNumber, ReferenceString):
-        command = 'EEPROMCIESet(' + str(CardNumber) + \
-            ',' + ReferenceString + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # EEPROMDACOffsetCIESet :  Set CIE DAC offsets
-    async def EEPROMDACOffsetCIESet(self, PlugNumber, DAC1Offset, DAC2Offset):
-        command = 'EEPROMDACOffsetCIESet(' + str(PlugNumber) + \
-            ',' + str(DAC1Offset) + ',' + str(DAC2Offset) + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # EEPROMDriverSet :  Set Driver EEPROM reference string
-    async def EEPROMDriverSet(self, PlugNumber, ReferenceString):
-        command = 'EEPROMDriverSet(' + str(PlugNumber) + \
-            ',' + ReferenceString + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # EEPROMINTSet :  Set INT EEPROM reference string
-    async def EEPROMINTSet(self, CardNumber, ReferenceString):
-        command = 'EEPROMINTSet(' + str(CardNumber) + \
-            ',' + ReferenceString + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # CPUCoreAndBoardSupplyVoltagesGet :  Get power informations
-    async def CPUCoreAndBoardSupplyVoltagesGet(self):
-        command = 'CPUCoreAndBoardSupplyVoltagesGet(double *,double *,double *,double *,double *,double *,double *,double *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        if (error != 0):
-            return (error, returnedString)
-
-        i, j, retList = 0, 0, [error]
-        for paramNb in range(8):
-            while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-                j += 1
-            retList.append(eval(returnedString[i:i + j]))
-            i, j = i + j + 1, 0
-
-        return retList
-
-    # CPUTemperatureAndFanSpeedGet :  Get CPU temperature and fan speed
-    async def CPUTemperatureAndFanSpeedGet(self):
-        command = 'CPUTemperatureAndFanSpeedGet(double *,double *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        if (error != 0):
-            return (error, returnedString)
-
-        i, j, retList = 0, 0, [error]
-        for paramNb in range(2):
-            while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-                j += 1
-            retList.append(eval(returnedString[i:i + j]))
-            i, j = i + j + 1, 0
-
-        return retList
-
-    # ActionListGet :  Action list
-    async def ActionListGet(self):
-        command = 'ActionListGet(char *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # ActionExtendedListGet :  Action extended list
-    async def ActionExtendedListGet(self):
-        command = 'ActionExtendedListGet(char *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # APIExtendedListGet :  API method list
-    async def APIExtendedListGet(self):
-        command = 'APIExtendedListGet(char *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # APIListGet :  API method list without extended API
-    async def APIListGet(self):
-        command = 'APIListGet(char *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # ErrorListGet :  Error list
-    async def ErrorListGet(self):
-        command = 'ErrorListGet(char *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # EventListGet :  General event list
-    async def EventListGet(self):
-        command = 'EventListGet(char *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # GatheringListGet :  Gathering type list
-    async def GatheringListGet(self):
-        command = 'GatheringListGet(char *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # GatheringExtendedListGet :  Gathering type extended list
-    async def GatheringExtendedListGet(self):
-        command = 'GatheringExtendedListGet(char *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # GatheringExternalListGet :  External Gathering type list
-    async def GatheringExternalListGet(self):
-        command = 'GatheringExternalListGet(char *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # GroupStatusListGet :  Group status list
-    async def GroupStatusListGet(self):
-        command = 'GroupStatusListGet(char *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # HardwareInternalListGet :  Internal hardware list
-    async def HardwareInternalListGet(self):
-        command = 'HardwareInternalListGet(char *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # HardwareDriverAndStageGet :  Smart hardware
-    async def HardwareDriverAndStageGet(self, PlugNumber):
-        command = 'HardwareDriverAndStageGet(' + \
-            str(PlugNumber) + ',char *,char *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # HexapodTrajectoryListGet :  Hexapod trajectory type list
-    async def HexapodTrajectoryListGet(self):
-        command = 'HexapodTrajectoryListGet(char *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # ObjectsListGet :  Group name and positioner name
-    async def ObjectsListGet(self):
-        command = 'ObjectsListGet(char *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # PositionerErrorListGet :  Positioner error list
-    async def PositionerErrorListGet(self):
-        command = 'PositionerErrorListGet(char *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # PositionerHardwareStatusListGet :  Positioner hardware status list
-    async def PositionerHardwareStatusListGet(self):
-        command = 'PositionerHardwareStatusListGet(char *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # PositionerDriverStatusListGet :  Positioner driver status list
-    async def PositionerDriverStatusListGet(self):
-        command = 'PositionerDriverStatusListGet(char *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # ReferencingActionListGet :  Get referencing action list
-    async def ReferencingActionListGet(self):
-        command = 'ReferencingActionListGet(char *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # ReferencingSensorListGet :  Get referencing sensor list
-    async def ReferencingSensorListGet(self):
-        command = 'ReferencingSensorListGet(char *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # GatheringUserDatasGet :  Return UserDatas values
-    async def GatheringUserDatasGet(self):
-        command = 'GatheringUserDatasGet(double *,double *,double *,double *,double *,double *,double *,double *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        if (error != 0):
-            return (error, returnedString)
-
-        i, j, retList = 0, 0, [error]
-        for paramNb in range(8):
-            while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-                j += 1
-            retList.append(eval(returnedString[i:i + j]))
-            i, j = i + j + 1, 0
-
-        return retList
-
-    # ControllerMotionKernelPeriodMinMaxGet :  Get controller motion kernel
-    # min/max periods
-    async def ControllerMotionKernelPeriodMinMaxGet(self):
-        command = 'ControllerMotionKernelPeriodMinMaxGet(double *,double *,double *,double *,double *,double *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        if (error != 0):
-            return (error, returnedString)
-
-        i, j, retList = 0, 0, [error]
-        for paramNb in range(6):
-            while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-                j += 1
-            retList.append(eval(returnedString[i:i + j]))
-            i, j = i + j + 1, 0
-
-        return retList
-
-    # ControllerMotionKernelPeriodMinMaxReset :  Reset controller motion
-    # kernel min/max periods
-    async def ControllerMotionKernelPeriodMinMaxReset(self):
-        command = 'ControllerMotionKernelPeriodMinMaxReset()'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # TestTCP :  Test TCP/IP transfert
-    async def TestTCP(self, InputString):
-        command = 'TestTCP(' + InputString + ',char *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # PrepareForUpdate :  Kill QNX processes for firmware update
-    async def PrepareForUpdate(self):
-        command = 'PrepareForUpdate()'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
+        command = 'GPIOAnalogGainSet(%s)' % ','.join(
+            ['%s,%s' % gain for gain in zip(GPIOName, AnalogInputGainValue)])
+        return await self._sendAndReceive(command)
+
+
+# Functions with a regular signature are generated from this table of
+# (name, arguments, outputs, description). See common.Function.
+_FUNCTIONS = (
+    ("ControllerMotionKernelTimeLoadGet", "",
+     "double *,double *,double *,double *",
+     "Get controller motion kernel time load"),
+    ("ElapsedTimeGet", "", "double *",
+     "Return elapsed time from controller power on"),
+    ("ErrorStringGet", "ErrorCode", "char *",
+     "Return the error string corresponding to the error code"),
+    ("FirmwareVersionGet", "", "char *",
+     "Return firmware version"),
+    ("TCLScriptExecute", "TCLFileName,TaskName,ParametersList", "",
+     "Execute a TCL script from a TCL file"),
+    ("TCLScriptExecuteAndWait", "TCLFileName,TaskName,InputParametersList",
+     "char *",
+     "Execute a TCL script from a TCL file and wait the end of execution to "
+     "return"),
+    ("TCLScriptKill", "TaskName", "",
+     "Kill TCL Task"),
+    ("TCLScriptKillAll", "", "",
+     "Kill all TCL Tasks"),
+    ("TimerGet", "TimerName", "int *",
+     "Get a timer"),
+    ("TimerSet", "TimerName,FrequencyTicks", "",
+     "Set a timer"),
+    ("Reboot", "", "",
+     "Reboot the controller"),
+    ("Login", "Name,Password", "",
+     "Log in"),
+    ("CloseAllOtherSockets", "", "",
+     "Close all socket beside the one used to send this command"),
+    ("EventAdd",
+     "PositionerName,EventName,EventParameter,ActionName,ActionParameter1,ActionParameter2,ActionParameter3",
+     "",
+     "** OBSOLETE ** Add an event"),
+    ("EventGet", "PositionerName", "char *",
+     "** OBSOLETE ** Read events and actions list"),
+    ("EventRemove", "PositionerName,EventName,EventParameter", "",
+     "** OBSOLETE ** Delete an event"),
+    ("EventWait", "PositionerName,EventName,EventParameter", "",
+     "** OBSOLETE ** Wait an event"),
+    ("EventExtendedConfigurationTriggerGet", "", "char *",
+     "Read the event configuration"),
+    ("EventExtendedConfigurationActionGet", "", "char *",
+     "Read the action configuration"),
+    ("EventExtendedStart", "", "int *",
+     "Launch the last event and action configuration and return an ID"),
+    ("EventExtendedAllGet", "", "char *",
+     "Read all event and action configurations"),
+    ("EventExtendedGet", "ID", "char *,char *",
+     "Read the event and action configuration defined by ID"),
+    ("EventExtendedRemove", "ID", "",
+     "Remove the event and action configuration defined by ID"),
+    ("EventExtendedWait", "", "",
+     "Wait events from the last event configuration"),
+    ("GatheringConfigurationGet", "", "char *",
+     "Read different mnemonique type"),
+    ("GatheringConfigurationSet", "*Type", "",
+     "Configuration acquisition"),
+    ("GatheringCurrentNumberGet", "", "int *,int *",
+     "Maximum number of samples and current number during acquisition"),
+    ("GatheringStopAndSave", "", "",
+     "Stop acquisition and save data"),
+    ("GatheringDataAcquire", "", "",
+     "Acquire a configured data"),
+    ("GatheringDataGet", "IndexPoint", "char *",
+     "Get a data line from gathering buffer"),
+    ("GatheringReset", "", "",
+     "Empty the gathered data in memory to start new gathering from scratch"),
+    ("GatheringRun", "DataNumber,Divisor", "",
+     "Start a new gathering"),
+    ("GatheringStop", "", "",
+     "Stop the data gathering (without saving to file)"),
+    ("GatheringExternalConfigurationSet", "*Type", "",
+     "Configuration acquisition"),
+    ("GatheringExternalConfigurationGet", "", "char *",
+     "Read different mnemonique type"),
+    ("GatheringExternalCurrentNumberGet", "", "int *,int *",
+     "Maximum number of samples and current number during acquisition"),
+    ("GatheringExternalStopAndSave", "", "",
+     "Stop acquisition and save data"),
+    ("GlobalArrayGet", "Number", "char *",
+     "Get global array value"),
+    ("GlobalArraySet", "Number,ValueString", "",
+     "Set global array value"),
+    ("DoubleGlobalArrayGet", "Number", "double *",
+     "Get double global array value"),
+    ("DoubleGlobalArraySet", "Number,DoubleValue", "",
+     "Set double global array value"),
+    ("GPIODigitalGet", "GPIOName", "unsigned short *",
+     "Read digital output or digital input"),
+    ("GPIODigitalSet", "GPIOName,Mask,DigitalOutputValue", "",
+     "Set Digital Output for one or few output TTL"),
+    ("GroupHomeSearch", "GroupName", "",
+     "Start home search sequence"),
+    ("GroupHomeSearchAndRelativeMove", "GroupName,*TargetDisplacement", "",
+     "Start home search sequence and execute a displacement"),
+    ("GroupReadyAtPosition",
+     "GroupName,EncoderPosition1,EncoderPosition2,EncoderPosition3,EncoderPosition4,EncoderPosition5,EncoderPosition6",
+     "",
+     "Go to READY state with the users positions"),
+    ("GroupInitialize", "GroupName", "",
+     "Start the initialization"),
+    ("GroupInitializeWithEncoderCalibration", "GroupName", "",
+     "Start the initialization with encoder calibration"),
+    ("GroupKill", "GroupName", "",
+     "Kill the group"),
+    ("GroupMoveAbort", "GroupName", "",
+     "Abort a move"),
+    ("GroupMoveAbsolute", "GroupName,*TargetPosition", "",
+     "Do an absolute move"),
+    ("GroupMoveRelative", "GroupName,*TargetDisplacement", "",
+     "Do a relative move"),
+    ("GroupMotionDisable", "GroupName", "",
+     "Set Motion disable on selected group"),
+    ("GroupMotionEnable", "GroupName", "",
+     "Set Motion enable on selected group"),
+    ("GroupPositionCorrectedProfilerGet", "GroupName,PositionX,PositionY",
+     "double *,double *",
+     "Return corrected profiler positions"),
+    ("GroupStatusGet", "GroupName", "int *",
+     "Return group status"),
+    ("GroupStatusStringGet", "GroupStatusCode", "char *",
+     "Return the group status string corresponding to the group status code"),
+    ("KillAll", "", "",
+     "Put all groups in 'Not initialized' state"),
+    ("RestartApplication", "", "",
+     "Restart the Controller"),
+    ("PositionerBacklashGet", "PositionerName", "double *,char *",
+     "Read backlash value and status"),
+    ("PositionerBacklashSet", "PositionerName,BacklashValue", "",
+     "Set backlash value"),
+    ("PositionerBacklashEnable", "PositionerName", "",
+     "Enable the backlash"),
+    ("PositionerBacklashDisable", "PositionerName", "",
+     "Disable the backlash"),
+    ("PositionerCorrectorNotchFiltersSet",
+     "PositionerName,NotchFrequency1,NotchBandwith1,NotchGain1,NotchFrequency2,NotchBandwith2,NotchGain2",
+     "",
+     "Update filters parameters"),
+    ("PositionerCorrectorNotchFiltersGet", "PositionerName",
+     "double *,double *,double *,double *,double *,double *",
+     "Read filters parameters"),
+    ("PositionerCorrectorPIDFFAccelerationSet",
+     "PositionerName,ClosedLoopStatus,KP,KI,KD,KS,IntegrationTime,DerivativeFilterCutOffFrequency,GKP,GKI,GKD,KForm,FeedForwardGainAcceleration",
+     "",
+     "Update corrector parameters"),
+    ("PositionerCorrectorPIDFFAccelerationGet", "PositionerName",
+     "bool *,double *,double *,double *,double *,double *,double *,double *,double *,double *,double *,double *",
+     "Read corrector parameters"),
+    ("PositionerCorrectorPIDFFVelocitySet",
+     "PositionerName,ClosedLoopStatus,KP,KI,KD,KS,IntegrationTime,DerivativeFilterCutOffFrequency,GKP,GKI,GKD,KForm,FeedForwardGainVelocity",
+     "",
+     "Update corrector parameters"),
+    ("PositionerCorrectorPIDFFVelocityGet", "PositionerName",
+     "bool *,double *,double *,double *,double *,double *,double *,double *,double *,double *,double *,double *",
+     "Read corrector parameters"),
+    ("PositionerCorrectorPIDDualFFVoltageSet",
+     "PositionerName,ClosedLoopStatus,KP,KI,KD,KS,IntegrationTime,DerivativeFilterCutOffFrequency,GKP,GKI,GKD,KForm,FeedForwardGainVelocity,FeedForwardGainAcceleration,Friction",
+     "",
+     "Update corrector parameters"),
+    ("PositionerCorrectorPIDDualFFVoltageGet", "PositionerName",
+     "bool *,double *,double *,double *,double *,double *,double *,double *,double *,double *,double *,double *,double *,double *",
+     "Read corrector parameters"),
+    ("PositionerCorrectorPIPositionSet",
+     "PositionerName,ClosedLoopStatus,KP,KI,IntegrationTime",
+     "",
+     "Update corrector parameters"),
+    ("PositionerCorrectorPIPositionGet", "PositionerName",
+     "bool *,double *,double *,double *",
+     "Read corrector parameters"),
+    ("PositionerCorrectorTypeGet", "PositionerName", "char *",
+     "Read corrector type"),
+    ("PositionerCurrentVelocityAccelerationFiltersSet",
+     "PositionerName,CurrentVelocityCutOffFrequency,CurrentAccelerationCutOffFrequency",
+     "",
+     "Set current velocity and acceleration cut off frequencies"),
+    ("PositionerCurrentVelocityAccelerationFiltersGet", "PositionerName",
+     "double *,double *",
+     "Get current velocity and acceleration cut off frequencies"),
+    ("PositionerDriverStatusGet", "PositionerName", "int *",
+     "Read positioner driver status"),
+    ("PositionerDriverStatusStringGet", "PositionerDriverStatus", "char *",
+     "Return the positioner driver status string corresponding to the "
+     "positioner error code"),
+    ("PositionerEncoderAmplitudeValuesGet", "PositionerName",
+     "double *,double *,double *,double *",
+     "Read analog interpolated encoder amplitude values"),
+    ("PositionerEncoderCalibrationParametersGet", "PositionerName",
+     "double *,double *,double *,double *",
+     "Read analog interpolated encoder calibration parameters"),
+    ("PositionerErrorGet", "PositionerName", "int *",
+     "Read and clear positioner error code"),
+    ("PositionerErrorRead", "PositionerName", "int *",
+     "Read only positioner error code without clear it"),
+    ("PositionerErrorStringGet", "PositionerErrorCode", "char *",
+     "Return the positioner status string corresponding to the positioner "
+     "error code"),
+    ("PositionerHardwareStatusGet", "PositionerName", "int *",
+     "Read positioner hardware status"),
+    ("PositionerHardwareStatusStringGet", "PositionerHardwareStatus", "char *",
+     "Return the positioner hardware status string corresponding to the "
+     "positioner error code"),
+    ("PositionerHardInterpolatorFactorGet", "PositionerName", "int *",
+     "Get hard interpolator parameters"),
+    ("PositionerHardInterpolatorFactorSet",
+     "PositionerName,InterpolationFactor",
+     "",
+     "Set hard interpolator parameters"),
+    ("PositionerMaximumVelocityAndAccelerationGet", "PositionerName",
+     "double *,double *",
+     "Return maximum velocity and acceleration of the positioner"),
+    ("PositionerMotionDoneGet", "PositionerName",
+     "double *,double *,double *,double *,double *",
+     "Read motion done parameters"),
+    ("PositionerMotionDoneSet",
+     "PositionerName,PositionWindow,VelocityWindow,CheckingTime,MeanPeriod,TimeOut",
+     "",
+     "Update motion done parameters"),
+    ("PositionerSGammaExactVelocityAjustedDisplacementGet",
+     "PositionerName,DesiredDisplacement",
+     "double *",
+     "Return adjusted displacement to get exact velocity"),
+    ("PositionerSGammaParametersGet", "PositionerName",
+     "double *,double *,double *,double *",
+     "Read dynamic parameters for one axe of a group for a future "
+     "displacement"),
+    ("PositionerSGammaParametersSet",
+     "PositionerName,Velocity,Acceleration,MinimumTjerkTime,MaximumTjerkTime",
+     "",
+     "Update dynamic parameters for one axe of a group for a future "
+     "displacement"),
+    ("PositionerSGammaParametersDistanceGet",
+     "PositionerName,Displacement,Velocity,Acceleration,MinJerkTime,MaxJerkTime",
+     "double *,double *",
+     "Returns distance during acceleration phase and distance during "
+     "constant velocity phase"),
+    ("PositionerSGammaPreviousMotionTimesGet", "PositionerName",
+     "double *,double *",
+     "Read SettingTime and SettlingTime"),
+    ("PositionerStageParameterGet", "PositionerName,ParameterName", "char *",
+     "Return the stage parameter"),
+    ("PositionerStageParameterSet",
+     "PositionerName,ParameterName,ParameterValue",
+     "",
+     "Save the stage parameter"),
+    ("PositionerUserTravelLimitsGet", "PositionerName", "double *,double *",
+     "Read UserMinimumTarget and UserMaximumTarget"),
+    ("PositionerUserTravelLimitsSet",
+     "PositionerName,UserMinimumTarget,UserMaximumTarget",
+     "",
+     "Update UserMinimumTarget and UserMaximumTarget"),
+    ("HexapodMoveAbsolute", "GroupName,CoordinateSystem,X,Y,Z,U,V,W", "",
+     "Hexapod absolute move in a specific coordinate system"),
+    ("HexapodMoveIncremental", "GroupName,CoordinateSystem,dX,dY,dZ,dU,dV,dW",
+     "",
+     "Hexapod incremental move in a specific coordinate system"),
+    ("HexapodCoordinatesGet",
+     "GroupName,CoordinateSystemIn,CoordinateSystemOut,Xin,Yin,Zin,Uin,Vin,Win",
+     "double *,double *,double *,double *,double *,double *",
+     "Get coordinates in a specific coordinate system of a point specified "
+     "in another coordinate system"),
+    ("HexapodCoordinateSystemSet", "GroupName,CoordinateSystem,X,Y,Z,U,V,W",
+     "",
+     "Modify the position of a coordinate system"),
+    ("HexapodCoordinateSystemGet", "GroupName,CoordinateSystem",
+     "double *,double *,double *,double *,double *,double *",
+     "Get the position of a coordinate system"),
+    ("HexapodMoveIncrementalControl",
+     "GroupName,CoordinateSystem,HexapodTrajectoryType,dX,dY,dZ",
+     "",
+     "Hexapod trajectory (Line, Arc or Rotation) execution with the maximum "
+     "velocity"),
+    ("HexapodMoveIncrementalControlWithTargetVelocity",
+     "GroupName,CoordinateSystem,HexapodTrajectoryType,dX,dY,dZ,Velocity",
+     "",
+     "Hexapod trajectory (Line, Arc or Rotation) execution with a target "
+     "velocity"),
+    ("HexapodMoveIncrementalControlPulseAndGatheringSet", "GroupName,Divisor",
+     "",
+     "Configure gathering with pulses : gathered data are X, Y, Z, U, V, W "
+     "and pulses will be generated during only constant velocity"),
+    ("HexapodMoveIncrementalControlLimitGet",
+     "GroupName,CoordinateSystem,HexapodTrajectoryType,dX,dY,dZ",
+     "double *,double *",
+     "Returns the maximum velocity of carriage and the percent of the "
+     "trajectory executable"),
+    ("HexapodSGammaParametersDistanceGet",
+     "PositionerName,Displacement,Velocity,Acceleration,MinJerkTime,MaxJerkTime",
+     "double *,double *",
+     "Returns distance during acceleration phase and distance during "
+     "constant velocity phase for a virtual SGamma profiler"),
+    ("OptionalModuleExecute", "ModuleFileName,TaskName", "",
+     "Execute an optional module"),
+    ("OptionalModuleKill", "TaskName", "",
+     "Kill an optional module"),
+    ("ControllerStatusGet", "", "int *",
+     "Read controller current status"),
+    ("ControllerStatusStringGet", "ControllerStatusCode", "char *",
+     "Return the controller status string corresponding to the controller "
+     "status code"),
+    ("EEPROMCIESet", "CardNumber,ReferenceString", "",
+     "Set CIE EEPROM reference string"),
+    ("EEPROMDACOffsetCIESet", "PlugNumber,DAC1Offset,DAC2Offset", "",
+     "Set CIE DAC offsets"),
+    ("EEPROMDriverSet", "PlugNumber,ReferenceString", "",
+     "Set Driver EEPROM reference string"),
+    ("EEPROMINTSet", "CardNumber,ReferenceString", "",
+     "Set INT EEPROM reference string"),
+    ("CPUCoreAndBoardSupplyVoltagesGet", "",
+     "double *,double *,double *,double *,double *,double *,double *,double *",
+     "Get power informations"),
+    ("CPUTemperatureAndFanSpeedGet", "", "double *,double *",
+     "Get CPU temperature and fan speed"),
+    ("ActionListGet", "", "char *",
+     "Action list"),
+    ("ActionExtendedListGet", "", "char *",
+     "Action extended list"),
+    ("APIExtendedListGet", "", "char *",
+     "API method list"),
+    ("APIListGet", "", "char *",
+     "API method list without extended API"),
+    ("ErrorListGet", "", "char *",
+     "Error list"),
+    ("EventListGet", "", "char *",
+     "General event list"),
+    ("GatheringListGet", "", "char *",
+     "Gathering type list"),
+    ("GatheringExtendedListGet", "", "char *",
+     "Gathering type extended list"),
+    ("GatheringExternalListGet", "", "char *",
+     "External Gathering type list"),
+    ("GroupStatusListGet", "", "char *",
+     "Group status list"),
+    ("HardwareInternalListGet", "", "char *",
+     "Internal hardware list"),
+    ("HardwareDriverAndStageGet", "PlugNumber", "char *,char *",
+     "Smart hardware"),
+    ("HexapodTrajectoryListGet", "", "char *",
+     "Hexapod trajectory type list"),
+    ("ObjectsListGet", "", "char *",
+     "Group name and positioner name"),
+    ("PositionerErrorListGet", "", "char *",
+     "Positioner error list"),
+    ("PositionerHardwareStatusListGet", "", "char *",
+     "Positioner hardware status list"),
+    ("PositionerDriverStatusListGet", "", "char *",
+     "Positioner driver status list"),
+    ("ReferencingActionListGet", "", "char *",
+     "Get referencing action list"),
+    ("ReferencingSensorListGet", "", "char *",
+     "Get referencing sensor list"),
+    ("GatheringUserDatasGet", "",
+     "double *,double *,double *,double *,double *,double *,double *,double *",
+     "Return UserDatas values"),
+    ("ControllerMotionKernelPeriodMinMaxGet", "",
+     "double *,double *,double *,double *,double *,double *",
+     "Get controller motion kernel min/max periods"),
+    ("ControllerMotionKernelPeriodMinMaxReset", "", "",
+     "Reset controller motion kernel min/max periods"),
+    ("TestTCP", "InputString", "char *",
+     "Test TCP/IP transfert"),
+    ("PrepareForUpdate", "", "",
+     "Kill QNX processes for firmware update"),
+)
+
+# Functions returning their outputs once per element of a group, generated
+# from this table of (name, outputs of an element, description). See
+# common.element_method.
+_ELEMENT_FUNCTIONS = (
+    ("GroupCorrectorOutputGet", "double *",
+     "Return corrector outputs"),
+    ("GroupPositionCurrentGet", "double *",
+     "Return current positions"),
+    ("GroupPositionSetpointGet", "double *",
+     "Return setpoint positions"),
+    ("GroupPositionTargetGet", "double *",
+     "Return target positions"),
+)
+
+add_functions(HXP, [spec for spec in _FUNCTIONS if spec[0] not in HXP._CACHE_TTL])
+add_functions(HXP, [spec for spec in _FUNCTIONS if spec[0] in HXP._CACHE_TTL],
+              call="_cached_call")
+add_element_functions(HXP, _ELEMENT_FUNCTIONS)
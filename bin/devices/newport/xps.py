@@ -7,29 +7,45 @@
 # Modified to use asyncio
 
 import asyncio
-from asyncio import wait_for, ensure_future
+import itertools
+from array import array
+from asyncio import ensure_future
+from collections import deque
 from concurrent.futures import CancelledError
 
-from . import Device, DeviceError, StreamReadWriter
+from . import Device, DeviceError
+from .common import (ConnectionPool, ControllerError, add_element_functions, add_functions,
+                     prototype_parser, time_out)
 
 
 class XPS(Device):
-    """Smartlink device for XPS-Q8 Motion Controller."""
+    """Smartlink device for XPS-Q8 Motion Controller.
+
+    Commands are sent over a pool of `queue_size` connections, plus up to
+    `burst_size` more opened while all of them are busy, and every
+    call holds a connection only while its command is in flight. Methods
+    are therefore re-entrant: independent calls awaited together with
+    asyncio.gather() run concurrently instead of one after another. Calls
+    queued with `post()` are pipelined on a single connection instead.
+    """
     def __init__(self, name="XPS-Q8", group_names=[], interval=0.2,
-            loop=None, queue_size=10):
+            loop=None, queue_size=10, burst_size=10):
         """group_names is a list of group names (eg. Group1) currently in use."""
         super().__init__(name)
         self._loop = loop or asyncio.get_event_loop()
         self._queue_size = queue_size
+        self._burst_size = burst_size
         self._timeout = 60
 
         self._connected = False
-        self._readwriters = []
-        self._queue = asyncio.Queue()
+        self._pool = None
+        self._cache = {}
 
         # XPS-Q8 states
         self._interval = interval
         self._query_task = None
+        self._post_queue = asyncio.Queue()
+        self._post_task = None
         self._comp_amount = 0.01
         self._backlash = False
         self._group_names = group_names
@@ -58,8 +74,6 @@ class XPS(Device):
                 lambda pos, i=i: self.absolute_move(i, pos), grp=group_name)
             self.add_command("Relative move", "float",
                 lambda pos, i=i: self.relative_move(i, pos), grp=group_name)
-            self.add_command("Relative move", "float",
-                lambda pos, i=i: self.relative_move(i, pos), grp=group_name)
 
     def set_backlash(self, backlash):
         """Enable/disable backlash compensation."""
@@ -69,47 +83,404 @@ class XPS(Device):
         self._comp_amount = amount
 
     async def _sendAndReceive(self, command):
-        """Send command and get return."""
+        """Send command and get return. command can be str or bytes."""
+        error, returnedBytes = self._split_return(await self._receive(command))
+        return (error, returnedBytes.decode())
+
+    async def _receive(self, command):
+        """Send command (str or bytes) and get the raw return."""
         if not self._connected:
             self._log_error("Not connected.")
             raise DeviceError
 
-        readwriter = await self._queue.get()
+        if type(command) is str:
+            command = command.encode()
+        # Take an idle connection without suspending if there is one.
+        pool = self._pool
         try:
-            readwriter.write(command.encode())
-            ret = await wait_for(readwriter.readuntil(b",EndOfAPI"), timeout=self._timeout)
+            protocol = pool.queue.get_nowait()
+        except asyncio.QueueEmpty:
+            protocol = await pool.get()
+        try:
+            future = protocol.send(command)
+            timer = self._loop.call_later(self._timeout, time_out, future)
+            try:
+                ret = await future
+            finally:
+                timer.cancel()
         except asyncio.TimeoutError:
             self._log_error("Read timeout.")
+            pool.discard(protocol)
             self.close_connection()
             raise DeviceError
-        except asyncio.IncompleteReadError:
+        except ConnectionError:
             self._log_error("Lost connection to device.")
+            pool.discard(protocol)
             self.close_connection()
             raise DeviceError
-        except asyncio.LimitOverrunError:
-            self._log_error("Read buffer overrun.")
-            self.close_connection()
+        pool.put(protocol)
+        return ret
+
+    async def _exchange(self, commands):
+        """Send commands back-to-back on one connection.
+
+        Returns: a list of the raw returns, in order.
+        """
+        if not self._connected:
+            self._log_error("Not connected.")
             raise DeviceError
-        self._queue.put_nowait(readwriter)
 
-        ret = ret[:-9]
-        error, returnedString = ret.split(b',', 1)
+        pool = self._pool
+        try:
+            protocol = pool.queue.get_nowait()
+        except asyncio.QueueEmpty:
+            protocol = await pool.get()
+        try:
+            futures = protocol.send_many([command.encode() if type(command) is str else command
+                                          for command in commands])
+            future = asyncio.gather(*futures)
+            timer = self._loop.call_later(self._timeout, time_out, future)
+            try:
+                rets = await future
+            finally:
+                timer.cancel()
+        except asyncio.TimeoutError:
+            self._log_error("Read timeout.")
+            pool.discard(protocol)
+            self.close_connection()
+            raise DeviceError
+        except ConnectionError:
+            self._log_error("Lost connection to device.")
+            pool.discard(protocol)
+            self.close_connection()
+            raise DeviceError
+        pool.put(protocol)
+        return rets
+
+    def _split_return(self, ret, log=True):
+        """Split a raw return into error code and returned bytes. A nonzero
+        error code is logged, unless `log` is false, and raised."""
+        # Successful returns are by far the most common, take them with a
+        # prefix test and a single slice.
+        if ret.startswith(b'0,'):
+            return (0, ret[2:-9])
+        error, _, returnedBytes = ret[:-9].partition(b',')
         error = int(error)
-        if error != 0:
-            self._log_error("Device returned error code: {0}".format(str(error)))
+        if error:
+            if log:
+                self._log_error("Device returned error code: {0}".format(str(error)))
+            raise ControllerError(error)
+        return (error, returnedBytes)
+
+    async def _call(self, function, args):
+        """Call the controller `function` with `args` and parse its outputs."""
+        return function.parse(*self._split_return(await self._receive(function.format(args))))
+
+    # Functions whose returns are cached by `_cached_call()`, mapped to the
+    # time to live of a cached return in seconds. None means it is kept until
+    # the connection is closed, as the return never changes in between.
+    _CACHE_TTL = {
+        "ActionListGet": None,
+        "ActionExtendedListGet": None,
+        "APIExtendedListGet": None,
+        "APIListGet": None,
+        "ControllerStatusListGet": None,
+        "ErrorListGet": None,
+        "ErrorStringGet": None,
+        "EventListGet": None,
+        "FirmwareVersionGet": None,
+        "GatheringListGet": None,
+        "GatheringExtendedListGet": None,
+        "GatheringExternalListGet": None,
+        "GroupStatusListGet": None,
+        "HardwareInternalListGet": None,
+        "InstallerVersionGet": None,
+        "ObjectsListGet": None,
+        "PositionerDriverStatusListGet": None,
+        "PositionerErrorListGet": None,
+        "PositionerHardwareStatusListGet": None,
+        "ReferencingActionListGet": None,
+        "ReferencingSensorListGet": None,
+        "SocketsStatusGet": 1.0,
+    }
+
+    async def _cached_call(self, function, args):
+        """Like `_call()`, but reuse the return of an earlier call with the
+        same arguments while it is younger than its `_CACHE_TTL`."""
+        key = (function.name, args)
+        now = self._loop.time()
+        cached = self._cache.get(key)
+        if cached is not None and (cached[0] is None or now < cached[0]):
+            return cached[1]
+        ret = await self._call(function, args)
+        ttl = self._CACHE_TTL[function.name]
+        self._cache[key] = (None if ttl is None else now + ttl, ret)
+        return ret
+
+    async def call_many(self, calls):
+        """Call several generated functions in a single round trip. `calls`
+        is a sequence of (name, args) pairs, e.g.
+        [("PositionerCorrectorNotchFiltersGet", ["Group1.Pos"]), ...].
+
+        Returns: a list of the parsed returns, in the order of `calls`.
+        """
+        functions = [self._functions[name] for name, _ in calls]
+        commands = [function.format(tuple(args))
+                    for function, (_, args) in zip(functions, calls)]
+        rets = await self._exchange(commands)
+        return [function.parse(*self._split_return(ret))
+                for function, ret in zip(functions, rets)]
+
+    async def get_positioner_filters(self, PositionerName):
+        """Read all filter parameters of a positioner in a single round trip.
+
+        Returns: a dict mapping the Get function name to its parsed return.
+        """
+        names = ("PositionerCompensationFrequencyNotchsGet",
+                 "PositionerCompensationLowPassTwoFilterGet",
+                 "PositionerCompensationNotchModeFiltersGet",
+                 "PositionerCompensationPhaseCorrectionFiltersGet",
+                 "PositionerCompensationSpatialPeriodicNotchsGet",
+                 "PositionerCorrectorNotchFiltersGet")
+        rets = await self.call_many([(name, [PositionerName]) for name in names])
+        return dict(zip(names, rets))
+
+    async def read_telemetry(self, group_names=None):
+        """Read the CPU supply voltages, CPU temperature and fan speed, and
+        the spin current of `group_names` (default: the groups in use) in a
+        single round trip.
+
+        Returns: a dict mapping "CPUCoreAndBoardSupplyVoltagesGet",
+        "CPUTemperatureAndFanSpeedGet" and every group name to its parsed
+        return.
+        """
+        if group_names is None:
+            group_names = self._group_names
+        calls = [("CPUCoreAndBoardSupplyVoltagesGet", ()),
+                 ("CPUTemperatureAndFanSpeedGet", ())]
+        calls += [("GroupSpinCurrentGet", [group_name]) for group_name in group_names]
+        rets = await self.call_many(calls)
+        keys = [name for name, _ in calls[:2]] + list(group_names)
+        return dict(zip(keys, rets))
+
+    # Get functions read by `read_diagnostics()`.
+    _DIAGNOSTICS = ("ControllerMotionKernelMinMaxTimeLoadGet",
+                    "ControllerMotionKernelPeriodMinMaxGet",
+                    "ISRCorrectorCompensateOverrunNumberGet")
+
+    async def read_diagnostics(self):
+        """Read the minimum and maximum motion kernel time load and period,
+        and the number of corrector ISR overruns in a single round trip.
+
+        Returns: a dict mapping every function in `_DIAGNOSTICS` to its
+        parsed return.
+        """
+        rets = await self.call_many([(name, ()) for name in self._DIAGNOSTICS])
+        return dict(zip(self._DIAGNOSTICS, rets))
+
+    # Positioner state fields readable with `gather_state()`, mapped to the
+    # Get function returning them and their index in its return.
+    _STATE_FIELDS = {
+        "MaximumVelocity": ("PositionerMaximumVelocityAndAccelerationGet", 1),
+        "MaximumAcceleration": ("PositionerMaximumVelocityAndAccelerationGet", 2),
+        "PositionWindow": ("PositionerMotionDoneGet", 1),
+        "VelocityWindow": ("PositionerMotionDoneGet", 2),
+        "CheckingTime": ("PositionerMotionDoneGet", 3),
+        "MeanPeriod": ("PositionerMotionDoneGet", 4),
+        "TimeOut": ("PositionerMotionDoneGet", 5),
+        "Velocity": ("PositionerSGammaParametersGet", 1),
+        "Acceleration": ("PositionerSGammaParametersGet", 2),
+        "MinimumTjerkTime": ("PositionerSGammaParametersGet", 3),
+        "MaximumTjerkTime": ("PositionerSGammaParametersGet", 4),
+        "SettingTime": ("PositionerSGammaPreviousMotionTimesGet", 1),
+        "SettlingTime": ("PositionerSGammaPreviousMotionTimesGet", 2),
+        "UserMinimumTarget": ("PositionerUserTravelLimitsGet", 1),
+        "UserMaximumTarget": ("PositionerUserTravelLimitsGet", 2),
+        "WarningFollowingError": ("PositionerWarningFollowingErrorGet", 1),
+    }
+
+    async def gather_state(self, positioners, fields):
+        """Read state `fields` (see `_STATE_FIELDS`) of every positioner in
+        `positioners`. Each Get function needed is called once per
+        positioner, and all calls are pipelined in a single round trip.
+
+        Returns: a dict mapping each positioner to a dict of its fields.
+        """
+        names = []
+        for field in fields:
+            name = self._STATE_FIELDS[field][0]
+            if name not in names:
+                names.append(name)
+        rets = iter(await self.call_many(
+            [(name, [positioner]) for positioner in positioners for name in names]))
+        state = {}
+        for positioner in positioners:
+            returns = dict(zip(names, rets))
+            values = state[positioner] = {}
+            for field in fields:
+                name, index = self._STATE_FIELDS[field]
+                values[field] = returns[name][index]
+        return state
+
+    async def batched_scan(self, calls, window=16):
+        """Call generated functions from the iterable `calls` of (name, args)
+        pairs on one connection, keeping up to `window` calls in flight.
+        Calls are sent in batches whenever half of the window is free.
+        `calls` is consumed lazily, so it may be a generator.
+
+        Yields: (call, parsed return) pairs, in the order of `calls`.
+        """
+        if not self._connected:
+            self._log_error("Not connected.")
+            raise DeviceError
+
+        pool = self._pool
+        try:
+            protocol = pool.queue.get_nowait()
+        except asyncio.QueueEmpty:
+            protocol = await pool.get()
+        pending = deque()
+        failed = False
+        try:
+            calls = iter(calls)
+            while True:
+                # Top up the window once it is half empty, writing all new
+                # commands in one go rather than one write per call.
+                if len(pending) <= window // 2:
+                    batch = []
+                    for call in calls:
+                        batch.append(call)
+                        if len(pending) + len(batch) >= window:
+                            break
+                    if batch:
+                        functions = [self._functions[name] for name, _ in batch]
+                        futures = protocol.send_many(
+                            [function.format(tuple(args))
+                             for function, (_, args) in zip(functions, batch)])
+                        pending.extend(zip(batch, functions, futures))
+                if not pending:
+                    break
+                call, function, future = pending.popleft()
+                timer = self._loop.call_later(self._timeout, time_out, future)
+                try:
+                    ret = await future
+                finally:
+                    timer.cancel()
+                yield call, function.parse(*self._split_return(ret))
+        except asyncio.TimeoutError:
+            failed = True
+            self._log_error("Read timeout.")
+            pool.discard(protocol)
+            self.close_connection()
             raise DeviceError
-        return (error, returnedString.decode())
+        except ConnectionError:
+            failed = True
+            self._log_error("Lost connection to device.")
+            pool.discard(protocol)
+            self.close_connection()
+            raise DeviceError
+        finally:
+            # Returns of calls still in flight are discarded by the protocol.
+            if not failed:
+                pool.put(protocol)
+
+    async def sample(self, name, args, count, window=16):
+        """Call the generated Get function `name` with `args` `count` times
+        through `batched_scan()`, e.g. to record positions for a plot.
+
+        Returns: an array.array('d') holding the outputs of every call one
+        after another, which stores the samples unboxed and can be passed
+        to numpy.frombuffer() without a copy.
+        """
+        samples = array('d')
+        async for _, ret in self.batched_scan(itertools.repeat((name, args), count), window):
+            samples.extend(ret[1:])
+        return samples
+
+    async def load_trajectory(self, GroupName, parts, function="XYPVTLoadToMemory",
+            window=8):
+        """Load the trajectory `parts` (e.g. lines of a PVT file) of
+        `GroupName` into memory with `function`, one of XYPVTLoadToMemory,
+        TZPVTLoadToMemory and MultipleAxesPVTLoadToMemory. Up to `window`
+        parts are in flight at once, instead of a round trip per part.
+        """
+        async for _ in self.batched_scan(((function, (GroupName, part)) for part in parts),
+                                         window):
+            pass
+
+    async def verify_trajectories(self, trajectories, kind="XYLineArc"):
+        """Verify the (GroupName, TrajectoryFileName) pairs `trajectories`
+        concurrently, each on its own connection, with the verification
+        function of `kind`: "XYLineArc", "XYPVT", "XYZSpline", "TZPVT" or
+        "MultipleAxesPVT".
+
+        Yields: (trajectory, parsed return) pairs as the verifications
+        complete. A failed verification yields its ControllerError in place
+        of the return, and is not logged as a device error.
+        """
+        function = self._functions[kind + "Verification"]
+
+        async def verify(trajectory):
+            ret = await self._receive(function.format(tuple(trajectory)))
+            try:
+                return trajectory, function.parse(*self._split_return(ret, log=False))
+            except ControllerError as e:
+                return trajectory, e
+
+        for future in asyncio.as_completed([verify(trajectory) for trajectory in trajectories]):
+            yield await future
+
+    def post(self, name, *args):
+        """Queue a call of the generated function `name` with `args` and
+        return without waiting for the controller. Queued calls are sent by
+        `_post_writer()`, all pending ones in a single round trip.
+
+        Returns: a future of the parsed return, which may be ignored.
+        """
+        if not self._connected:
+            self._log_error("Not connected.")
+            raise DeviceError
+        function = self._functions[name]
+        future = self._loop.create_future()
+        self._post_queue.put_nowait((function, function.format(args), future))
+        return future
+
+    async def _post_writer(self):
+        """Send the calls queued by `post()` and resolve their futures."""
+        try:
+            while True:
+                batch = [await self._post_queue.get()]
+                while not self._post_queue.empty():
+                    batch.append(self._post_queue.get_nowait())
+                try:
+                    rets = await self._exchange([command for _, command, _ in batch])
+                except DeviceError:
+                    for _, _, future in batch:
+                        future.cancel()
+                    continue
+                for (function, _, future), ret in zip(batch, rets):
+                    try:
+                        future.set_result(function.parse(*self._split_return(ret)))
+                    except DeviceError as e:
+                        future.set_exception(e)
+        except CancelledError:
+            return
 
     async def _query(self):
-        """Periodically query group position and status."""
+        """Periodically query group position and status.
+
+        The status and position of all groups are pipelined in one round trip.
+        """
+        commands = []
+        for group_name in self._group_names:
+            commands.append('GroupStatusGet({},int *)'.format(group_name).encode())
+            commands.append('GroupPositionCurrentGet({},double *)'.format(group_name).encode())
         try:
             while True:
-                for i in range(self._group_num):
-                    group_name = self._group_names[i]
-                    status = await self.GroupStatusGet(group_name)
-                    self._group_status[i] = int(status[1])
-                    position = await self.GroupPositionCurrentGet(group_name, 1)
-                    self._group_positions[i] = float(position[1])
+                rets = iter(await self._exchange(commands))
+                for i, (status, position) in enumerate(zip(rets, rets)):
+                    self._group_status[i] = int(self._split_return(status)[1])
+                    self._group_positions[i] = float(self._split_return(position)[1])
                 await asyncio.sleep(self._interval)
         except CancelledError:
             return
@@ -169,11 +540,11 @@ class XPS(Device):
         if self._connected:
             self._log_warning("Already connected.")
             return
+        # Devices of the same controller share its connections.
         try:
-            for i in range(self._queue_size):
-                readwriter = StreamReadWriter(*await wait_for(asyncio.open_connection(IP, port), timeout=self._timeout))
-                self._readwriters.append(readwriter)
-                self._queue.put_nowait(readwriter)
+            self._pool = await ConnectionPool.acquire(
+                self._loop, IP, port, self._queue_size, self._timeout,
+                self._burst_size)
         except asyncio.TimeoutError:
             self._log_error("Connection timeout.")
             self.close_connection()
@@ -182,3206 +553,844 @@ class XPS(Device):
             self._log_exception("Failed to connect to {host}:{port}".format(host=IP, port=port))
             self.close_connection()
             raise DeviceError
+        if (self._pool.size, self._pool.burst) != (self._queue_size, self._burst_size):
+            self._log_warning(
+                "Sharing the connections to {host}:{port} of another device, with "
+                "queue_size={size} and burst_size={burst}.".format(
+                    host=IP, port=port, size=self._pool.size, burst=self._pool.burst))
         self._connected = True
         await self.init_device()
 
     async def init_device(self):
         """Initilize device after a successful `open_connection()`."""
         self._query_task = ensure_future(self._query())
+        self._post_task = ensure_future(self._post_writer())
 
     def close_connection(self):
         self._connected = False
         if self._query_task is not None:
             self._query_task.cancel()
             self._query_task = None
-        for readwriter in self._readwriters:
-            readwriter.close()
-        self._readwriters.clear()
-        self._queue = asyncio.Queue()
+        if self._post_task is not None:
+            self._post_task.cancel()
+            self._post_task = None
+        while not self._post_queue.empty():
+            self._post_queue.get_nowait()[2].cancel()
+        if self._pool is not None:
+            self._pool.release()
+            self._pool = None
+        self._cache.clear()
 
     # GetLibraryVersion
     def GetLibraryVersion(self):
         return ['XPS-Q8 Firmware Precision Platform V1.4.x']
 
-    # ControllerMotionKernelTimeLoadGet :  Get controller motion kernel time
-    # load
-    async def ControllerMotionKernelTimeLoadGet(self):
-        command = 'ControllerMotionKernelTimeLoadGet(double *,double *,double *,double *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        if (error != 0):
-            return (error, returnedString)
-
-        i, j, retList = 0, 0, [error]
-        for paramNb in range(4):
-            while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-                j += 1
-            retList.append(eval(returnedString[i:i + j]))
-            i, j = i + j + 1, 0
-
-        return retList
-
-    # ControllerRTTimeGet :  Get controller corrector period and calculation
-    # time
-    async def ControllerRTTimeGet(self):
-        command = 'ControllerRTTimeGet(double *,double *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        if (error != 0):
-            return (error, returnedString)
-
-        i, j, retList = 0, 0, [error]
-        for paramNb in range(2):
-            while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-                j += 1
-            retList.append(eval(returnedString[i:i + j]))
-            i, j = i + j + 1, 0
-
-        return retList
-
-    # ControllerSlaveStatusGet :  Read slave controller status
-    async def ControllerSlaveStatusGet(self):
-        command = 'ControllerSlaveStatusGet(int *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        if (error != 0):
-            return (error, returnedString)
-
-        i, j, retList = 0, 0, [error]
-        while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-            j += 1
-        retList.append(eval(returnedString[i:i + j]))
-
-        return retList
-
-    # ControllerSlaveStatusStringGet :  Return the slave controller status
-    # string
-    async def ControllerSlaveStatusStringGet(self, SlaveControllerStatusCode):
-        command = 'ControllerSlaveStatusStringGet(' + str(
-            SlaveControllerStatusCode) + ',char *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # ControllerSynchronizeCorrectorISR :  Synchronize controller corrector ISR
-    async def ControllerSynchronizeCorrectorISR(self, ModeString):
-        command = 'ControllerSynchronizeCorrectorISR(' + ModeString + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # ControllerStatusGet :  Get controller current status and reset the status
-    async def ControllerStatusGet(self):
-        command = 'ControllerStatusGet(int *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        if (error != 0):
-            return (error, returnedString)
-
-        i, j, retList = 0, 0, [error]
-        while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-            j += 1
-        retList.append(eval(returnedString[i:i + j]))
-
-        return retList
-
-    # ControllerStatusRead :  Read controller current status
-    async def ControllerStatusRead(self):
-        command = 'ControllerStatusRead(int *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        if (error != 0):
-            return (error, returnedString)
-
-        i, j, retList = 0, 0, [error]
-        while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-            j += 1
-        retList.append(eval(returnedString[i:i + j]))
-
-        return retList
-
-    # ControllerStatusStringGet :  Return the controller status string
-    async def ControllerStatusStringGet(self, ControllerStatusCode):
-        command = 'ControllerStatusStringGet(' + \
-            str(ControllerStatusCode) + ',char *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # ElapsedTimeGet :  Return elapsed time from controller power on
-    async def ElapsedTimeGet(self):
-        command = 'ElapsedTimeGet(double *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        if (error != 0):
-            return (error, returnedString)
-
-        i, j, retList = 0, 0, [error]
-        while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-            j += 1
-        retList.append(eval(returnedString[i:i + j]))
-
-        return retList
-
-    # ErrorStringGet :  Return the error string corresponding to the error code
-    async def ErrorStringGet(self, ErrorCode):
-        command = 'ErrorStringGet(' + str(ErrorCode) + ',char *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # FirmwareVersionGet :  Return firmware version
-    async def FirmwareVersionGet(self):
-        command = 'FirmwareVersionGet(char *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # InstallerVersionGet :  Return installer version
-    async def InstallerVersionGet(self):
-        command = 'InstallerVersionGet(char *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # TCLScriptExecute :  Execute a TCL script from a TCL file
-    async def TCLScriptExecute(self, TCLFileName, TaskName, ParametersList):
-        command = 'TCLScriptExecute(' + TCLFileName + \
-            ',' + TaskName + ',' + ParametersList + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # TCLScriptExecuteAndWait :  Execute a TCL script from a TCL file and wait
-    # the end of execution to return
-    async def TCLScriptExecuteAndWait(self, TCLFileName, TaskName, InputParametersList):
-        command = 'TCLScriptExecuteAndWait(' + TCLFileName + \
-            ',' + TaskName + ',' + InputParametersList + ',char *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # TCLScriptExecuteWithPriority :  Execute a TCL script with defined
-    # priority
-    async def TCLScriptExecuteWithPriority(self, TCLFileName, TaskName, TaskPriorityLevel, ParametersList):
-        command = 'TCLScriptExecuteWithPriority(' + TCLFileName + ',' + \
-            TaskName + ',' + TaskPriorityLevel + ',' + ParametersList + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # TCLScriptKill :  Kill TCL Task
-    async def TCLScriptKill(self, TaskName):
-        command = 'TCLScriptKill(' + TaskName + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # TCLScriptKillAll :  Kill all TCL Tasks
-    async def TCLScriptKillAll(self):
-        command = 'TCLScriptKillAll()'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # TimerGet :  Get a timer
-    async def TimerGet(self, TimerName):
-        command = 'TimerGet(' + TimerName + ',int *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        if (error != 0):
-            return (error, returnedString)
-
-        i, j, retList = 0, 0, [error]
-        while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-            j += 1
-        retList.append(eval(returnedString[i:i + j]))
-
-        return retList
-
-    # TimerSet :  Set a timer
-    async def TimerSet(self, TimerName, FrequencyTicks):
-        command = 'TimerSet(' + TimerName + ',' + str(FrequencyTicks) + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # Reboot :  Reboot the controller
-    async def Reboot(self):
-        command = 'Reboot()'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # Login :  Log in
-    async def Login(self, Name, Password):
-        command = 'Login(' + Name + ',' + Password + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # CloseAllOtherSockets :  Close all socket beside the one used to send
-    # this command
-    async def CloseAllOtherSockets(self):
-        command = 'CloseAllOtherSockets()'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # HardwareDateAndTimeGet :  Return hardware date and time
-    async def HardwareDateAndTimeGet(self):
-        command = 'HardwareDateAndTimeGet(char *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # HardwareDateAndTimeSet :  Set hardware date and time
-    async def HardwareDateAndTimeSet(self, DateAndTime):
-        command = 'HardwareDateAndTimeSet(' + DateAndTime + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # EventAdd :  ** OBSOLETE ** Add an event
-    async def EventAdd(self, PositionerName, EventName, EventParameter, ActionName, ActionParameter1, ActionParameter2, ActionParameter3):
-        command = 'EventAdd(' + PositionerName + ',' + EventName + ',' + EventParameter + ',' + \
-            ActionName + ',' + ActionParameter1 + ',' + \
-            ActionParameter2 + ',' + ActionParameter3 + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # EventGet :  ** OBSOLETE ** Read events and actions list
-    async def EventGet(self, PositionerName):
-        command = 'EventGet(' + PositionerName + ',char *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # EventRemove :  ** OBSOLETE ** Delete an event
-    async def EventRemove(self, PositionerName, EventName, EventParameter):
-        command = 'EventRemove(' + PositionerName + ',' + \
-            EventName + ',' + EventParameter + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # EventWait :  ** OBSOLETE ** Wait an event
-    async def EventWait(self, PositionerName, EventName, EventParameter):
-        command = 'EventWait(' + PositionerName + ',' + \
-            EventName + ',' + EventParameter + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
     # EventExtendedConfigurationTriggerSet :  Configure one or several events
     async def EventExtendedConfigurationTriggerSet(self, ExtendedEventName, EventParameter1, EventParameter2, EventParameter3, EventParameter4):
-        command = 'EventExtendedConfigurationTriggerSet('
-        for i in range(len(ExtendedEventName)):
-            if (i > 0):
-                command += ','
-            command += ExtendedEventName[i] + ',' + EventParameter1[i] + ',' + \
-                EventParameter2[i] + ',' + \
-                EventParameter3[i] + ',' + EventParameter4[i]
-        command += ')'
-
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # EventExtendedConfigurationTriggerGet :  Read the event configuration
-    async def EventExtendedConfigurationTriggerGet(self):
-        command = 'EventExtendedConfigurationTriggerGet(char *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
+        command = 'EventExtendedConfigurationTriggerSet(%s)' % ','.join(
+            [','.join(map(str, event)) for event in zip(
+                ExtendedEventName, EventParameter1, EventParameter2, EventParameter3,
+                EventParameter4)])
+        return await self._sendAndReceive(command)
 
     # EventExtendedConfigurationActionSet :  Configure one or several actions
     async def EventExtendedConfigurationActionSet(self, ExtendedActionName, ActionParameter1, ActionParameter2, ActionParameter3, ActionParameter4):
-        command = 'EventExtendedConfigurationActionSet('
-        for i in range(len(ExtendedActionName)):
-            if (i > 0):
-                command += ','
-            command += ExtendedActionName[i] + ',' + ActionParameter1[i] + ',' + \
-                ActionParameter2[i] + ',' + \
-                ActionParameter3[i] + ',' + ActionParameter4[i]
-        command += ')'
-
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # EventExtendedConfigurationActionGet :  Read the action configuration
-    async def EventExtendedConfigurationActionGet(self):
-        command = 'EventExtendedConfigurationActionGet(char *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # EventExtendedStart :  Launch the last event and action configuration and
-    # return an ID
-    async def EventExtendedStart(self):
-        command = 'EventExtendedStart(int *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        if (error != 0):
-            return (error, returnedString)
-
-        i, j, retList = 0, 0, [error]
-        while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-            j += 1
-        retList.append(eval(returnedString[i:i + j]))
-
-        return retList
-
-    # EventExtendedAllGet :  Read all event and action configurations
-    async def EventExtendedAllGet(self):
-        command = 'EventExtendedAllGet(char *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # EventExtendedGet :  Read the event and action configuration defined by ID
-    async def EventExtendedGet(self, ID):
-        command = 'EventExtendedGet(' + str(ID) + ',char *,char *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # EventExtendedRemove :  Remove the event and action configuration defined
-    # by ID
-    async def EventExtendedRemove(self, ID):
-        command = 'EventExtendedRemove(' + str(ID) + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # EventExtendedWait :  Wait events from the last event configuration
-    async def EventExtendedWait(self):
-        command = 'EventExtendedWait()'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # GatheringConfigurationGet : Read different mnemonique type
-    async def GatheringConfigurationGet(self):
-        command = 'GatheringConfigurationGet(char *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # GatheringConfigurationSet :  Configuration acquisition
-    async def GatheringConfigurationSet(self, Type):
-        command = 'GatheringConfigurationSet('
-        for i in range(len(Type)):
-            if (i > 0):
-                command += ','
-            command += Type[i]
-        command += ')'
-
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # GatheringCurrentNumberGet :  Maximum number of samples and current
-    # number during acquisition
-    async def GatheringCurrentNumberGet(self):
-        command = 'GatheringCurrentNumberGet(int *,int *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        if (error != 0):
-            return (error, returnedString)
-
-        i, j, retList = 0, 0, [error]
-        for paramNb in range(2):
-            while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-                j += 1
-            retList.append(eval(returnedString[i:i + j]))
-            i, j = i + j + 1, 0
-
-        return retList
-
-    # GatheringStopAndSave :  Stop acquisition and save data
-    async def GatheringStopAndSave(self):
-        command = 'GatheringStopAndSave()'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # GatheringDataAcquire :  Acquire a configured data
-    async def GatheringDataAcquire(self):
-        command = 'GatheringDataAcquire()'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # GatheringDataGet :  Get a data line from gathering buffer
-    async def GatheringDataGet(self, IndexPoint):
-        command = 'GatheringDataGet(' + str(IndexPoint) + ',char *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # GatheringDataMultipleLinesGet :  Get multiple data lines from gathering
-    # buffer
-    async def GatheringDataMultipleLinesGet(self, IndexPoint, NumberOfLines):
-        command = 'GatheringDataMultipleLinesGet(' + str(
-            IndexPoint) + ',' + str(NumberOfLines) + ',char *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # GatheringReset :  Empty the gathered data in memory to start new
-    # gathering from scratch
-    async def GatheringReset(self):
-        command = 'GatheringReset()'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # GatheringRun :  Start a new gathering
-    async def GatheringRun(self, DataNumber, Divisor):
-        command = 'GatheringRun(' + str(DataNumber) + ',' + str(Divisor) + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # GatheringRunAppend :  Re-start the stopped gathering to add new data
-    async def GatheringRunAppend(self):
-        command = 'GatheringRunAppend()'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # GatheringStop :  Stop the data gathering (without saving to file)
-    async def GatheringStop(self):
-        command = 'GatheringStop()'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # GatheringExternalConfigurationSet :  Configuration acquisition
-    async def GatheringExternalConfigurationSet(self, Type):
-        command = 'GatheringExternalConfigurationSet('
-        for i in range(len(Type)):
-            if (i > 0):
-                command += ','
-            command += Type[i]
-        command += ')'
-
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # GatheringExternalConfigurationGet :  Read different mnemonique type
-    async def GatheringExternalConfigurationGet(self):
-        command = 'GatheringExternalConfigurationGet(char *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # GatheringExternalCurrentNumberGet :  Maximum number of samples and
-    # current number during acquisition
-    async def GatheringExternalCurrentNumberGet(self):
-        command = 'GatheringExternalCurrentNumberGet(int *,int *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        if (error != 0):
-            return (error, returnedString)
-
-        i, j, retList = 0, 0, [error]
-        for paramNb in range(2):
-            while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-                j += 1
-            retList.append(eval(returnedString[i:i + j]))
-            i, j = i + j + 1, 0
-
-        return retList
-
-    # GatheringExternalDataGet :  Get a data line from external gathering
-    # buffer
-    async def GatheringExternalDataGet(self, IndexPoint):
-        command = 'GatheringExternalDataGet(' + str(IndexPoint) + ',char *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # GatheringExternalStopAndSave :  Stop acquisition and save data
-    async def GatheringExternalStopAndSave(self):
-        command = 'GatheringExternalStopAndSave()'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # GlobalArrayGet :  Get global array value
-    async def GlobalArrayGet(self, Number):
-        command = 'GlobalArrayGet(' + str(Number) + ',char *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # GlobalArraySet :  Set global array value
-    async def GlobalArraySet(self, Number, ValueString):
-        command = 'GlobalArraySet(' + str(Number) + ',' + ValueString + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # DoubleGlobalArrayGet :  Get double global array value
-    async def DoubleGlobalArrayGet(self, Number):
-        command = 'DoubleGlobalArrayGet(' + str(Number) + ',double *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        if (error != 0):
-            return (error, returnedString)
-
-        i, j, retList = 0, 0, [error]
-        while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-            j += 1
-        retList.append(eval(returnedString[i:i + j]))
-
-        return retList
-
-    # DoubleGlobalArraySet :  Set double global array value
-    async def DoubleGlobalArraySet(self, Number, DoubleValue):
-        command = 'DoubleGlobalArraySet(' + \
-            str(Number) + ',' + str(DoubleValue) + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
+        command = 'EventExtendedConfigurationActionSet(%s)' % ','.join(
+            [','.join(map(str, action)) for action in zip(
+                ExtendedActionName, ActionParameter1, ActionParameter2, ActionParameter3,
+                ActionParameter4)])
+        return await self._sendAndReceive(command)
 
     # GPIOAnalogGet :  Read analog input or analog output for one or few input
     async def GPIOAnalogGet(self, GPIOName):
-        command = 'GPIOAnalogGet('
-        for i in range(len(GPIOName)):
-            if (i > 0):
-                command += ','
-            command += GPIOName[i] + ',' + 'double *'
-        command += ')'
-
-        (error, returnedString) = await self._sendAndReceive(command)
-        if (error != 0):
-            return (error, returnedString)
-
-        i, j, retList = 0, 0, [error]
-        for paramNb in range(len(GPIOName)):
-            while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-                j += 1
-            retList.append(eval(returnedString[i:i + j]))
-            i, j = i + j + 1, 0
-
-        return retList
+        command = 'GPIOAnalogGet(%s)' % ','.join([name + ',double *' for name in GPIOName])
+        outputs = ','.join(['double *'] * len(GPIOName))
+        return prototype_parser(outputs)(*self._split_return(await self._receive(command)))
 
     # GPIOAnalogSet :  Set analog output for one or few output
     async def GPIOAnalogSet(self, GPIOName, AnalogOutputValue):
-        command = 'GPIOAnalogSet('
-        for i in range(len(GPIOName)):
-            if (i > 0):
-                command += ','
-            command += GPIOName[i] + ',' + str(AnalogOutputValue[i])
-        command += ')'
-
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
+        command = 'GPIOAnalogSet(%s)' % ','.join(
+            ['%s,%s' % output for output in zip(GPIOName, AnalogOutputValue)])
+        return await self._sendAndReceive(command)
 
     # GPIOAnalogGainGet :  Read analog input gain (1, 2, 4 or 8) for one or
     # few input
     async def GPIOAnalogGainGet(self, GPIOName):
-        command = 'GPIOAnalogGainGet('
-        for i in range(len(GPIOName)):
-            if (i > 0):
-                command += ','
-            command += GPIOName[i] + ',' + 'int *'
-        command += ')'
-
-        (error, returnedString) = await self._sendAndReceive(command)
-        if (error != 0):
-            return (error, returnedString)
-
-        i, j, retList = 0, 0, [error]
-        for paramNb in range(len(GPIOName)):
-            while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-                j += 1
-            retList.append(eval(returnedString[i:i + j]))
-            i, j = i + j + 1, 0
-
-        return retList
+        command = 'GPIOAnalogGainGet(%s)' % ','.join([name + ',int *' for name in GPIOName])
+        outputs = ','.join(['int *'] * len(GPIOName))
+        return prototype_parser(outputs)(*self._split_return(await self._receive(command)))
 
     # GPIOAnalogGainSet :  Set analog input gain (1, 2, 4 or 8) for one or few
     # input
     async def GPIOAnalogGainSet(self, GPIOName, AnalogInputGainValue):
-        command = 'GPIOAnalogGainSet('
-        for i in range(len(GPIOName)):
-            if (i > 0):
-                command += ','
-            command += GPIOName[i] + ',' + str(AnalogInputGainValue[i])
-        command += ')'
-
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # GPIODigitalGet :  Read digital output or digital input
-    async def GPIODigitalGet(self, GPIOName):
-        command = 'GPIODigitalGet(' + GPIOName + ',unsigned short *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        if (error != 0):
-            return (error, returnedString)
-
-        i, j, retList = 0, 0, [error]
-        while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-            j += 1
-        retList.append(eval(returnedString[i:i + j]))
-
-        return retList
-
-    # GPIODigitalSet :  Set Digital Output for one or few output TTL
-    async def GPIODigitalSet(self, GPIOName, Mask, DigitalOutputValue):
-        command = 'GPIODigitalSet(' + GPIOName + ',' + \
-            str(Mask) + ',' + str(DigitalOutputValue) + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # GroupAccelerationSetpointGet :  Return setpoint accelerations
-    async def GroupAccelerationSetpointGet(self, GroupName, nbElement):
-        command = 'GroupAccelerationSetpointGet(' + GroupName + ','
-        for i in range(nbElement):
-            if (i > 0):
-                command += ','
-            command += 'double *'
-        command += ')'
-
-        (error, returnedString) = await self._sendAndReceive(command)
-        if (error != 0):
-            return (error, returnedString)
-
-        i, j, retList = 0, 0, [error]
-        for paramNb in range(nbElement):
-            while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-                j += 1
-            retList.append(eval(returnedString[i:i + j]))
-            i, j = i + j + 1, 0
-
-        return retList
-
-    # GroupAnalogTrackingModeEnable :  Enable Analog Tracking mode on selected
-    # group
-    async def GroupAnalogTrackingModeEnable(self, GroupName, Type):
-        command = 'GroupAnalogTrackingModeEnable(' + \
-            GroupName + ',' + Type + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # GroupAnalogTrackingModeDisable :  Disable Analog Tracking mode on
-    # selected group
-    async def GroupAnalogTrackingModeDisable(self, GroupName):
-        command = 'GroupAnalogTrackingModeDisable(' + GroupName + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # GroupCorrectorOutputGet :  Return corrector outputs
-    async def GroupCorrectorOutputGet(self, GroupName, nbElement):
-        command = 'GroupCorrectorOutputGet(' + GroupName + ','
-        for i in range(nbElement):
-            if (i > 0):
-                command += ','
-            command += 'double *'
-        command += ')'
-
-        (error, returnedString) = await self._sendAndReceive(command)
-        if (error != 0):
-            return (error, returnedString)
-
-        i, j, retList = 0, 0, [error]
-        for paramNb in range(nbElement):
-            while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-                j += 1
-            retList.append(eval(returnedString[i:i + j]))
-            i, j = i + j + 1, 0
-
-        return retList
-
-    # GroupCurrentFollowingErrorGet :  Return current following errors
-    async def GroupCurrentFollowingErrorGet(self, GroupName, nbElement):
-        command = 'GroupCurrentFollowingErrorGet(' + GroupName + ','
-        for i in range(nbElement):
-            if (i > 0):
-                command += ','
-            command += 'double *'
-        command += ')'
-
-        (error, returnedString) = await self._sendAndReceive(command)
-        if (error != 0):
-            return (error, returnedString)
-
-        i, j, retList = 0, 0, [error]
-        for paramNb in range(nbElement):
-            while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-                j += 1
-            retList.append(eval(returnedString[i:i + j]))
-            i, j = i + j + 1, 0
-
-        return retList
-
-    # GroupHomeSearch :  Start home search sequence
-    async def GroupHomeSearch(self, GroupName):
-        command = 'GroupHomeSearch(' + GroupName + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # GroupHomeSearchAndRelativeMove :  Start home search sequence and execute
-    # a displacement
-    async def GroupHomeSearchAndRelativeMove(self, GroupName, TargetDisplacement):
-        command = 'GroupHomeSearchAndRelativeMove(' + GroupName + ','
-        for i in range(len(TargetDisplacement)):
-            if (i > 0):
-                command += ','
-            command += str(TargetDisplacement[i])
-        command += ')'
-
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # GroupInitialize :  Start the initialization
-    async def GroupInitialize(self, GroupName):
-        command = 'GroupInitialize(' + GroupName + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # GroupInitializeNoEncoderReset :  Group initialization with no encoder
-    # reset
-    async def GroupInitializeNoEncoderReset(self, GroupName):
-        command = 'GroupInitializeNoEncoderReset(' + GroupName + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # GroupInitializeWithEncoderCalibration :  Group initialization with
-    # encoder calibration
-    async def GroupInitializeWithEncoderCalibration(self, GroupName):
-        command = 'GroupInitializeWithEncoderCalibration(' + GroupName + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # GroupInterlockDisable :  Set group interlock disable
-    async def GroupInterlockDisable(self, GroupName):
-        command = 'GroupInterlockDisable(' + GroupName + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # GroupInterlockEnable :  Set group interlock enable
-    async def GroupInterlockEnable(self, GroupName):
-        command = 'GroupInterlockEnable(' + GroupName + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
+        command = 'GPIOAnalogGainSet(%s)' % ','.join(
+            ['%s,%s' % gain for gain in zip(GPIOName, AnalogInputGainValue)])
+        return await self._sendAndReceive(command)
 
     # GroupJogParametersSet :  Modify Jog parameters on selected group and
     # activate the continuous move
     async def GroupJogParametersSet(self, GroupName, Velocity, Acceleration):
-        command = 'GroupJogParametersSet(' + GroupName + ','
-        for i in range(len(Velocity)):
-            if (i > 0):
-                command += ','
-            command += str(Velocity[i]) + ',' + str(Acceleration[i])
-        command += ')'
-
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # GroupJogParametersGet :  Get Jog parameters on selected group
-    async def GroupJogParametersGet(self, GroupName, nbElement):
-        command = 'GroupJogParametersGet(' + GroupName + ','
-        for i in range(nbElement):
-            if (i > 0):
-                command += ','
-            command += 'double *' + ',' + 'double *'
-        command += ')'
-
-        (error, returnedString) = await self._sendAndReceive(command)
-        if (error != 0):
-            return (error, returnedString)
-
-        i, j, retList = 0, 0, [error]
-        for paramNb in range(nbElement * 2):
-            while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-                j += 1
-            retList.append(eval(returnedString[i:i + j]))
-            i, j = i + j + 1, 0
-
-        return retList
-
-    # GroupJogCurrentGet :  Get Jog current on selected group
-    async def GroupJogCurrentGet(self, GroupName, nbElement):
-        command = 'GroupJogCurrentGet(' + GroupName + ','
-        for i in range(nbElement):
-            if (i > 0):
-                command += ','
-            command += 'double *' + ',' + 'double *'
-        command += ')'
-
-        (error, returnedString) = await self._sendAndReceive(command)
-        if (error != 0):
-            return (error, returnedString)
-
-        i, j, retList = 0, 0, [error]
-        for paramNb in range(nbElement * 2):
-            while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-                j += 1
-            retList.append(eval(returnedString[i:i + j]))
-            i, j = i + j + 1, 0
-
-        return retList
-
-    # GroupJogModeEnable :  Enable Jog mode on selected group
-    async def GroupJogModeEnable(self, GroupName):
-        command = 'GroupJogModeEnable(' + GroupName + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # GroupJogModeDisable :  Disable Jog mode on selected group
-    async def GroupJogModeDisable(self, GroupName):
-        command = 'GroupJogModeDisable(' + GroupName + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # GroupKill :  Kill the group
-    async def GroupKill(self, GroupName):
-        command = 'GroupKill(' + GroupName + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # GroupMotionDisable :  Set Motion disable on selected group
-    async def GroupMotionDisable(self, GroupName):
-        command = 'GroupMotionDisable(' + GroupName + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # GroupMotionEnable :  Set Motion enable on selected group
-    async def GroupMotionEnable(self, GroupName):
-        command = 'GroupMotionEnable(' + GroupName + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # GroupMotionStatusGet :  Return group or positioner status
-    async def GroupMotionStatusGet(self, GroupName, nbElement):
-        command = 'GroupMotionStatusGet(' + GroupName + ','
-        for i in range(nbElement):
-            if (i > 0):
-                command += ','
-            command += 'int *'
-        command += ')'
-
-        (error, returnedString) = await self._sendAndReceive(command)
-        if (error != 0):
-            return (error, returnedString)
-
-        i, j, retList = 0, 0, [error]
-        for paramNb in range(nbElement):
-            while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-                j += 1
-            retList.append(eval(returnedString[i:i + j]))
-            i, j = i + j + 1, 0
-
-        return retList
-
-    # GroupMoveAbort :  Abort a move
-    async def GroupMoveAbort(self, GroupName):
-        command = 'GroupMoveAbort(' + GroupName + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # GroupMoveAbortFast :  Abort quickly a move
-    async def GroupMoveAbortFast(self, GroupName, AccelerationMultiplier):
-        command = 'GroupMoveAbortFast(' + GroupName + \
-            ',' + str(AccelerationMultiplier) + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # GroupMoveAbsolute :  Do an absolute move
-    async def GroupMoveAbsolute(self, GroupName, TargetPosition):
-        command = 'GroupMoveAbsolute(' + GroupName + ','
-        for i in range(len(TargetPosition)):
-            if (i > 0):
-                command += ','
-            command += str(TargetPosition[i])
-        command += ')'
-
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # GroupMoveRelative :  Do a relative move
-    async def GroupMoveRelative(self, GroupName, TargetDisplacement):
-        command = 'GroupMoveRelative(' + GroupName + ','
-        for i in range(len(TargetDisplacement)):
-            if (i > 0):
-                command += ','
-            command += str(TargetDisplacement[i])
-        command += ')'
-
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # GroupPositionCorrectedProfilerGet :  Return corrected profiler positions
-    async def GroupPositionCorrectedProfilerGet(self, GroupName, PositionX, PositionY):
-        command = 'GroupPositionCorrectedProfilerGet(' + GroupName + ',' + str(
-            PositionX) + ',' + str(PositionY) + ',double *,double *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        if (error != 0):
-            return (error, returnedString)
-
-        i, j, retList = 0, 0, [error]
-        for paramNb in range(2):
-            while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-                j += 1
-            retList.append(eval(returnedString[i:i + j]))
-            i, j = i + j + 1, 0
-
-        return retList
-
-    # GroupPositionCurrentGet :  Return current positions
-    async def GroupPositionCurrentGet(self, GroupName, nbElement):
-        command = 'GroupPositionCurrentGet(' + GroupName + ','
-        for i in range(nbElement):
-            if (i > 0):
-                command += ','
-            command += 'double *'
-        command += ')'
-
-        (error, returnedString) = await self._sendAndReceive(command)
-        if (error != 0):
-            return (error, returnedString)
-
-        i, j, retList = 0, 0, [error]
-        for paramNb in range(nbElement):
-            while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-                j += 1
-            retList.append(eval(returnedString[i:i + j]))
-            i, j = i + j + 1, 0
-
-        return retList
-
-    # GroupPositionPCORawEncoderGet :  Return PCO raw encoder positions
-    async def GroupPositionPCORawEncoderGet(self, GroupName, PositionX, PositionY):
-        command = 'GroupPositionPCORawEncoderGet(' + GroupName + ',' + str(
-            PositionX) + ',' + str(PositionY) + ',double *,double *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        if (error != 0):
-            return (error, returnedString)
-
-        i, j, retList = 0, 0, [error]
-        for paramNb in range(2):
-            while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-                j += 1
-            retList.append(eval(returnedString[i:i + j]))
-            i, j = i + j + 1, 0
-
-        return retList
-
-    # GroupPositionSetpointGet :  Return setpoint positions
-    async def GroupPositionSetpointGet(self, GroupName, nbElement):
-        command = 'GroupPositionSetpointGet(' + GroupName + ','
-        for i in range(nbElement):
-            if (i > 0):
-                command += ','
-            command += 'double *'
-        command += ')'
-
-        (error, returnedString) = await self._sendAndReceive(command)
-        if (error != 0):
-            return (error, returnedString)
-
-        i, j, retList = 0, 0, [error]
-        for paramNb in range(nbElement):
-            while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-                j += 1
-            retList.append(eval(returnedString[i:i + j]))
-            i, j = i + j + 1, 0
-
-        return retList
-
-    # GroupPositionTargetGet :  Return target positions
-    async def GroupPositionTargetGet(self, GroupName, nbElement):
-        command = 'GroupPositionTargetGet(' + GroupName + ','
-        for i in range(nbElement):
-            if (i > 0):
-                command += ','
-            command += 'double *'
-        command += ')'
-
-        (error, returnedString) = await self._sendAndReceive(command)
-        if (error != 0):
-            return (error, returnedString)
-
-        i, j, retList = 0, 0, [error]
-        for paramNb in range(nbElement):
-            while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-                j += 1
-            retList.append(eval(returnedString[i:i + j]))
-            i, j = i + j + 1, 0
-
-        return retList
-
-    # GroupReferencingActionExecute :  Execute an action in referencing mode
-    async def GroupReferencingActionExecute(self, PositionerName, ReferencingAction, ReferencingSensor, ReferencingParameter):
-        command = 'GroupReferencingActionExecute(' + PositionerName + ',' + ReferencingAction + \
-            ',' + ReferencingSensor + ',' + str(ReferencingParameter) + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # GroupReferencingStart :  Enter referencing mode
-    async def GroupReferencingStart(self, GroupName):
-        command = 'GroupReferencingStart(' + GroupName + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # GroupReferencingStop :  Exit referencing mode
-    async def GroupReferencingStop(self, GroupName):
-        command = 'GroupReferencingStop(' + GroupName + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # GroupStatusGet :  Return group status
-    async def GroupStatusGet(self, GroupName):
-        command = 'GroupStatusGet(' + GroupName + ',int *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        if (error != 0):
-            return (error, returnedString)
-
-        i, j, retList = 0, 0, [error]
-        while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-            j += 1
-        retList.append(eval(returnedString[i:i + j]))
-
-        return retList
-
-    # GroupStatusStringGet :  Return the group status string corresponding to
-    # the group status code
-    async def GroupStatusStringGet(self, GroupStatusCode):
-        command = 'GroupStatusStringGet(' + str(GroupStatusCode) + ',char *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # GroupVelocityCurrentGet :  Return current velocities
-    async def GroupVelocityCurrentGet(self, GroupName, nbElement):
-        command = 'GroupVelocityCurrentGet(' + GroupName + ','
-        for i in range(nbElement):
-            if (i > 0):
-                command += ','
-            command += 'double *'
-        command += ')'
-
-        (error, returnedString) = await self._sendAndReceive(command)
-        if (error != 0):
-            return (error, returnedString)
-
-        i, j, retList = 0, 0, [error]
-        for paramNb in range(nbElement):
-            while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-                j += 1
-            retList.append(eval(returnedString[i:i + j]))
-            i, j = i + j + 1, 0
-
-        return retList
-
-    # KillAll :  Put all groups in 'Not initialized' state
-    async def KillAll(self):
-        command = 'KillAll()'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # RestartApplication :  Restart the Controller
-    async def RestartApplication(self):
-        command = 'RestartApplication()'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # PositionerAnalogTrackingPositionParametersGet :  Read dynamic parameters
-    # for one axe of a group for a future analog tracking position
-    async def PositionerAnalogTrackingPositionParametersGet(self, PositionerName):
-        command = 'PositionerAnalogTrackingPositionParametersGet(' + \
-            PositionerName + ',char *,double *,double *,double *,double *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        if (error != 0):
-            return (error, returnedString)
-
-        i, j, retList = 0, 0, [error]
-        for paramNb in range(4):
-            while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-                j += 1
-            retList.append(eval(returnedString[i:i + j]))
-            i, j = i + j + 1, 0
-
-        return retList
-
-    # PositionerAnalogTrackingPositionParametersSet :  Update dynamic
-    # parameters for one axe of a group for a future analog tracking position
-    async def PositionerAnalogTrackingPositionParametersSet(self, PositionerName, GPIOName, Offset, Scale, Velocity, Acceleration):
-        command = 'PositionerAnalogTrackingPositionParametersSet(' + PositionerName + ',' + GPIOName + ',' + str(
-            Offset) + ',' + str(Scale) + ',' + str(Velocity) + ',' + str(Acceleration) + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # PositionerAnalogTrackingVelocityParametersGet :  Read dynamic parameters
-    # for one axe of a group for a future analog tracking velocity
-    async def PositionerAnalogTrackingVelocityParametersGet(self, PositionerName):
-        command = 'PositionerAnalogTrackingVelocityParametersGet(' + PositionerName + \
-            ',char *,double *,double *,double *,int *,double *,double *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        if (error != 0):
-            return (error, returnedString)
-
-        i, j, retList = 0, 0, [error]
-        for paramNb in range(6):
-            while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-                j += 1
-            retList.append(eval(returnedString[i:i + j]))
-            i, j = i + j + 1, 0
-
-        return retList
-
-    # PositionerAnalogTrackingVelocityParametersSet :  Update dynamic
-    # parameters for one axe of a group for a future analog tracking velocity
-    async def PositionerAnalogTrackingVelocityParametersSet(self, PositionerName, GPIOName, Offset, Scale, DeadBandThreshold, Order, Velocity, Acceleration):
-        command = 'PositionerAnalogTrackingVelocityParametersSet(' + PositionerName + ',' + GPIOName + ',' + str(Offset) + ',' + str(
-            Scale) + ',' + str(DeadBandThreshold) + ',' + str(Order) + ',' + str(Velocity) + ',' + str(Acceleration) + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # PositionerBacklashGet :  Read backlash value and status
-    async def PositionerBacklashGet(self, PositionerName):
-        command = 'PositionerBacklashGet(' + \
-            PositionerName + ',double *,char *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        if (error != 0):
-            return (error, returnedString)
-
-        i, j, retList = 0, 0, [error]
-        for paramNb in range(2):
-            while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-                j += 1
-            retList.append(eval(returnedString[i:i + j]))
-            i, j = i + j + 1, 0
-
-        return retList
-
-    # PositionerBacklashSet :  Set backlash value
-    async def PositionerBacklashSet(self, PositionerName, BacklashValue):
-        command = 'PositionerBacklashSet(' + PositionerName + \
-            ',' + str(BacklashValue) + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # PositionerBacklashEnable :  Enable the backlash
-    async def PositionerBacklashEnable(self, PositionerName):
-        command = 'PositionerBacklashEnable(' + PositionerName + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # PositionerBacklashDisable :  Disable the backlash
-    async def PositionerBacklashDisable(self, PositionerName):
-        command = 'PositionerBacklashDisable(' + PositionerName + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # PositionerCompensatedPCOAbort :  Abort CIE08 compensated PCO mode
-    async def PositionerCompensatedPCOAbort(self, PositionerName):
-        command = 'PositionerCompensatedPCOAbort(' + PositionerName + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # PositionerCompensatedPCOCurrentStatusGet :  Get current status of CIE08
-    # compensated PCO mode
-    async def PositionerCompensatedPCOCurrentStatusGet(self, PositionerName):
-        command = 'PositionerCompensatedPCOCurrentStatusGet(' + \
-            PositionerName + ',int *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        if (error != 0):
-            return (error, returnedString)
-
-        i, j, retList = 0, 0, [error]
-        while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-            j += 1
-        retList.append(eval(returnedString[i:i + j]))
-
-        return retList
-
-    # PositionerCompensatedPCOEnable :  Enable CIE08 compensated PCO mode
-    # execution
-    async def PositionerCompensatedPCOEnable(self, PositionerName):
-        command = 'PositionerCompensatedPCOEnable(' + PositionerName + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # PositionerCompensatedPCOFromFile :  Load file to CIE08 compensated PCO
-    # data buffer
-    async def PositionerCompensatedPCOFromFile(self, PositionerName, DataFileName):
-        command = 'PositionerCompensatedPCOFromFile(' + \
-            PositionerName + ',' + DataFileName + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # PositionerCompensatedPCOLoadToMemory :  Load data lines to CIE08
-    # compensated PCO data buffer
-    async def PositionerCompensatedPCOLoadToMemory(self, PositionerName, DataLines):
-        command = 'PositionerCompensatedPCOLoadToMemory(' + \
-            PositionerName + ',' + DataLines + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # PositionerCompensatedPCOMemoryReset :  Reset CIE08 compensated PCO data
-    # buffer
-    async def PositionerCompensatedPCOMemoryReset(self, PositionerName):
-        command = 'PositionerCompensatedPCOMemoryReset(' + PositionerName + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # PositionerCompensatedPCOPrepare :  Prepare data for CIE08 compensated
-    # PCO mode
-    async def PositionerCompensatedPCOPrepare(self, PositionerName, ScanDirection, StartPosition):
-        command = 'PositionerCompensatedPCOPrepare(' + \
-            PositionerName + ',' + ScanDirection + ','
-        for i in range(len(StartPosition)):
-            if (i > 0):
-                command += ','
-            command += str(StartPosition[i])
-        command += ')'
-
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # PositionerCompensatedPCOSet :  Set data to CIE08 compensated PCO data
-    # buffer
-    async def PositionerCompensatedPCOSet(self, PositionerName, Start, Stop, Distance, Width):
-        command = 'PositionerCompensatedPCOSet(' + PositionerName + ',' + str(
-            Start) + ',' + str(Stop) + ',' + str(Distance) + ',' + str(Width) + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # PositionerCompensationFrequencyNotchsGet :  Read frequency compensation
-    # notch filters parameters
-    async def PositionerCompensationFrequencyNotchsGet(self, PositionerName):
-        command = 'PositionerCompensationFrequencyNotchsGet(' + PositionerName + \
-            ',double *,double *,double *,double *,double *,double *,double *,double *,double *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        if (error != 0):
-            return (error, returnedString)
-
-        i, j, retList = 0, 0, [error]
-        for paramNb in range(9):
-            while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-                j += 1
-            retList.append(eval(returnedString[i:i + j]))
-            i, j = i + j + 1, 0
-
-        return retList
-
-    # PositionerCompensationFrequencyNotchsSet :  Update frequency
-    # compensation notch filters parameters
-    async def PositionerCompensationFrequencyNotchsSet(self, PositionerName, NotchFrequency1, NotchBandwidth1, NotchGain1, NotchFrequency2, NotchBandwidth2, NotchGain2, NotchFrequency3, NotchBandwidth3, NotchGain3):
-        command = 'PositionerCompensationFrequencyNotchsSet(' + PositionerName + ',' + str(NotchFrequency1) + ',' + str(NotchBandwidth1) + ',' + str(NotchGain1) + ',' + str(
-            NotchFrequency2) + ',' + str(NotchBandwidth2) + ',' + str(NotchGain2) + ',' + str(NotchFrequency3) + ',' + str(NotchBandwidth3) + ',' + str(NotchGain3) + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # PositionerCompensationLowPassTwoFilterGet :  Read second order low-pass
-    # filter parameters
-    async def PositionerCompensationLowPassTwoFilterGet(self, PositionerName):
-        command = 'PositionerCompensationLowPassTwoFilterGet(' + \
-            PositionerName + ',double *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        if (error != 0):
-            return (error, returnedString)
-
-        i, j, retList = 0, 0, [error]
-        while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-            j += 1
-        retList.append(eval(returnedString[i:i + j]))
-
-        return retList
-
-    # PositionerCompensationLowPassTwoFilterSet :  Update second order
-    # low-pass filter parameters
-    async def PositionerCompensationLowPassTwoFilterSet(self, PositionerName, CutOffFrequency):
-        command = 'PositionerCompensationLowPassTwoFilterSet(' + PositionerName + ',' + str(
-            CutOffFrequency) + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # PositionerCompensationNotchModeFiltersGet :  Read notch mode filters
-    # parameters
-    async def PositionerCompensationNotchModeFiltersGet(self, PositionerName):
-        command = 'PositionerCompensationNotchModeFiltersGet(' + PositionerName + \
-            ',double *,double *,double *,double *,double *,double *,double *,double *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        if (error != 0):
-            return (error, returnedString)
-
-        i, j, retList = 0, 0, [error]
-        for paramNb in range(8):
-            while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-                j += 1
-            retList.append(eval(returnedString[i:i + j]))
-            i, j = i + j + 1, 0
-
-        return retList
-
-    # PositionerCompensationNotchModeFiltersSet :  Update notch mode filters
-    # parameters
-    async def PositionerCompensationNotchModeFiltersSet(self, PositionerName, NotchModeFr1, NotchModeFa1, NotchModeZr1, NotchModeZa1, NotchModeFr2, NotchModeFa2, NotchModeZr2, NotchModeZa2):
-        command = 'PositionerCompensationNotchModeFiltersSet(' + PositionerName + ',' + str(NotchModeFr1) + ',' + str(NotchModeFa1) + ',' + str(
-            NotchModeZr1) + ',' + str(NotchModeZa1) + ',' + str(NotchModeFr2) + ',' + str(NotchModeFa2) + ',' + str(NotchModeZr2) + ',' + str(NotchModeZa2) + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # PositionerCompensationPhaseCorrectionFiltersGet :  Read phase correction
-    # filters parameters
-    async def PositionerCompensationPhaseCorrectionFiltersGet(self, PositionerName):
-        command = 'PositionerCompensationPhaseCorrectionFiltersGet(' + PositionerName + \
-            ',double *,double *,double *,double *,double *,double *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        if (error != 0):
-            return (error, returnedString)
-
-        i, j, retList = 0, 0, [error]
-        for paramNb in range(6):
-            while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-                j += 1
-            retList.append(eval(returnedString[i:i + j]))
-            i, j = i + j + 1, 0
-
-        return retList
-
-    # PositionerCompensationPhaseCorrectionFiltersSet :  Update phase
-    # correction filters parameters
-    async def PositionerCompensationPhaseCorrectionFiltersSet(self, PositionerName, PhaseCorrectionFn1, PhaseCorrectionFd1, PhaseCorrectionGain1, PhaseCorrectionFn2, PhaseCorrectionFd2, PhaseCorrectionGain2):
-        command = 'PositionerCompensationPhaseCorrectionFiltersSet(' + PositionerName + ',' + str(PhaseCorrectionFn1) + ',' + str(PhaseCorrectionFd1) + ',' + str(
-            PhaseCorrectionGain1) + ',' + str(PhaseCorrectionFn2) + ',' + str(PhaseCorrectionFd2) + ',' + str(PhaseCorrectionGain2) + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # PositionerCompensationSpatialPeriodicNotchsGet :  Read spatial
-    # compensation notch filters parameters
-    async def PositionerCompensationSpatialPeriodicNotchsGet(self, PositionerName):
-        command = 'PositionerCompensationSpatialPeriodicNotchsGet(' + PositionerName + \
-            ',double *,double *,double *,double *,double *,double *,double *,double *,double *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        if (error != 0):
-            return (error, returnedString)
-
-        i, j, retList = 0, 0, [error]
-        for paramNb in range(9):
-            while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-                j += 1
-            retList.append(eval(returnedString[i:i + j]))
-            i, j = i + j + 1, 0
-
-        return retList
-
-    # PositionerCompensationSpatialPeriodicNotchsSet :  Update spatial
-    # compensation notch filters parameters
-    async def PositionerCompensationSpatialPeriodicNotchsSet(self, PositionerName, SpatialNotchStep1, SpatialNotchBandwidth1, SpatialNotchGain1, SpatialNotchStep2, SpatialNotchBandwidth2, SpatialNotchGain2, SpatialNotchStep3, SpatialNotchBandwidth3, SpatialNotchGain3):
-        command = 'PositionerCompensationSpatialPeriodicNotchsSet(' + PositionerName + ',' + str(SpatialNotchStep1) + ',' + str(SpatialNotchBandwidth1) + ',' + str(SpatialNotchGain1) + ',' + str(
-            SpatialNotchStep2) + ',' + str(SpatialNotchBandwidth2) + ',' + str(SpatialNotchGain2) + ',' + str(SpatialNotchStep3) + ',' + str(SpatialNotchBandwidth3) + ',' + str(SpatialNotchGain3) + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # PositionerCorrectorNotchFiltersSet :  Update filters parameters
-    async def PositionerCorrectorNotchFiltersSet(self, PositionerName, NotchFrequency1, NotchBandwidth1, NotchGain1, NotchFrequency2, NotchBandwidth2, NotchGain2):
-        command = 'PositionerCorrectorNotchFiltersSet(' + PositionerName + ',' + str(NotchFrequency1) + ',' + str(
-            NotchBandwidth1) + ',' + str(NotchGain1) + ',' + str(NotchFrequency2) + ',' + str(NotchBandwidth2) + ',' + str(NotchGain2) + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # PositionerCorrectorNotchFiltersGet :  Read filters parameters
-    async def PositionerCorrectorNotchFiltersGet(self, PositionerName):
-        command = 'PositionerCorrectorNotchFiltersGet(' + PositionerName + \
-            ',double *,double *,double *,double *,double *,double *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        if (error != 0):
-            return (error, returnedString)
-
-        i, j, retList = 0, 0, [error]
-        for paramNb in range(6):
-            while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-                j += 1
-            retList.append(eval(returnedString[i:i + j]))
-            i, j = i + j + 1, 0
-
-        return retList
-
-    # PositionerCorrectorPIDBaseSet :  Update PIDBase parameters
-    async def PositionerCorrectorPIDBaseSet(self, PositionerName, MovingMass, StaticMass, Viscosity, Stiffness):
-        command = 'PositionerCorrectorPIDBaseSet(' + PositionerName + ',' + str(
-            MovingMass) + ',' + str(StaticMass) + ',' + str(Viscosity) + ',' + str(Stiffness) + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # PositionerCorrectorPIDBaseGet :  Read PIDBase parameters
-    async def PositionerCorrectorPIDBaseGet(self, PositionerName):
-        command = 'PositionerCorrectorPIDBaseGet(' + PositionerName + \
-            ',double *,double *,double *,double *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        if (error != 0):
-            return (error, returnedString)
-
-        i, j, retList = 0, 0, [error]
-        for paramNb in range(4):
-            while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-                j += 1
-            retList.append(eval(returnedString[i:i + j]))
-            i, j = i + j + 1, 0
-
-        return retList
-
-    # PositionerCorrectorPIDFFAccelerationSet :  Update corrector parameters
-    async def PositionerCorrectorPIDFFAccelerationSet(self, PositionerName, ClosedLoopStatus, KP, KI, KD, KS, IntegrationTime, DerivativeFilterCutOffFrequency, GKP, GKI, GKD, KForm, KFeedForwardAcceleration, KFeedForwardJerk):
-        command = 'PositionerCorrectorPIDFFAccelerationSet(' + PositionerName + ',' + str(ClosedLoopStatus) + ',' + str(KP) + ',' + str(KI) + ',' + str(KD) + ',' + str(KS) + ',' + str(IntegrationTime) + ',' + str(
-            DerivativeFilterCutOffFrequency) + ',' + str(GKP) + ',' + str(GKI) + ',' + str(GKD) + ',' + str(KForm) + ',' + str(KFeedForwardAcceleration) + ',' + str(KFeedForwardJerk) + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # PositionerCorrectorPIDFFAccelerationGet :  Read corrector parameters
-    async def PositionerCorrectorPIDFFAccelerationGet(self, PositionerName):
-        command = 'PositionerCorrectorPIDFFAccelerationGet(' + PositionerName + \
-            ',bool *,double *,double *,double *,double *,double *,double *,double *,double *,double *,double *,double *,double *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        if (error != 0):
-            return (error, returnedString)
-
-        i, j, retList = 0, 0, [error]
-        for paramNb in range(13):
-            while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-                j += 1
-            retList.append(eval(returnedString[i:i + j]))
-            i, j = i + j + 1, 0
-
-        return retList
-
-    # PositionerCorrectorP2IDFFAccelerationSet :  Update corrector parameters
-    async def PositionerCorrectorP2IDFFAccelerationSet(self, PositionerName, ClosedLoopStatus, KP, KI, KI2, KD, KS, IntegrationTime, DerivativeFilterCutOffFrequency, GKP, GKI, GKD, KForm, KFeedForwardAcceleration, KFeedForwardJerk, SetpointPositionDelay):
-        command = 'PositionerCorrectorP2IDFFAccelerationSet(' + PositionerName + ',' + str(ClosedLoopStatus) + ',' + str(KP) + ',' + str(KI) + ',' + str(KI2) + ',' + str(KD) + ',' + str(KS) + ',' + str(IntegrationTime) + ',' + str(
-            DerivativeFilterCutOffFrequency) + ',' + str(GKP) + ',' + str(GKI) + ',' + str(GKD) + ',' + str(KForm) + ',' + str(KFeedForwardAcceleration) + ',' + str(KFeedForwardJerk) + ',' + str(SetpointPositionDelay) + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # PositionerCorrectorP2IDFFAccelerationGet :  Read corrector parameters
-    async def PositionerCorrectorP2IDFFAccelerationGet(self, PositionerName):
-        command = 'PositionerCorrectorP2IDFFAccelerationGet(' + PositionerName + \
-            ',bool *,double *,double *,double *,double *,double *,double *,double *,double *,double *,double *,double *,double *,double *,double *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        if (error != 0):
-            return (error, returnedString)
-
-        i, j, retList = 0, 0, [error]
-        for paramNb in range(15):
-            while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-                j += 1
-            retList.append(eval(returnedString[i:i + j]))
-            i, j = i + j + 1, 0
-
-        return retList
-
-    # PositionerCorrectorPIDFFVelocitySet :  Update corrector parameters
-    async def PositionerCorrectorPIDFFVelocitySet(self, PositionerName, ClosedLoopStatus, KP, KI, KD, KS, IntegrationTime, DerivativeFilterCutOffFrequency, GKP, GKI, GKD, KForm, KFeedForwardVelocity):
-        command = 'PositionerCorrectorPIDFFVelocitySet(' + PositionerName + ',' + str(ClosedLoopStatus) + ',' + str(KP) + ',' + str(KI) + ',' + str(KD) + ',' + str(KS) + ',' + str(
-            IntegrationTime) + ',' + str(DerivativeFilterCutOffFrequency) + ',' + str(GKP) + ',' + str(GKI) + ',' + str(GKD) + ',' + str(KForm) + ',' + str(KFeedForwardVelocity) + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # PositionerCorrectorPIDFFVelocityGet :  Read corrector parameters
-    async def PositionerCorrectorPIDFFVelocityGet(self, PositionerName):
-        command = 'PositionerCorrectorPIDFFVelocityGet(' + PositionerName + \
-            ',bool *,double *,double *,double *,double *,double *,double *,double *,double *,double *,double *,double *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        if (error != 0):
-            return (error, returnedString)
-
-        i, j, retList = 0, 0, [error]
-        for paramNb in range(12):
-            while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-                j += 1
-            retList.append(eval(returnedString[i:i + j]))
-            i, j = i + j + 1, 0
-
-        return retList
-
-    # PositionerCorrectorPIDDualFFVoltageSet :  Update corrector parameters
-    async def PositionerCorrectorPIDDualFFVoltageSet(self, PositionerName, ClosedLoopStatus, KP, KI, KD, KS, IntegrationTime, DerivativeFilterCutOffFrequency, GKP, GKI, GKD, KForm, KFeedForwardVelocity, KFeedForwardAcceleration, Friction):
-        command = 'PositionerCorrectorPIDDualFFVoltageSet(' + PositionerName + ',' + str(ClosedLoopStatus) + ',' + str(KP) + ',' + str(KI) + ',' + str(KD) + ',' + str(KS) + ',' + str(IntegrationTime) + ',' + str(
-            DerivativeFilterCutOffFrequency) + ',' + str(GKP) + ',' + str(GKI) + ',' + str(GKD) + ',' + str(KForm) + ',' + str(KFeedForwardVelocity) + ',' + str(KFeedForwardAcceleration) + ',' + str(Friction) + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # PositionerCorrectorPIDDualFFVoltageGet :  Read corrector parameters
-    async def PositionerCorrectorPIDDualFFVoltageGet(self, PositionerName):
-        command = 'PositionerCorrectorPIDDualFFVoltageGet(' + PositionerName + \
-            ',bool *,double *,double *,double *,double *,double *,double *,double *,double *,double *,double *,double *,double *,double *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        if (error != 0):
-            return (error, returnedString)
-
-        i, j, retList = 0, 0, [error]
-        for paramNb in range(14):
-            while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-                j += 1
-            retList.append(eval(returnedString[i:i + j]))
-            i, j = i + j + 1, 0
-
-        return retList
-
-    # PositionerCorrectorPIPositionSet :  Update corrector parameters
-    async def PositionerCorrectorPIPositionSet(self, PositionerName, ClosedLoopStatus, KP, KI, IntegrationTime):
-        command = 'PositionerCorrectorPIPositionSet(' + PositionerName + ',' + str(
-            ClosedLoopStatus) + ',' + str(KP) + ',' + str(KI) + ',' + str(IntegrationTime) + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # PositionerCorrectorPIPositionGet :  Read corrector parameters
-    async def PositionerCorrectorPIPositionGet(self, PositionerName):
-        command = 'PositionerCorrectorPIPositionGet(' + \
-            PositionerName + ',bool *,double *,double *,double *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        if (error != 0):
-            return (error, returnedString)
-
-        i, j, retList = 0, 0, [error]
-        for paramNb in range(4):
-            while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-                j += 1
-            retList.append(eval(returnedString[i:i + j]))
-            i, j = i + j + 1, 0
-
-        return retList
-
-    # PositionerCorrectorSR1AccelerationSet :  Update corrector parameters
-    async def PositionerCorrectorSR1AccelerationSet(self, PositionerName, ClosedLoopStatus, KP, KI, KV, ObserverFrequency, CompensationGainVelocity, CompensationGainAcceleration, CompensationGainJerk):
-        command = 'PositionerCorrectorSR1AccelerationSet(' + PositionerName + ',' + str(ClosedLoopStatus) + ',' + str(KP) + ',' + str(KI) + ',' + str(
-            KV) + ',' + str(ObserverFrequency) + ',' + str(CompensationGainVelocity) + ',' + str(CompensationGainAcceleration) + ',' + str(CompensationGainJerk) + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # PositionerCorrectorSR1AccelerationGet :  Read corrector parameters
-    async def PositionerCorrectorSR1AccelerationGet(self, PositionerName):
-        command = 'PositionerCorrectorSR1AccelerationGet(' + PositionerName + \
-            ',bool *,double *,double *,double *,double *,double *,double *,double *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        if (error != 0):
-            return (error, returnedString)
-
-        i, j, retList = 0, 0, [error]
-        for paramNb in range(8):
-            while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-                j += 1
-            retList.append(eval(returnedString[i:i + j]))
-            i, j = i + j + 1, 0
-
-        return retList
-
-    # PositionerCorrectorSR1ObserverAccelerationSet :  Update SR1 corrector
-    # observer parameters
-    async def PositionerCorrectorSR1ObserverAccelerationSet(self, PositionerName, ParameterA, ParameterB, ParameterC):
-        command = 'PositionerCorrectorSR1ObserverAccelerationSet(' + PositionerName + ',' + str(
-            ParameterA) + ',' + str(ParameterB) + ',' + str(ParameterC) + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # PositionerCorrectorSR1ObserverAccelerationGet :  Read SR1 corrector
-    # observer parameters
-    async def PositionerCorrectorSR1ObserverAccelerationGet(self, PositionerName):
-        command = 'PositionerCorrectorSR1ObserverAccelerationGet(' + \
-            PositionerName + ',double *,double *,double *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        if (error != 0):
-            return (error, returnedString)
-
-        i, j, retList = 0, 0, [error]
-        for paramNb in range(3):
-            while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-                j += 1
-            retList.append(eval(returnedString[i:i + j]))
-            i, j = i + j + 1, 0
-
-        return retList
-
-    # PositionerCorrectorSR1OffsetAccelerationSet :  Update SR1 corrector
-    # output acceleration offset
-    async def PositionerCorrectorSR1OffsetAccelerationSet(self, PositionerName, AccelerationOffset):
-        command = 'PositionerCorrectorSR1OffsetAccelerationSet(' + PositionerName + ',' + str(
-            AccelerationOffset) + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # PositionerCorrectorSR1OffsetAccelerationGet :  Read SR1 corrector output
-    # acceleration offset
-    async def PositionerCorrectorSR1OffsetAccelerationGet(self, PositionerName):
-        command = 'PositionerCorrectorSR1OffsetAccelerationGet(' + \
-            PositionerName + ',double *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        if (error != 0):
-            return (error, returnedString)
-
-        i, j, retList = 0, 0, [error]
-        while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-            j += 1
-        retList.append(eval(returnedString[i:i + j]))
-
-        return retList
-
-    # PositionerCorrectorTypeGet :  Read corrector type
-    async def PositionerCorrectorTypeGet(self, PositionerName):
-        command = 'PositionerCorrectorTypeGet(' + PositionerName + ',char *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # PositionerCurrentVelocityAccelerationFiltersSet :  Set current velocity
-    # and acceleration cut off frequencies
-    async def PositionerCurrentVelocityAccelerationFiltersSet(self, PositionerName, CurrentVelocityCutOffFrequency, CurrentAccelerationCutOffFrequency):
-        command = 'PositionerCurrentVelocityAccelerationFiltersSet(' + PositionerName + ',' + str(
-            CurrentVelocityCutOffFrequency) + ',' + str(CurrentAccelerationCutOffFrequency) + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # PositionerCurrentVelocityAccelerationFiltersGet :  Get current velocity
-    # and acceleration cut off frequencies
-    async def PositionerCurrentVelocityAccelerationFiltersGet(self, PositionerName):
-        command = 'PositionerCurrentVelocityAccelerationFiltersGet(' + \
-            PositionerName + ',double *,double *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        if (error != 0):
-            return (error, returnedString)
-
-        i, j, retList = 0, 0, [error]
-        for paramNb in range(2):
-            while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-                j += 1
-            retList.append(eval(returnedString[i:i + j]))
-            i, j = i + j + 1, 0
-
-        return retList
-
-    # PositionerDriverFiltersGet :  Get driver filters parameters
-    async def PositionerDriverFiltersGet(self, PositionerName):
-        command = 'PositionerDriverFiltersGet(' + PositionerName + \
-            ',double *,double *,double *,double *,double *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        if (error != 0):
-            return (error, returnedString)
-
-        i, j, retList = 0, 0, [error]
-        for paramNb in range(5):
-            while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-                j += 1
-            retList.append(eval(returnedString[i:i + j]))
-            i, j = i + j + 1, 0
-
-        return retList
-
-    # PositionerDriverFiltersSet :  Set driver filters parameters
-    async def PositionerDriverFiltersSet(self, PositionerName, KI, NotchFrequency, NotchBandwidth, NotchGain, LowpassFrequency):
-        command = 'PositionerDriverFiltersSet(' + PositionerName + ',' + str(KI) + ',' + str(
-            NotchFrequency) + ',' + str(NotchBandwidth) + ',' + str(NotchGain) + ',' + str(LowpassFrequency) + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # PositionerDriverPositionOffsetsGet :  Get driver stage and gage position
-    # offset
-    async def PositionerDriverPositionOffsetsGet(self, PositionerName):
-        command = 'PositionerDriverPositionOffsetsGet(' + \
-            PositionerName + ',double *,double *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        if (error != 0):
-            return (error, returnedString)
-
-        i, j, retList = 0, 0, [error]
-        for paramNb in range(2):
-            while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-                j += 1
-            retList.append(eval(returnedString[i:i + j]))
-            i, j = i + j + 1, 0
-
-        return retList
-
-    # PositionerDriverStatusGet :  Read positioner driver status
-    async def PositionerDriverStatusGet(self, PositionerName):
-        command = 'PositionerDriverStatusGet(' + PositionerName + ',int *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        if (error != 0):
-            return (error, returnedString)
-
-        i, j, retList = 0, 0, [error]
-        while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-            j += 1
-        retList.append(eval(returnedString[i:i + j]))
-
-        return retList
-
-    # PositionerDriverStatusStringGet :  Return the positioner driver status
-    # string corresponding to the positioner error code
-    async def PositionerDriverStatusStringGet(self, PositionerDriverStatus):
-        command = 'PositionerDriverStatusStringGet(' + str(
-            PositionerDriverStatus) + ',char *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # PositionerEncoderAmplitudeValuesGet :  Read analog interpolated encoder
-    # amplitude values
-    async def PositionerEncoderAmplitudeValuesGet(self, PositionerName):
-        command = 'PositionerEncoderAmplitudeValuesGet(' + \
-            PositionerName + ',double *,double *,double *,double *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        if (error != 0):
-            return (error, returnedString)
-
-        i, j, retList = 0, 0, [error]
-        for paramNb in range(4):
-            while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-                j += 1
-            retList.append(eval(returnedString[i:i + j]))
-            i, j = i + j + 1, 0
-
-        return retList
-
-    # PositionerEncoderCalibrationParametersGet :  Read analog interpolated
-    # encoder calibration parameters
-    async def PositionerEncoderCalibrationParametersGet(self, PositionerName):
-        command = 'PositionerEncoderCalibrationParametersGet(' + \
-            PositionerName + ',double *,double *,double *,double *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        if (error != 0):
-            return (error, returnedString)
-
-        i, j, retList = 0, 0, [error]
-        for paramNb in range(4):
-            while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-                j += 1
-            retList.append(eval(returnedString[i:i + j]))
-            i, j = i + j + 1, 0
-
-        return retList
-
-    # PositionerErrorGet :  Read and clear positioner error code
-    async def PositionerErrorGet(self, PositionerName):
-        command = 'PositionerErrorGet(' + PositionerName + ',int *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        if (error != 0):
-            return (error, returnedString)
-
-        i, j, retList = 0, 0, [error]
-        while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-            j += 1
-        retList.append(eval(returnedString[i:i + j]))
-
-        return retList
-
-    # PositionerErrorRead :  Read only positioner error code without clear it
-    async def PositionerErrorRead(self, PositionerName):
-        command = 'PositionerErrorRead(' + PositionerName + ',int *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        if (error != 0):
-            return (error, returnedString)
-
-        i, j, retList = 0, 0, [error]
-        while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-            j += 1
-        retList.append(eval(returnedString[i:i + j]))
-
-        return retList
-
-    # PositionerErrorStringGet :  Return the positioner status string
-    # corresponding to the positioner error code
-    async def PositionerErrorStringGet(self, PositionerErrorCode):
-        command = 'PositionerErrorStringGet(' + \
-            str(PositionerErrorCode) + ',char *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # PositionerExcitationSignalGet :  Get excitation signal mode
-    async def PositionerExcitationSignalGet(self, PositionerName):
-        command = 'PositionerExcitationSignalGet(' + \
-            PositionerName + ',int *,double *,double *,double *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        if (error != 0):
-            return (error, returnedString)
-
-        i, j, retList = 0, 0, [error]
-        for paramNb in range(4):
-            while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-                j += 1
-            retList.append(eval(returnedString[i:i + j]))
-            i, j = i + j + 1, 0
-
-        return retList
-
-    # PositionerExcitationSignalSet :  Set excitation signal mode
-    async def PositionerExcitationSignalSet(self, PositionerName, Mode, Frequency, Amplitude, Time):
-        command = 'PositionerExcitationSignalSet(' + PositionerName + ',' + str(
-            Mode) + ',' + str(Frequency) + ',' + str(Amplitude) + ',' + str(Time) + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # PositionerHardwareStatusGet :  Read positioner hardware status
-    async def PositionerHardwareStatusGet(self, PositionerName):
-        command = 'PositionerHardwareStatusGet(' + PositionerName + ',int *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        if (error != 0):
-            return (error, returnedString)
-
-        i, j, retList = 0, 0, [error]
-        while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-            j += 1
-        retList.append(eval(returnedString[i:i + j]))
-
-        return retList
-
-    # PositionerHardwareStatusStringGet :  Return the positioner hardware
-    # status string corresponding to the positioner error code
-    async def PositionerHardwareStatusStringGet(self, PositionerHardwareStatus):
-        command = 'PositionerHardwareStatusStringGet(' + str(
-            PositionerHardwareStatus) + ',char *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # PositionerHardInterpolatorFactorGet :  Get hard interpolator parameters
-    async def PositionerHardInterpolatorFactorGet(self, PositionerName):
-        command = 'PositionerHardInterpolatorFactorGet(' + \
-            PositionerName + ',int *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        if (error != 0):
-            return (error, returnedString)
-
-        i, j, retList = 0, 0, [error]
-        while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-            j += 1
-        retList.append(eval(returnedString[i:i + j]))
-
-        return retList
-
-    # PositionerHardInterpolatorFactorSet :  Set hard interpolator parameters
-    async def PositionerHardInterpolatorFactorSet(self, PositionerName, InterpolationFactor):
-        command = 'PositionerHardInterpolatorFactorSet(' + PositionerName + ',' + str(
-            InterpolationFactor) + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # PositionerHardInterpolatorPositionGet :  Read external latch position
-    async def PositionerHardInterpolatorPositionGet(self, PositionerName):
-        command = 'PositionerHardInterpolatorPositionGet(' + \
-            PositionerName + ',double *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        if (error != 0):
-            return (error, returnedString)
-
-        i, j, retList = 0, 0, [error]
-        while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-            j += 1
-        retList.append(eval(returnedString[i:i + j]))
-
-        return retList
-
-    # PositionerMaximumVelocityAndAccelerationGet :  Return maximum velocity
-    # and acceleration of the positioner
-    async def PositionerMaximumVelocityAndAccelerationGet(self, PositionerName):
-        command = 'PositionerMaximumVelocityAndAccelerationGet(' + \
-            PositionerName + ',double *,double *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        if (error != 0):
-            return (error, returnedString)
-
-        i, j, retList = 0, 0, [error]
-        for paramNb in range(2):
-            while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-                j += 1
-            retList.append(eval(returnedString[i:i + j]))
-            i, j = i + j + 1, 0
-
-        return retList
-
-    # PositionerMotionDoneGet :  Read motion done parameters
-    async def PositionerMotionDoneGet(self, PositionerName):
-        command = 'PositionerMotionDoneGet(' + PositionerName + \
-            ',double *,double *,double *,double *,double *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        if (error != 0):
-            return (error, returnedString)
-
-        i, j, retList = 0, 0, [error]
-        for paramNb in range(5):
-            while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-                j += 1
-            retList.append(eval(returnedString[i:i + j]))
-            i, j = i + j + 1, 0
-
-        return retList
-
-    # PositionerMotionDoneSet :  Update motion done parameters
-    async def PositionerMotionDoneSet(self, PositionerName, PositionWindow, VelocityWindow, CheckingTime, MeanPeriod, TimeOut):
-        command = 'PositionerMotionDoneSet(' + PositionerName + ',' + str(PositionWindow) + ',' + str(
-            VelocityWindow) + ',' + str(CheckingTime) + ',' + str(MeanPeriod) + ',' + str(TimeOut) + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # PositionerPositionCompareAquadBAlwaysEnable :  Enable AquadB signal in
-    # always mode
-    async def PositionerPositionCompareAquadBAlwaysEnable(self, PositionerName):
-        command = 'PositionerPositionCompareAquadBAlwaysEnable(' + \
-            PositionerName + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # PositionerPositionCompareAquadBWindowedGet :  Read position compare
-    # AquadB windowed parameters
-    async def PositionerPositionCompareAquadBWindowedGet(self, PositionerName):
-        command = 'PositionerPositionCompareAquadBWindowedGet(' + \
-            PositionerName + ',double *,double *,bool *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        if (error != 0):
-            return (error, returnedString)
-
-        i, j, retList = 0, 0, [error]
-        for paramNb in range(3):
-            while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-                j += 1
-            retList.append(eval(returnedString[i:i + j]))
-            i, j = i + j + 1, 0
-
-        return retList
-
-    # PositionerPositionCompareAquadBWindowedSet :  Set position compare
-    # AquadB windowed parameters
-    async def PositionerPositionCompareAquadBWindowedSet(self, PositionerName, MinimumPosition, MaximumPosition):
-        command = 'PositionerPositionCompareAquadBWindowedSet(' + PositionerName + ',' + str(
-            MinimumPosition) + ',' + str(MaximumPosition) + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # PositionerPositionCompareGet :  Read position compare parameters
-    async def PositionerPositionCompareGet(self, PositionerName):
-        command = 'PositionerPositionCompareGet(' + PositionerName + \
-            ',double *,double *,double *,bool *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        if (error != 0):
-            return (error, returnedString)
-
-        i, j, retList = 0, 0, [error]
-        for paramNb in range(4):
-            while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-                j += 1
-            retList.append(eval(returnedString[i:i + j]))
-            i, j = i + j + 1, 0
-
-        return retList
-
-    # PositionerPositionCompareSet :  Set position compare parameters
-    async def PositionerPositionCompareSet(self, PositionerName, MinimumPosition, MaximumPosition, PositionStep):
-        command = 'PositionerPositionCompareSet(' + PositionerName + ',' + str(
-            MinimumPosition) + ',' + str(MaximumPosition) + ',' + str(PositionStep) + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # PositionerPositionCompareEnable :  Enable position compare
-    async def PositionerPositionCompareEnable(self, PositionerName):
-        command = 'PositionerPositionCompareEnable(' + PositionerName + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # PositionerPositionCompareDisable :  Disable position compare
-    async def PositionerPositionCompareDisable(self, PositionerName):
-        command = 'PositionerPositionCompareDisable(' + PositionerName + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # PositionerPositionComparePulseParametersGet :  Get position compare PCO
-    # pulse parameters
-    async def PositionerPositionComparePulseParametersGet(self, PositionerName):
-        command = 'PositionerPositionComparePulseParametersGet(' + \
-            PositionerName + ',double *,double *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        if (error != 0):
-            return (error, returnedString)
-
-        i, j, retList = 0, 0, [error]
-        for paramNb in range(2):
-            while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-                j += 1
-            retList.append(eval(returnedString[i:i + j]))
-            i, j = i + j + 1, 0
-
-        return retList
-
-    # PositionerPositionComparePulseParametersSet :  Set position compare PCO
-    # pulse parameters
-    async def PositionerPositionComparePulseParametersSet(self, PositionerName, PCOPulseWidth, EncoderSettlingTime):
-        command = 'PositionerPositionComparePulseParametersSet(' + PositionerName + ',' + str(
-            PCOPulseWidth) + ',' + str(EncoderSettlingTime) + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # PositionerPositionCompareScanAccelerationLimitGet :  Get position
-    # compare scan acceleration limit
-    async def PositionerPositionCompareScanAccelerationLimitGet(self, PositionerName):
-        command = 'PositionerPositionCompareScanAccelerationLimitGet(' + \
-            PositionerName + ',double *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        if (error != 0):
-            return (error, returnedString)
-
-        i, j, retList = 0, 0, [error]
-        while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-            j += 1
-        retList.append(eval(returnedString[i:i + j]))
-
-        return retList
-
-    # PositionerPositionCompareScanAccelerationLimitSet :  Set position
-    # compare scan acceleration limit
-    async def PositionerPositionCompareScanAccelerationLimitSet(self, PositionerName, ScanAccelerationLimit):
-        command = 'PositionerPositionCompareScanAccelerationLimitSet(' + PositionerName + ',' + str(
-            ScanAccelerationLimit) + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # PositionerPreCorrectorExcitationSignalGet :  Get pre-corrector
-    # excitation signal mode
-    async def PositionerPreCorrectorExcitationSignalGet(self, PositionerName):
-        command = 'PositionerPreCorrectorExcitationSignalGet(' + \
-            PositionerName + ',double *,double *,double *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        if (error != 0):
-            return (error, returnedString)
-
-        i, j, retList = 0, 0, [error]
-        for paramNb in range(3):
-            while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-                j += 1
-            retList.append(eval(returnedString[i:i + j]))
-            i, j = i + j + 1, 0
-
-        return retList
-
-    # PositionerPreCorrectorExcitationSignalSet :  Set pre-corrector
-    # excitation signal mode
-    async def PositionerPreCorrectorExcitationSignalSet(self, PositionerName, Frequency, Amplitude, Time):
-        command = 'PositionerPreCorrectorExcitationSignalSet(' + PositionerName + ',' + str(
-            Frequency) + ',' + str(Amplitude) + ',' + str(Time) + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # PositionerRawEncoderPositionGet :  Get the raw encoder position
-    async def PositionerRawEncoderPositionGet(self, PositionerName, UserEncoderPosition):
-        command = 'PositionerRawEncoderPositionGet(' + PositionerName + ',' + str(
-            UserEncoderPosition) + ',double *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        if (error != 0):
-            return (error, returnedString)
-
-        i, j, retList = 0, 0, [error]
-        while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-            j += 1
-        retList.append(eval(returnedString[i:i + j]))
-
-        return retList
-
-    # PositionersEncoderIndexDifferenceGet :  Return the difference between
-    # index of primary axis and secondary axis (only after homesearch)
-    async def PositionersEncoderIndexDifferenceGet(self, PositionerName):
-        command = 'PositionersEncoderIndexDifferenceGet(' + \
-            PositionerName + ',double *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        if (error != 0):
-            return (error, returnedString)
-
-        i, j, retList = 0, 0, [error]
-        while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-            j += 1
-        retList.append(eval(returnedString[i:i + j]))
-
-        return retList
-
-    # PositionerSGammaExactVelocityAjustedDisplacementGet :  Return adjusted
-    # displacement to get exact velocity
-    async def PositionerSGammaExactVelocityAjustedDisplacementGet(self, PositionerName, DesiredDisplacement):
-        command = 'PositionerSGammaExactVelocityAjustedDisplacementGet(' + PositionerName + ',' + str(
-            DesiredDisplacement) + ',double *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        if (error != 0):
-            return (error, returnedString)
-
-        i, j, retList = 0, 0, [error]
-        while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-            j += 1
-        retList.append(eval(returnedString[i:i + j]))
-
-        return retList
-
-    # PositionerSGammaParametersGet :  Read dynamic parameters for one axe of
-    # a group for a future displacement
-    async def PositionerSGammaParametersGet(self, PositionerName):
-        command = 'PositionerSGammaParametersGet(' + PositionerName + \
-            ',double *,double *,double *,double *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        if (error != 0):
-            return (error, returnedString)
-
-        i, j, retList = 0, 0, [error]
-        for paramNb in range(4):
-            while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-                j += 1
-            retList.append(eval(returnedString[i:i + j]))
-            i, j = i + j + 1, 0
-
-        return retList
-
-    # PositionerSGammaParametersSet :  Update dynamic parameters for one axe
-    # of a group for a future displacement
-    async def PositionerSGammaParametersSet(self, PositionerName, Velocity, Acceleration, MinimumTjerkTime, MaximumTjerkTime):
-        command = 'PositionerSGammaParametersSet(' + PositionerName + ',' + str(Velocity) + ',' + str(
-            Acceleration) + ',' + str(MinimumTjerkTime) + ',' + str(MaximumTjerkTime) + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # PositionerSGammaPreviousMotionTimesGet :  Read SettingTime and
-    # SettlingTime
-    async def PositionerSGammaPreviousMotionTimesGet(self, PositionerName):
-        command = 'PositionerSGammaPreviousMotionTimesGet(' + \
-            PositionerName + ',double *,double *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        if (error != 0):
-            return (error, returnedString)
-
-        i, j, retList = 0, 0, [error]
-        for paramNb in range(2):
-            while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-                j += 1
-            retList.append(eval(returnedString[i:i + j]))
-            i, j = i + j + 1, 0
-
-        return retList
-
-    # PositionerStageParameterGet :  Return the stage parameter
-    async def PositionerStageParameterGet(self, PositionerName, ParameterName):
-        command = 'PositionerStageParameterGet(' + \
-            PositionerName + ',' + ParameterName + ',char *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # PositionerStageParameterSet :  Save the stage parameter
-    async def PositionerStageParameterSet(self, PositionerName, ParameterName, ParameterValue):
-        command = 'PositionerStageParameterSet(' + PositionerName + \
-            ',' + ParameterName + ',' + ParameterValue + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # PositionerTimeFlasherGet :  Read time flasher parameters
-    async def PositionerTimeFlasherGet(self, PositionerName):
-        command = 'PositionerTimeFlasherGet(' + PositionerName + \
-            ',double *,double *,double *,bool *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        if (error != 0):
-            return (error, returnedString)
-
-        i, j, retList = 0, 0, [error]
-        for paramNb in range(4):
-            while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-                j += 1
-            retList.append(eval(returnedString[i:i + j]))
-            i, j = i + j + 1, 0
-
-        return retList
-
-    # PositionerTimeFlasherSet :  Set time flasher parameters
-    async def PositionerTimeFlasherSet(self, PositionerName, MinimumPosition, MaximumPosition, TimeInterval):
-        command = 'PositionerTimeFlasherSet(' + PositionerName + ',' + str(
-            MinimumPosition) + ',' + str(MaximumPosition) + ',' + str(TimeInterval) + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # PositionerTimeFlasherEnable :  Enable time flasher
-    async def PositionerTimeFlasherEnable(self, PositionerName):
-        command = 'PositionerTimeFlasherEnable(' + PositionerName + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # PositionerTimeFlasherDisable :  Disable time flasher
-    async def PositionerTimeFlasherDisable(self, PositionerName):
-        command = 'PositionerTimeFlasherDisable(' + PositionerName + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # PositionerUserTravelLimitsGet :  Read UserMinimumTarget and
-    # UserMaximumTarget
-    async def PositionerUserTravelLimitsGet(self, PositionerName):
-        command = 'PositionerUserTravelLimitsGet(' + \
-            PositionerName + ',double *,double *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        if (error != 0):
-            return (error, returnedString)
-
-        i, j, retList = 0, 0, [error]
-        for paramNb in range(2):
-            while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-                j += 1
-            retList.append(eval(returnedString[i:i + j]))
-            i, j = i + j + 1, 0
-
-        return retList
-
-    # PositionerUserTravelLimitsSet :  Update UserMinimumTarget and
-    # UserMaximumTarget
-    async def PositionerUserTravelLimitsSet(self, PositionerName, UserMinimumTarget, UserMaximumTarget):
-        command = 'PositionerUserTravelLimitsSet(' + PositionerName + ',' + str(
-            UserMinimumTarget) + ',' + str(UserMaximumTarget) + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # PositionerWarningFollowingErrorSet :  Set positioner warning following
-    # error limit
-    async def PositionerWarningFollowingErrorSet(self, PositionerName, WarningFollowingError):
-        command = 'PositionerWarningFollowingErrorSet(' + PositionerName + ',' + str(
-            WarningFollowingError) + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # PositionerWarningFollowingErrorGet :  Get positioner warning following
-    # error limit
-    async def PositionerWarningFollowingErrorGet(self, PositionerName):
-        command = 'PositionerWarningFollowingErrorGet(' + \
-            PositionerName + ',double *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        if (error != 0):
-            return (error, returnedString)
-
-        i, j, retList = 0, 0, [error]
-        while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-            j += 1
-        retList.append(eval(returnedString[i:i + j]))
-
-        return retList
-
-    # PositionerCorrectorAutoTuning :  Astrom&Hagglund based auto-tuning
-    async def PositionerCorrectorAutoTuning(self, PositionerName, TuningMode):
-        command = 'PositionerCorrectorAutoTuning(' + PositionerName + ',' + str(
-            TuningMode) + ',double *,double *,double *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        if (error != 0):
-            return (error, returnedString)
-
-        i, j, retList = 0, 0, [error]
-        for paramNb in range(3):
-            while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-                j += 1
-            retList.append(eval(returnedString[i:i + j]))
-            i, j = i + j + 1, 0
-
-        return retList
-
-    # PositionerAccelerationAutoScaling :  Astrom&Hagglund based auto-scaling
-    async def PositionerAccelerationAutoScaling(self, PositionerName):
-        command = 'PositionerAccelerationAutoScaling(' + \
-            PositionerName + ',double *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        if (error != 0):
-            return (error, returnedString)
-
-        i, j, retList = 0, 0, [error]
-        while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-            j += 1
-        retList.append(eval(returnedString[i:i + j]))
-
-        return retList
-
-    # MultipleAxesPVTVerification :  Multiple axes PVT trajectory verification
-    async def MultipleAxesPVTVerification(self, GroupName, TrajectoryFileName):
-        command = 'MultipleAxesPVTVerification(' + \
-            GroupName + ',' + TrajectoryFileName + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # MultipleAxesPVTVerificationResultGet :  Multiple axes PVT trajectory
-    # verification result get
-    async def MultipleAxesPVTVerificationResultGet(self, PositionerName):
-        command = 'MultipleAxesPVTVerificationResultGet(' + PositionerName + \
-            ',char *,double *,double *,double *,double *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        if (error != 0):
-            return (error, returnedString)
-
-        i, j, retList = 0, 0, [error]
-        for paramNb in range(4):
-            while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-                j += 1
-            retList.append(eval(returnedString[i:i + j]))
-            i, j = i + j + 1, 0
-
-        return retList
-
-    # MultipleAxesPVTExecution :  Multiple axes PVT trajectory execution
-    async def MultipleAxesPVTExecution(self, GroupName, TrajectoryFileName, ExecutionNumber):
-        command = 'MultipleAxesPVTExecution(' + GroupName + ',' + \
-            TrajectoryFileName + ',' + str(ExecutionNumber) + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # MultipleAxesPVTParametersGet :  Multiple axes PVT trajectory get
-    # parameters
-    async def MultipleAxesPVTParametersGet(self, GroupName):
-        command = 'MultipleAxesPVTParametersGet(' + \
-            GroupName + ',char *,int *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        if (error != 0):
-            return (error, returnedString)
-
-        i, j, retList = 0, 0, [error]
-        while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-            j += 1
-        retList.append(eval(returnedString[i:i + j]))
-
-        return retList
-
-    # MultipleAxesPVTPulseOutputSet :  Configure pulse output on trajectory
-    async def MultipleAxesPVTPulseOutputSet(self, GroupName, StartElement, EndElement, TimeInterval):
-        command = 'MultipleAxesPVTPulseOutputSet(' + GroupName + ',' + str(
-            StartElement) + ',' + str(EndElement) + ',' + str(TimeInterval) + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # MultipleAxesPVTPulseOutputGet :  Get pulse output on trajectory
-    # configuration
-    async def MultipleAxesPVTPulseOutputGet(self, GroupName):
-        command = 'MultipleAxesPVTPulseOutputGet(' + \
-            GroupName + ',int *,int *,double *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        if (error != 0):
-            return (error, returnedString)
-
-        i, j, retList = 0, 0, [error]
-        for paramNb in range(3):
-            while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-                j += 1
-            retList.append(eval(returnedString[i:i + j]))
-            i, j = i + j + 1, 0
-
-        return retList
-
-    # MultipleAxesPVTLoadToMemory :  Multiple Axes Load PVT trajectory through
-    # function
-    async def MultipleAxesPVTLoadToMemory(self, GroupName, TrajectoryPart):
-        command = 'MultipleAxesPVTLoadToMemory(' + \
-            GroupName + ',' + TrajectoryPart + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # MultipleAxesPVTResetInMemory :  Multiple Axes PVT trajectory reset in
-    # memory
-    async def MultipleAxesPVTResetInMemory(self, GroupName):
-        command = 'MultipleAxesPVTResetInMemory(' + GroupName + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # SingleAxisSlaveModeEnable :  Enable the slave mode
-    async def SingleAxisSlaveModeEnable(self, GroupName):
-        command = 'SingleAxisSlaveModeEnable(' + GroupName + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # SingleAxisSlaveModeDisable :  Disable the slave mode
-    async def SingleAxisSlaveModeDisable(self, GroupName):
-        command = 'SingleAxisSlaveModeDisable(' + GroupName + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # SingleAxisSlaveParametersSet :  Set slave parameters
-    async def SingleAxisSlaveParametersSet(self, GroupName, PositionerName, Ratio):
-        command = 'SingleAxisSlaveParametersSet(' + GroupName + \
-            ',' + PositionerName + ',' + str(Ratio) + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # SingleAxisSlaveParametersGet :  Get slave parameters
-    async def SingleAxisSlaveParametersGet(self, GroupName):
-        command = 'SingleAxisSlaveParametersGet(' + \
-            GroupName + ',char *,double *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        if (error != 0):
-            return (error, returnedString)
-
-        i, j, retList = 0, 0, [error]
-        while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-            j += 1
-        retList.append(eval(returnedString[i:i + j]))
-
-        return retList
-
-    # SingleAxisThetaClampDisable :  Set clamping disable on selected group
-    async def SingleAxisThetaClampDisable(self, GroupName):
-        command = 'SingleAxisThetaClampDisable(' + GroupName + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # SingleAxisThetaClampEnable :  Set clamping enable on selected group
-    async def SingleAxisThetaClampEnable(self, GroupName):
-        command = 'SingleAxisThetaClampEnable(' + GroupName + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # SingleAxisThetaSlaveModeEnable :  Enable the slave mode
-    async def SingleAxisThetaSlaveModeEnable(self, GroupName):
-        command = 'SingleAxisThetaSlaveModeEnable(' + GroupName + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # SingleAxisThetaSlaveModeDisable :  Disable the slave mode
-    async def SingleAxisThetaSlaveModeDisable(self, GroupName):
-        command = 'SingleAxisThetaSlaveModeDisable(' + GroupName + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # SingleAxisThetaSlaveParametersSet :  Set slave parameters
-    async def SingleAxisThetaSlaveParametersSet(self, GroupName, PositionerName, Ratio):
-        command = 'SingleAxisThetaSlaveParametersSet(' + GroupName + \
-            ',' + PositionerName + ',' + str(Ratio) + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # SingleAxisThetaSlaveParametersGet :  Get slave parameters
-    async def SingleAxisThetaSlaveParametersGet(self, GroupName):
-        command = 'SingleAxisThetaSlaveParametersGet(' + \
-            GroupName + ',char *,double *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        if (error != 0):
-            return (error, returnedString)
-
-        i, j, retList = 0, 0, [error]
-        while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-            j += 1
-        retList.append(eval(returnedString[i:i + j]))
-
-        return retList
-
-    # SpindleSlaveModeEnable :  Enable the slave mode
-    async def SpindleSlaveModeEnable(self, GroupName):
-        command = 'SpindleSlaveModeEnable(' + GroupName + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # SpindleSlaveModeDisable :  Disable the slave mode
-    async def SpindleSlaveModeDisable(self, GroupName):
-        command = 'SpindleSlaveModeDisable(' + GroupName + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # SpindleSlaveParametersSet :  Set slave parameters
-    async def SpindleSlaveParametersSet(self, GroupName, PositionerName, Ratio):
-        command = 'SpindleSlaveParametersSet(' + GroupName + \
-            ',' + PositionerName + ',' + str(Ratio) + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # SpindleSlaveParametersGet :  Get slave parameters
-    async def SpindleSlaveParametersGet(self, GroupName):
-        command = 'SpindleSlaveParametersGet(' + \
-            GroupName + ',char *,double *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        if (error != 0):
-            return (error, returnedString)
-
-        i, j, retList = 0, 0, [error]
-        while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-            j += 1
-        retList.append(eval(returnedString[i:i + j]))
-
-        return retList
-
-    # GroupSpinParametersSet :  Modify Spin parameters on selected group and
-    # activate the continuous move
-    async def GroupSpinParametersSet(self, GroupName, Velocity, Acceleration):
-        command = 'GroupSpinParametersSet(' + GroupName + \
-            ',' + str(Velocity) + ',' + str(Acceleration) + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # GroupSpinParametersGet :  Get Spin parameters on selected group
-    async def GroupSpinParametersGet(self, GroupName):
-        command = 'GroupSpinParametersGet(' + GroupName + ',double *,double *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        if (error != 0):
-            return (error, returnedString)
-
-        i, j, retList = 0, 0, [error]
-        for paramNb in range(2):
-            while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-                j += 1
-            retList.append(eval(returnedString[i:i + j]))
-            i, j = i + j + 1, 0
-
-        return retList
-
-    # GroupSpinCurrentGet :  Get Spin current on selected group
-    async def GroupSpinCurrentGet(self, GroupName):
-        command = 'GroupSpinCurrentGet(' + GroupName + ',double *,double *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        if (error != 0):
-            return (error, returnedString)
-
-        i, j, retList = 0, 0, [error]
-        for paramNb in range(2):
-            while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-                j += 1
-            retList.append(eval(returnedString[i:i + j]))
-            i, j = i + j + 1, 0
-
-        return retList
-
-    # GroupSpinModeStop :  Stop Spin mode on selected group with specified
-    # acceleration
-    async def GroupSpinModeStop(self, GroupName, Acceleration):
-        command = 'GroupSpinModeStop(' + GroupName + \
-            ',' + str(Acceleration) + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # XYLineArcVerification :  XY trajectory verification
-    async def XYLineArcVerification(self, GroupName, TrajectoryFileName):
-        command = 'XYLineArcVerification(' + \
-            GroupName + ',' + TrajectoryFileName + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # XYLineArcVerificationResultGet :  XY trajectory verification result get
-    async def XYLineArcVerificationResultGet(self, PositionerName):
-        command = 'XYLineArcVerificationResultGet(' + PositionerName + \
-            ',char *,double *,double *,double *,double *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        if (error != 0):
-            return (error, returnedString)
-
-        i, j, retList = 0, 0, [error]
-        for paramNb in range(4):
-            while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-                j += 1
-            retList.append(eval(returnedString[i:i + j]))
-            i, j = i + j + 1, 0
-
-        return retList
-
-    # XYLineArcExecution :  XY trajectory execution
-    async def XYLineArcExecution(self, GroupName, TrajectoryFileName, Velocity, Acceleration, ExecutionNumber):
-        command = 'XYLineArcExecution(' + GroupName + ',' + TrajectoryFileName + ',' + str(
-            Velocity) + ',' + str(Acceleration) + ',' + str(ExecutionNumber) + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # XYLineArcParametersGet :  XY trajectory get parameters
-    async def XYLineArcParametersGet(self, GroupName):
-        command = 'XYLineArcParametersGet(' + GroupName + \
-            ',char *,double *,double *,int *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        if (error != 0):
-            return (error, returnedString)
-
-        i, j, retList = 0, 0, [error]
-        for paramNb in range(3):
-            while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-                j += 1
-            retList.append(eval(returnedString[i:i + j]))
-            i, j = i + j + 1, 0
-
-        return retList
-
-    # XYLineArcPulseOutputSet :  Configure pulse output on trajectory
-    async def XYLineArcPulseOutputSet(self, GroupName, StartLength, EndLength, PathLengthInterval):
-        command = 'XYLineArcPulseOutputSet(' + GroupName + ',' + str(
-            StartLength) + ',' + str(EndLength) + ',' + str(PathLengthInterval) + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # XYLineArcPulseOutputGet :  Get pulse output on trajectory configuration
-    async def XYLineArcPulseOutputGet(self, GroupName):
-        command = 'XYLineArcPulseOutputGet(' + \
-            GroupName + ',double *,double *,double *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        if (error != 0):
-            return (error, returnedString)
-
-        i, j, retList = 0, 0, [error]
-        for paramNb in range(3):
-            while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-                j += 1
-            retList.append(eval(returnedString[i:i + j]))
-            i, j = i + j + 1, 0
-
-        return retList
-
-    # XYPVTVerification :  XY PVT trajectory verification
-    async def XYPVTVerification(self, GroupName, TrajectoryFileName):
-        command = 'XYPVTVerification(' + GroupName + \
-            ',' + TrajectoryFileName + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # XYPVTVerificationResultGet :  XY PVT trajectory verification result get
-    async def XYPVTVerificationResultGet(self, PositionerName):
-        command = 'XYPVTVerificationResultGet(' + PositionerName + \
-            ',char *,double *,double *,double *,double *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        if (error != 0):
-            return (error, returnedString)
-
-        i, j, retList = 0, 0, [error]
-        for paramNb in range(4):
-            while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-                j += 1
-            retList.append(eval(returnedString[i:i + j]))
-            i, j = i + j + 1, 0
-
-        return retList
-
-    # XYPVTExecution :  XY PVT trajectory execution
-    async def XYPVTExecution(self, GroupName, TrajectoryFileName, ExecutionNumber):
-        command = 'XYPVTExecution(' + GroupName + ',' + \
-            TrajectoryFileName + ',' + str(ExecutionNumber) + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # XYPVTParametersGet :  XY PVT trajectory get parameters
-    async def XYPVTParametersGet(self, GroupName):
-        command = 'XYPVTParametersGet(' + GroupName + ',char *,int *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        if (error != 0):
-            return (error, returnedString)
-
-        i, j, retList = 0, 0, [error]
-        while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-            j += 1
-        retList.append(eval(returnedString[i:i + j]))
-
-        return retList
-
-    # XYPVTPulseOutputSet :  Configure pulse output on trajectory
-    async def XYPVTPulseOutputSet(self, GroupName, StartElement, EndElement, TimeInterval):
-        command = 'XYPVTPulseOutputSet(' + GroupName + ',' + str(
-            StartElement) + ',' + str(EndElement) + ',' + str(TimeInterval) + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # XYPVTPulseOutputGet :  Get pulse output on trajectory configuration
-    async def XYPVTPulseOutputGet(self, GroupName):
-        command = 'XYPVTPulseOutputGet(' + GroupName + ',int *,int *,double *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        if (error != 0):
-            return (error, returnedString)
-
-        i, j, retList = 0, 0, [error]
-        for paramNb in range(3):
-            while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-                j += 1
-            retList.append(eval(returnedString[i:i + j]))
-            i, j = i + j + 1, 0
-
-        return retList
-
-    # XYPVTLoadToMemory :  XY Load PVT trajectory through function
-    async def XYPVTLoadToMemory(self, GroupName, TrajectoryPart):
-        command = 'XYPVTLoadToMemory(' + GroupName + ',' + TrajectoryPart + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # XYPVTResetInMemory :  XY PVT trajectory reset in memory
-    async def XYPVTResetInMemory(self, GroupName):
-        command = 'XYPVTResetInMemory(' + GroupName + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # XYZGroupPositionCorrectedProfilerGet :  Return corrected profiler
-    # positions
-    async def XYZGroupPositionCorrectedProfilerGet(self, GroupName, PositionX, PositionY, PositionZ):
-        command = 'XYZGroupPositionCorrectedProfilerGet(' + GroupName + ',' + str(
-            PositionX) + ',' + str(PositionY) + ',' + str(PositionZ) + ',double *,double *,double *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        if (error != 0):
-            return (error, returnedString)
-
-        i, j, retList = 0, 0, [error]
-        for paramNb in range(3):
-            while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-                j += 1
-            retList.append(eval(returnedString[i:i + j]))
-            i, j = i + j + 1, 0
-
-        return retList
-
-    # XYZGroupPositionPCORawEncoderGet :  Return PCO raw encoder positions
-    async def XYZGroupPositionPCORawEncoderGet(self, GroupName, PositionX, PositionY, PositionZ):
-        command = 'XYZGroupPositionPCORawEncoderGet(' + GroupName + ',' + str(
-            PositionX) + ',' + str(PositionY) + ',' + str(PositionZ) + ',double *,double *,double *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        if (error != 0):
-            return (error, returnedString)
-
-        i, j, retList = 0, 0, [error]
-        for paramNb in range(3):
-            while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-                j += 1
-            retList.append(eval(returnedString[i:i + j]))
-            i, j = i + j + 1, 0
-
-        return retList
-
-    # XYZSplineVerification :  XYZ trajectory verifivation
-    async def XYZSplineVerification(self, GroupName, TrajectoryFileName):
-        command = 'XYZSplineVerification(' + \
-            GroupName + ',' + TrajectoryFileName + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # XYZSplineVerificationResultGet :  XYZ trajectory verification result get
-    async def XYZSplineVerificationResultGet(self, PositionerName):
-        command = 'XYZSplineVerificationResultGet(' + PositionerName + \
-            ',char *,double *,double *,double *,double *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        if (error != 0):
-            return (error, returnedString)
-
-        i, j, retList = 0, 0, [error]
-        for paramNb in range(4):
-            while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-                j += 1
-            retList.append(eval(returnedString[i:i + j]))
-            i, j = i + j + 1, 0
-
-        return retList
-
-    # XYZSplineExecution :  XYZ trajectory execution
-    async def XYZSplineExecution(self, GroupName, TrajectoryFileName, Velocity, Acceleration):
-        command = 'XYZSplineExecution(' + GroupName + ',' + TrajectoryFileName + \
-            ',' + str(Velocity) + ',' + str(Acceleration) + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # XYZSplineParametersGet :  XYZ trajectory get parameters
-    async def XYZSplineParametersGet(self, GroupName):
-        command = 'XYZSplineParametersGet(' + GroupName + \
-            ',char *,double *,double *,int *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        if (error != 0):
-            return (error, returnedString)
-
-        i, j, retList = 0, 0, [error]
-        for paramNb in range(3):
-            while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-                j += 1
-            retList.append(eval(returnedString[i:i + j]))
-            i, j = i + j + 1, 0
-
-        return retList
-
-    # TZPVTVerification :  TZ PVT trajectory verification
-    async def TZPVTVerification(self, GroupName, TrajectoryFileName):
-        command = 'TZPVTVerification(' + GroupName + \
-            ',' + TrajectoryFileName + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # TZPVTVerificationResultGet :  TZ PVT trajectory verification result get
-    async def TZPVTVerificationResultGet(self, PositionerName):
-        command = 'TZPVTVerificationResultGet(' + PositionerName + \
-            ',char *,double *,double *,double *,double *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        if (error != 0):
-            return (error, returnedString)
-
-        i, j, retList = 0, 0, [error]
-        for paramNb in range(4):
-            while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-                j += 1
-            retList.append(eval(returnedString[i:i + j]))
-            i, j = i + j + 1, 0
-
-        return retList
-
-    # TZPVTExecution :  TZ PVT trajectory execution
-    async def TZPVTExecution(self, GroupName, TrajectoryFileName, ExecutionNumber):
-        command = 'TZPVTExecution(' + GroupName + ',' + \
-            TrajectoryFileName + ',' + str(ExecutionNumber) + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # TZPVTParametersGet :  TZ PVT trajectory get parameters
-    async def TZPVTParametersGet(self, GroupName):
-        command = 'TZPVTParametersGet(' + GroupName + ',char *,int *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        if (error != 0):
-            return (error, returnedString)
-
-        i, j, retList = 0, 0, [error]
-        while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-            j += 1
-        retList.append(eval(returnedString[i:i + j]))
-
-        return retList
-
-    # TZPVTPulseOutputSet :  Configure pulse output on trajectory
-    async def TZPVTPulseOutputSet(self, GroupName, StartElement, EndElement, TimeInterval):
-        command = 'TZPVTPulseOutputSet(' + GroupName + ',' + str(
-            StartElement) + ',' + str(EndElement) + ',' + str(TimeInterval) + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # TZPVTPulseOutputGet :  Get pulse output on trajectory configuration
-    async def TZPVTPulseOutputGet(self, GroupName):
-        command = 'TZPVTPulseOutputGet(' + GroupName + ',int *,int *,double *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        if (error != 0):
-            return (error, returnedString)
-
-        i, j, retList = 0, 0, [error]
-        for paramNb in range(3):
-            while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-                j += 1
-            retList.append(eval(returnedString[i:i + j]))
-            i, j = i + j + 1, 0
-
-        return retList
-
-    # TZPVTLoadToMemory :  TZ Load PVT trajectory through function
-    async def TZPVTLoadToMemory(self, GroupName, TrajectoryPart):
-        command = 'TZPVTLoadToMemory(' + GroupName + ',' + TrajectoryPart + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # TZPVTResetInMemory :  TZ PVT trajectory reset in memory
-    async def TZPVTResetInMemory(self, GroupName):
-        command = 'TZPVTResetInMemory(' + GroupName + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # TZFocusModeEnable :  Enable the focus mode
-    async def TZFocusModeEnable(self, GroupName):
-        command = 'TZFocusModeEnable(' + GroupName + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # TZFocusModeDisable :  Disable the focus mode
-    async def TZFocusModeDisable(self, GroupName):
-        command = 'TZFocusModeDisable(' + GroupName + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # TZTrackingUserMaximumZZZTargetDifferenceGet :  Get user maximum ZZZ
-    # target difference for tracking control
-    async def TZTrackingUserMaximumZZZTargetDifferenceGet(self, GroupName):
-        command = 'TZTrackingUserMaximumZZZTargetDifferenceGet(' + \
-            GroupName + ',double *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        if (error != 0):
-            return (error, returnedString)
-
-        i, j, retList = 0, 0, [error]
-        while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-            j += 1
-        retList.append(eval(returnedString[i:i + j]))
-
-        return retList
-
-    # TZTrackingUserMaximumZZZTargetDifferenceSet :  Set user maximum ZZZ
-    # target difference for tracking control
-    async def TZTrackingUserMaximumZZZTargetDifferenceSet(self, GroupName, UserMaximumZZZTargetDifference):
-        command = 'TZTrackingUserMaximumZZZTargetDifferenceSet(' + GroupName + ',' + str(
-            UserMaximumZZZTargetDifference) + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # FocusProcessSocketReserve :  Set user maximum ZZZ target difference for
-    # tracking control
-    async def FocusProcessSocketReserve(self):
-        command = 'FocusProcessSocketReserve()'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # FocusProcessSocketFree :  Set user maximum ZZZ target difference for
-    # tracking control
-    async def FocusProcessSocketFree(self):
-        command = 'FocusProcessSocketFree()'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # PositionerMotorOutputOffsetGet :  Get soft (user defined) motor output
-    # DAC offsets
-    async def PositionerMotorOutputOffsetGet(self, PositionerName):
-        command = 'PositionerMotorOutputOffsetGet(' + PositionerName + \
-            ',double *,double *,double *,double *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        if (error != 0):
-            return (error, returnedString)
-
-        i, j, retList = 0, 0, [error]
-        for paramNb in range(4):
-            while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-                j += 1
-            retList.append(eval(returnedString[i:i + j]))
-            i, j = i + j + 1, 0
-
-        return retList
-
-    # PositionerMotorOutputOffsetSet :  Set soft (user defined) motor output
-    # DAC offsets
-    async def PositionerMotorOutputOffsetSet(self, PositionerName, PrimaryDAC1, PrimaryDAC2, SecondaryDAC1, SecondaryDAC2):
-        command = 'PositionerMotorOutputOffsetSet(' + PositionerName + ',' + str(PrimaryDAC1) + ',' + str(
-            PrimaryDAC2) + ',' + str(SecondaryDAC1) + ',' + str(SecondaryDAC2) + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # SingleAxisThetaPositionRawGet :  Get raw encoder positions for single
-    # axis theta encoder
-    async def SingleAxisThetaPositionRawGet(self, GroupName):
-        command = 'SingleAxisThetaPositionRawGet(' + \
-            GroupName + ',double *,double *,double *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        if (error != 0):
-            return (error, returnedString)
-
-        i, j, retList = 0, 0, [error]
-        for paramNb in range(3):
-            while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-                j += 1
-            retList.append(eval(returnedString[i:i + j]))
-            i, j = i + j + 1, 0
-
-        return retList
-
-    # EEPROMCIESet :  Get raw encoder positions for single axis theta encoder
-    async def EEPROMCIESet(self, CardNumber, ReferenceString):
-        command = 'EEPROMCIESet(' + str(CardNumber) + \
-            ',' + ReferenceString + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # EEPROMDACOffsetCIESet :  Get raw encoder positions for single axis theta
-    # encoder
-    async def EEPROMDACOffsetCIESet(self, PlugNumber, DAC1Offset, DAC2Offset):
-        command = 'EEPROMDACOffsetCIESet(' + str(PlugNumber) + \
-            ',' + str(DAC1Offset) + ',' + str(DAC2Offset) + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # EEPROMDriverSet :  Get raw encoder positions for single axis theta
-    # encoder
-    async def EEPROMDriverSet(self, PlugNumber, ReferenceString):
-        command = 'EEPROMDriverSet(' + str(PlugNumber) + \
-            ',' + ReferenceString + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # EEPROMINTSet :  Get raw encoder positions for single axis theta encoder
-    async def EEPROMINTSet(self, CardNumber, ReferenceString):
-        command = 'EEPROMINTSet(' + str(CardNumber) + \
-            ',' + ReferenceString + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # CPUCoreAndBoardSupplyVoltagesGet :  Get raw encoder positions for single
-    # axis theta encoder
-    async def CPUCoreAndBoardSupplyVoltagesGet(self):
-        command = 'CPUCoreAndBoardSupplyVoltagesGet(double *,double *,double *,double *,double *,double *,double *,double *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        if (error != 0):
-            return (error, returnedString)
-
-        i, j, retList = 0, 0, [error]
-        for paramNb in range(8):
-            while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-                j += 1
-            retList.append(eval(returnedString[i:i + j]))
-            i, j = i + j + 1, 0
-
-        return retList
-
-    # CPUTemperatureAndFanSpeedGet :  Get raw encoder positions for single
-    # axis theta encoder
-    async def CPUTemperatureAndFanSpeedGet(self):
-        command = 'CPUTemperatureAndFanSpeedGet(double *,double *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        if (error != 0):
-            return (error, returnedString)
-
-        i, j, retList = 0, 0, [error]
-        for paramNb in range(2):
-            while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-                j += 1
-            retList.append(eval(returnedString[i:i + j]))
-            i, j = i + j + 1, 0
-
-        return retList
-
-    # ActionListGet :  Action list
-    async def ActionListGet(self):
-        command = 'ActionListGet(char *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # ActionExtendedListGet :  Action extended list
-    async def ActionExtendedListGet(self):
-        command = 'ActionExtendedListGet(char *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # APIExtendedListGet :  API method list
-    async def APIExtendedListGet(self):
-        command = 'APIExtendedListGet(char *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # APIListGet :  API method list without extended API
-    async def APIListGet(self):
-        command = 'APIListGet(char *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # ControllerStatusListGet :  Controller status list
-    async def ControllerStatusListGet(self):
-        command = 'ControllerStatusListGet(char *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # ErrorListGet :  Error list
-    async def ErrorListGet(self):
-        command = 'ErrorListGet(char *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # EventListGet :  General event list
-    async def EventListGet(self):
-        command = 'EventListGet(char *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # GatheringListGet :  Gathering type list
-    async def GatheringListGet(self):
-        command = 'GatheringListGet(char *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # GatheringExtendedListGet :  Gathering type extended list
-    async def GatheringExtendedListGet(self):
-        command = 'GatheringExtendedListGet(char *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # GatheringExternalListGet :  External Gathering type list
-    async def GatheringExternalListGet(self):
-        command = 'GatheringExternalListGet(char *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # GroupStatusListGet :  Group status list
-    async def GroupStatusListGet(self):
-        command = 'GroupStatusListGet(char *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # HardwareInternalListGet :  Internal hardware list
-    async def HardwareInternalListGet(self):
-        command = 'HardwareInternalListGet(char *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # HardwareDriverAndStageGet :  Smart hardware
-    async def HardwareDriverAndStageGet(self, PlugNumber):
-        command = 'HardwareDriverAndStageGet(' + \
-            str(PlugNumber) + ',char *,char *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # ObjectsListGet :  Group name and positioner name
-    async def ObjectsListGet(self):
-        command = 'ObjectsListGet(char *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # PositionerErrorListGet :  Positioner error list
-    async def PositionerErrorListGet(self):
-        command = 'PositionerErrorListGet(char *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # PositionerHardwareStatusListGet :  Positioner hardware status list
-    async def PositionerHardwareStatusListGet(self):
-        command = 'PositionerHardwareStatusListGet(char *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # PositionerDriverStatusListGet :  Positioner driver status list
-    async def PositionerDriverStatusListGet(self):
-        command = 'PositionerDriverStatusListGet(char *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # ReferencingActionListGet :  Get referencing action list
-    async def ReferencingActionListGet(self):
-        command = 'ReferencingActionListGet(char *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # ReferencingSensorListGet :  Get referencing sensor list
-    async def ReferencingSensorListGet(self):
-        command = 'ReferencingSensorListGet(char *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # PrepareForUpdate :  Prepare for update controller
-    async def PrepareForUpdate(self):
-        command = 'PrepareForUpdate()'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # GatheringUserDatasGet :  Return UserDatas values
-    async def GatheringUserDatasGet(self):
-        command = 'GatheringUserDatasGet(double *,double *,double *,double *,double *,double *,double *,double *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        if (error != 0):
-            return (error, returnedString)
-
-        i, j, retList = 0, 0, [error]
-        for paramNb in range(8):
-            while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-                j += 1
-            retList.append(eval(returnedString[i:i + j]))
-            i, j = i + j + 1, 0
-
-        return retList
-
-    # ControllerMotionKernelMinMaxTimeLoadGet :  Get controller motion kernel
-    # minimum and maximum time load
-    async def ControllerMotionKernelMinMaxTimeLoadGet(self):
-        command = 'ControllerMotionKernelMinMaxTimeLoadGet(double *,double *,double *,double *,double *,double *,double *,double *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        if (error != 0):
-            return (error, returnedString)
-
-        i, j, retList = 0, 0, [error]
-        for paramNb in range(8):
-            while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-                j += 1
-            retList.append(eval(returnedString[i:i + j]))
-            i, j = i + j + 1, 0
-
-        return retList
-
-    # ControllerMotionKernelMinMaxTimeLoadReset :  Reset controller motion
-    # kernel min/max time load
-    async def ControllerMotionKernelMinMaxTimeLoadReset(self):
-        command = 'ControllerMotionKernelMinMaxTimeLoadReset()'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # ControllerMotionKernelPeriodMinMaxGet :  Get controller motion kernel
-    # min/max periods
-    async def ControllerMotionKernelPeriodMinMaxGet(self):
-        command = 'ControllerMotionKernelPeriodMinMaxGet(double *,double *,double *,double *,double *,double *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        if (error != 0):
-            return (error, returnedString)
-
-        i, j, retList = 0, 0, [error]
-        for paramNb in range(6):
-            while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-                j += 1
-            retList.append(eval(returnedString[i:i + j]))
-            i, j = i + j + 1, 0
-
-        return retList
-
-    # ControllerMotionKernelPeriodMinMaxReset :  Reset controller motion
-    # kernel min/max periods
-    async def ControllerMotionKernelPeriodMinMaxReset(self):
-        command = 'ControllerMotionKernelPeriodMinMaxReset()'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # SocketsStatusGet :  Get sockets current status
-    async def SocketsStatusGet(self):
-        command = 'SocketsStatusGet(char *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # TestTCP :  Test TCP/IP transfert
-    async def TestTCP(self, InputString):
-        command = 'TestTCP(' + InputString + ',char *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # ISRCorrectorCompensateOverrunNumberGet :  Get ISR Corrector Compensate
-    # Overrun Number
-    async def ISRCorrectorCompensateOverrunNumberGet(self):
-        command = 'ISRCorrectorCompensateOverrunNumberGet(int *,int *)'
-        (error, returnedString) = await self._sendAndReceive(command)
-        if (error != 0):
-            return (error, returnedString)
-
-        i, j, retList = 0, 0, [error]
-        for paramNb in range(2):
-            while ((i + j) < len(returnedString) and returnedString[i + j] != ','):
-                j += 1
-            retList.append(eval(returnedString[i:i + j]))
-            i, j = i + j + 1, 0
-
-        return retList
-
-    # ISRCorrectorCompensateOverrunNumberReset :  Reset ISR Corrector
-    # Compensate Overrun Number
-    async def ISRCorrectorCompensateOverrunNumberReset(self):
-        command = 'ISRCorrectorCompensateOverrunNumberReset()'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # OptionalModuleExecute :  Execute an optional module
-    async def OptionalModuleExecute(self, ModuleFileName):
-        command = 'OptionalModuleExecute(' + ModuleFileName + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
-
-    # OptionalModuleKill :  Kill an optional module
-    async def OptionalModuleKill(self, TaskName):
-        command = 'OptionalModuleKill(' + TaskName + ')'
-        (error, returnedString) = await self._sendAndReceive(command)
-        return (error, returnedString)
+        command = 'GroupJogParametersSet(%s,%s)' % (GroupName, ','.join(
+            ['%s,%s' % parameters for parameters in zip(Velocity, Acceleration)]))
+        return await self._sendAndReceive(command)
+
+
+# Functions with a regular signature are generated from this table of
+# (name, arguments, outputs, description). See common.Function.
+_FUNCTIONS = (
+    ("ControllerMotionKernelTimeLoadGet", "",
+     "double *,double *,double *,double *",
+     "Get controller motion kernel time load"),
+    ("ControllerRTTimeGet", "", "double *,double *",
+     "Get controller corrector period and calculation time"),
+    ("ControllerSlaveStatusGet", "", "int *",
+     "Read slave controller status"),
+    ("ControllerSlaveStatusStringGet", "SlaveControllerStatusCode", "char *",
+     "Return the slave controller status string"),
+    ("ControllerSynchronizeCorrectorISR", "ModeString", "",
+     "Synchronize controller corrector ISR"),
+    ("ControllerStatusGet", "", "int *",
+     "Get controller current status and reset the status"),
+    ("ControllerStatusRead", "", "int *",
+     "Read controller current status"),
+    ("ControllerStatusStringGet", "ControllerStatusCode", "char *",
+     "Return the controller status string"),
+    ("ElapsedTimeGet", "", "double *",
+     "Return elapsed time from controller power on"),
+    ("ErrorStringGet", "ErrorCode", "char *",
+     "Return the error string corresponding to the error code"),
+    ("FirmwareVersionGet", "", "char *",
+     "Return firmware version"),
+    ("InstallerVersionGet", "", "char *",
+     "Return installer version"),
+    ("TCLScriptExecute", "TCLFileName,TaskName,ParametersList", "",
+     "Execute a TCL script from a TCL file"),
+    ("TCLScriptExecuteAndWait", "TCLFileName,TaskName,InputParametersList",
+     "char *",
+     "Execute a TCL script from a TCL file and wait the end of execution to "
+     "return"),
+    ("TCLScriptExecuteWithPriority",
+     "TCLFileName,TaskName,TaskPriorityLevel,ParametersList",
+     "",
+     "Execute a TCL script with defined priority"),
+    ("TCLScriptKill", "TaskName", "",
+     "Kill TCL Task"),
+    ("TCLScriptKillAll", "", "",
+     "Kill all TCL Tasks"),
+    ("TimerGet", "TimerName", "int *",
+     "Get a timer"),
+    ("TimerSet", "TimerName,FrequencyTicks", "",
+     "Set a timer"),
+    ("Reboot", "", "",
+     "Reboot the controller"),
+    ("Login", "Name,Password", "",
+     "Log in"),
+    ("CloseAllOtherSockets", "", "",
+     "Close all socket beside the one used to send this command"),
+    ("HardwareDateAndTimeGet", "", "char *",
+     "Return hardware date and time"),
+    ("HardwareDateAndTimeSet", "DateAndTime", "",
+     "Set hardware date and time"),
+    ("EventAdd",
+     "PositionerName,EventName,EventParameter,ActionName,ActionParameter1,ActionParameter2,ActionParameter3",
+     "",
+     "** OBSOLETE ** Add an event"),
+    ("EventGet", "PositionerName", "char *",
+     "** OBSOLETE ** Read events and actions list"),
+    ("EventRemove", "PositionerName,EventName,EventParameter", "",
+     "** OBSOLETE ** Delete an event"),
+    ("EventWait", "PositionerName,EventName,EventParameter", "",
+     "** OBSOLETE ** Wait an event"),
+    ("EventExtendedConfigurationTriggerGet", "", "char *",
+     "Read the event configuration"),
+    ("EventExtendedConfigurationActionGet", "", "char *",
+     "Read the action configuration"),
+    ("EventExtendedStart", "", "int *",
+     "Launch the last event and action configuration and return an ID"),
+    ("EventExtendedAllGet", "", "char *",
+     "Read all event and action configurations"),
+    ("EventExtendedGet", "ID", "char *,char *",
+     "Read the event and action configuration defined by ID"),
+    ("EventExtendedRemove", "ID", "",
+     "Remove the event and action configuration defined by ID"),
+    ("EventExtendedWait", "", "",
+     "Wait events from the last event configuration"),
+    ("GatheringConfigurationGet", "", "char *",
+     "Read different mnemonique type"),
+    ("GatheringConfigurationSet", "*Type", "",
+     "Configuration acquisition"),
+    ("GatheringCurrentNumberGet", "", "int *,int *",
+     "Maximum number of samples and current number during acquisition"),
+    ("GatheringStopAndSave", "", "",
+     "Stop acquisition and save data"),
+    ("GatheringDataAcquire", "", "",
+     "Acquire a configured data"),
+    ("GatheringDataGet", "IndexPoint", "char *",
+     "Get a data line from gathering buffer"),
+    ("GatheringDataMultipleLinesGet", "IndexPoint,NumberOfLines", "char *",
+     "Get multiple data lines from gathering buffer"),
+    ("GatheringReset", "", "",
+     "Empty the gathered data in memory to start new gathering from scratch"),
+    ("GatheringRun", "DataNumber,Divisor", "",
+     "Start a new gathering"),
+    ("GatheringRunAppend", "", "",
+     "Re-start the stopped gathering to add new data"),
+    ("GatheringStop", "", "",
+     "Stop the data gathering (without saving to file)"),
+    ("GatheringExternalConfigurationSet", "*Type", "",
+     "Configuration acquisition"),
+    ("GatheringExternalConfigurationGet", "", "char *",
+     "Read different mnemonique type"),
+    ("GatheringExternalCurrentNumberGet", "", "int *,int *",
+     "Maximum number of samples and current number during acquisition"),
+    ("GatheringExternalDataGet", "IndexPoint", "char *",
+     "Get a data line from external gathering buffer"),
+    ("GatheringExternalStopAndSave", "", "",
+     "Stop acquisition and save data"),
+    ("GlobalArrayGet", "Number", "char *",
+     "Get global array value"),
+    ("GlobalArraySet", "Number,ValueString", "",
+     "Set global array value"),
+    ("DoubleGlobalArrayGet", "Number", "double *",
+     "Get double global array value"),
+    ("DoubleGlobalArraySet", "Number,DoubleValue", "",
+     "Set double global array value"),
+    ("GPIODigitalGet", "GPIOName", "unsigned short *",
+     "Read digital output or digital input"),
+    ("GPIODigitalSet", "GPIOName,Mask,DigitalOutputValue", "",
+     "Set Digital Output for one or few output TTL"),
+    ("GroupAnalogTrackingModeEnable", "GroupName,Type", "",
+     "Enable Analog Tracking mode on selected group"),
+    ("GroupAnalogTrackingModeDisable", "GroupName", "",
+     "Disable Analog Tracking mode on selected group"),
+    ("GroupHomeSearch", "GroupName", "",
+     "Start home search sequence"),
+    ("GroupHomeSearchAndRelativeMove", "GroupName,*TargetDisplacement", "",
+     "Start home search sequence and execute a displacement"),
+    ("GroupInitialize", "GroupName", "",
+     "Start the initialization"),
+    ("GroupInitializeNoEncoderReset", "GroupName", "",
+     "Group initialization with no encoder reset"),
+    ("GroupInitializeWithEncoderCalibration", "GroupName", "",
+     "Group initialization with encoder calibration"),
+    ("GroupInterlockDisable", "GroupName", "",
+     "Set group interlock disable"),
+    ("GroupInterlockEnable", "GroupName", "",
+     "Set group interlock enable"),
+    ("GroupJogModeEnable", "GroupName", "",
+     "Enable Jog mode on selected group"),
+    ("GroupJogModeDisable", "GroupName", "",
+     "Disable Jog mode on selected group"),
+    ("GroupKill", "GroupName", "",
+     "Kill the group"),
+    ("GroupMotionDisable", "GroupName", "",
+     "Set Motion disable on selected group"),
+    ("GroupMotionEnable", "GroupName", "",
+     "Set Motion enable on selected group"),
+    ("GroupMoveAbort", "GroupName", "",
+     "Abort a move"),
+    ("GroupMoveAbortFast", "GroupName,AccelerationMultiplier", "",
+     "Abort quickly a move"),
+    ("GroupMoveAbsolute", "GroupName,*TargetPosition", "",
+     "Do an absolute move"),
+    ("GroupMoveRelative", "GroupName,*TargetDisplacement", "",
+     "Do a relative move"),
+    ("GroupPositionCorrectedProfilerGet", "GroupName,PositionX,PositionY",
+     "double *,double *",
+     "Return corrected profiler positions"),
+    ("GroupPositionPCORawEncoderGet", "GroupName,PositionX,PositionY",
+     "double *,double *",
+     "Return PCO raw encoder positions"),
+    ("GroupReferencingActionExecute",
+     "PositionerName,ReferencingAction,ReferencingSensor,ReferencingParameter",
+     "",
+     "Execute an action in referencing mode"),
+    ("GroupReferencingStart", "GroupName", "",
+     "Enter referencing mode"),
+    ("GroupReferencingStop", "GroupName", "",
+     "Exit referencing mode"),
+    ("GroupStatusGet", "GroupName", "int *",
+     "Return group status"),
+    ("GroupStatusStringGet", "GroupStatusCode", "char *",
+     "Return the group status string corresponding to the group status code"),
+    ("KillAll", "", "",
+     "Put all groups in 'Not initialized' state"),
+    ("RestartApplication", "", "",
+     "Restart the Controller"),
+    ("PositionerAnalogTrackingPositionParametersGet", "PositionerName",
+     "char *,double *,double *,double *,double *",
+     "Read dynamic parameters for one axe of a group for a future analog "
+     "tracking position"),
+    ("PositionerAnalogTrackingPositionParametersSet",
+     "PositionerName,GPIOName,Offset,Scale,Velocity,Acceleration",
+     "",
+     "Update dynamic parameters for one axe of a group for a future analog "
+     "tracking position"),
+    ("PositionerAnalogTrackingVelocityParametersGet", "PositionerName",
+     "char *,double *,double *,double *,int *,double *,double *",
+     "Read dynamic parameters for one axe of a group for a future analog "
+     "tracking velocity"),
+    ("PositionerAnalogTrackingVelocityParametersSet",
+     "PositionerName,GPIOName,Offset,Scale,DeadBandThreshold,Order,Velocity,Acceleration",
+     "",
+     "Update dynamic parameters for one axe of a group for a future analog "
+     "tracking velocity"),
+    ("PositionerBacklashGet", "PositionerName", "double *,char *",
+     "Read backlash value and status"),
+    ("PositionerBacklashSet", "PositionerName,BacklashValue", "",
+     "Set backlash value"),
+    ("PositionerBacklashEnable", "PositionerName", "",
+     "Enable the backlash"),
+    ("PositionerBacklashDisable", "PositionerName", "",
+     "Disable the backlash"),
+    ("PositionerCompensatedPCOAbort", "PositionerName", "",
+     "Abort CIE08 compensated PCO mode"),
+    ("PositionerCompensatedPCOCurrentStatusGet", "PositionerName", "int *",
+     "Get current status of CIE08 compensated PCO mode"),
+    ("PositionerCompensatedPCOEnable", "PositionerName", "",
+     "Enable CIE08 compensated PCO mode execution"),
+    ("PositionerCompensatedPCOFromFile", "PositionerName,DataFileName", "",
+     "Load file to CIE08 compensated PCO data buffer"),
+    ("PositionerCompensatedPCOLoadToMemory", "PositionerName,DataLines", "",
+     "Load data lines to CIE08 compensated PCO data buffer"),
+    ("PositionerCompensatedPCOMemoryReset", "PositionerName", "",
+     "Reset CIE08 compensated PCO data buffer"),
+    ("PositionerCompensatedPCOPrepare",
+     "PositionerName,ScanDirection,*StartPosition",
+     "",
+     "Prepare data for CIE08 compensated PCO mode"),
+    ("PositionerCompensatedPCOSet", "PositionerName,Start,Stop,Distance,Width",
+     "",
+     "Set data to CIE08 compensated PCO data buffer"),
+    ("PositionerCompensationFrequencyNotchsGet", "PositionerName",
+     "double *,double *,double *,double *,double *,double *,double *,double *,double *",
+     "Read frequency compensation notch filters parameters"),
+    ("PositionerCompensationFrequencyNotchsSet",
+     "PositionerName,NotchFrequency1,NotchBandwidth1,NotchGain1,NotchFrequency2,NotchBandwidth2,NotchGain2,NotchFrequency3,NotchBandwidth3,NotchGain3",
+     "",
+     "Update frequency compensation notch filters parameters"),
+    ("PositionerCompensationLowPassTwoFilterGet", "PositionerName", "double *",
+     "Read second order low-pass filter parameters"),
+    ("PositionerCompensationLowPassTwoFilterSet",
+     "PositionerName,CutOffFrequency",
+     "",
+     "Update second order low-pass filter parameters"),
+    ("PositionerCompensationNotchModeFiltersGet", "PositionerName",
+     "double *,double *,double *,double *,double *,double *,double *,double *",
+     "Read notch mode filters parameters"),
+    ("PositionerCompensationNotchModeFiltersSet",
+     "PositionerName,NotchModeFr1,NotchModeFa1,NotchModeZr1,NotchModeZa1,NotchModeFr2,NotchModeFa2,NotchModeZr2,NotchModeZa2",
+     "",
+     "Update notch mode filters parameters"),
+    ("PositionerCompensationPhaseCorrectionFiltersGet", "PositionerName",
+     "double *,double *,double *,double *,double *,double *",
+     "Read phase correction filters parameters"),
+    ("PositionerCompensationPhaseCorrectionFiltersSet",
+     "PositionerName,PhaseCorrectionFn1,PhaseCorrectionFd1,PhaseCorrectionGain1,PhaseCorrectionFn2,PhaseCorrectionFd2,PhaseCorrectionGain2",
+     "",
+     "Update phase correction filters parameters"),
+    ("PositionerCompensationSpatialPeriodicNotchsGet", "PositionerName",
+     "double *,double *,double *,double *,double *,double *,double *,double *,double *",
+     "Read spatial compensation notch filters parameters"),
+    ("PositionerCompensationSpatialPeriodicNotchsSet",
+     "PositionerName,SpatialNotchStep1,SpatialNotchBandwidth1,SpatialNotchGain1,SpatialNotchStep2,SpatialNotchBandwidth2,SpatialNotchGain2,SpatialNotchStep3,SpatialNotchBandwidth3,SpatialNotchGain3",
+     "",
+     "Update spatial compensation notch filters parameters"),
+    ("PositionerCorrectorNotchFiltersSet",
+     "PositionerName,NotchFrequency1,NotchBandwidth1,NotchGain1,NotchFrequency2,NotchBandwidth2,NotchGain2",
+     "",
+     "Update filters parameters"),
+    ("PositionerCorrectorNotchFiltersGet", "PositionerName",
+     "double *,double *,double *,double *,double *,double *",
+     "Read filters parameters"),
+    ("PositionerCorrectorPIDBaseSet",
+     "PositionerName,MovingMass,StaticMass,Viscosity,Stiffness",
+     "",
+     "Update PIDBase parameters"),
+    ("PositionerCorrectorPIDBaseGet", "PositionerName",
+     "double *,double *,double *,double *",
+     "Read PIDBase parameters"),
+    ("PositionerCorrectorPIDFFAccelerationSet",
+     "PositionerName,ClosedLoopStatus,KP,KI,KD,KS,IntegrationTime,DerivativeFilterCutOffFrequency,GKP,GKI,GKD,KForm,KFeedForwardAcceleration,KFeedForwardJerk",
+     "",
+     "Update corrector parameters"),
+    ("PositionerCorrectorPIDFFAccelerationGet", "PositionerName",
+     "bool *,double *,double *,double *,double *,double *,double *,double *,double *,double *,double *,double *,double *",
+     "Read corrector parameters"),
+    ("PositionerCorrectorP2IDFFAccelerationSet",
+     "PositionerName,ClosedLoopStatus,KP,KI,KI2,KD,KS,IntegrationTime,DerivativeFilterCutOffFrequency,GKP,GKI,GKD,KForm,KFeedForwardAcceleration,KFeedForwardJerk,SetpointPositionDelay",
+     "",
+     "Update corrector parameters"),
+    ("PositionerCorrectorP2IDFFAccelerationGet", "PositionerName",
+     "bool *,double *,double *,double *,double *,double *,double *,double *,double *,double *,double *,double *,double *,double *,double *",
+     "Read corrector parameters"),
+    ("PositionerCorrectorPIDFFVelocitySet",
+     "PositionerName,ClosedLoopStatus,KP,KI,KD,KS,IntegrationTime,DerivativeFilterCutOffFrequency,GKP,GKI,GKD,KForm,KFeedForwardVelocity",
+     "",
+     "Update corrector parameters"),
+    ("PositionerCorrectorPIDFFVelocityGet", "PositionerName",
+     "bool *,double *,double *,double *,double *,double *,double *,double *,double *,double *,double *,double *",
+     "Read corrector parameters"),
+    ("PositionerCorrectorPIDDualFFVoltageSet",
+     "PositionerName,ClosedLoopStatus,KP,KI,KD,KS,IntegrationTime,DerivativeFilterCutOffFrequency,GKP,GKI,GKD,KForm,KFeedForwardVelocity,KFeedForwardAcceleration,Friction",
+     "",
+     "Update corrector parameters"),
+    ("PositionerCorrectorPIDDualFFVoltageGet", "PositionerName",
+     "bool *,double *,double *,double *,double *,double *,double *,double *,double *,double *,double *,double *,double *,double *",
+     "Read corrector parameters"),
+    ("PositionerCorrectorPIPositionSet",
+     "PositionerName,ClosedLoopStatus,KP,KI,IntegrationTime",
+     "",
+     "Update corrector parameters"),
+    ("PositionerCorrectorPIPositionGet", "PositionerName",
+     "bool *,double *,double *,double *",
+     "Read corrector parameters"),
+    ("PositionerCorrectorSR1AccelerationSet",
+     "PositionerName,ClosedLoopStatus,KP,KI,KV,ObserverFrequency,CompensationGainVelocity,CompensationGainAcceleration,CompensationGainJerk",
+     "",
+     "Update corrector parameters"),
+    ("PositionerCorrectorSR1AccelerationGet", "PositionerName",
+     "bool *,double *,double *,double *,double *,double *,double *,double *",
+     "Read corrector parameters"),
+    ("PositionerCorrectorSR1ObserverAccelerationSet",
+     "PositionerName,ParameterA,ParameterB,ParameterC",
+     "",
+     "Update SR1 corrector observer parameters"),
+    ("PositionerCorrectorSR1ObserverAccelerationGet", "PositionerName",
+     "double *,double *,double *",
+     "Read SR1 corrector observer parameters"),
+    ("PositionerCorrectorSR1OffsetAccelerationSet",
+     "PositionerName,AccelerationOffset",
+     "",
+     "Update SR1 corrector output acceleration offset"),
+    ("PositionerCorrectorSR1OffsetAccelerationGet", "PositionerName",
+     "double *",
+     "Read SR1 corrector output acceleration offset"),
+    ("PositionerCorrectorTypeGet", "PositionerName", "char *",
+     "Read corrector type"),
+    ("PositionerCurrentVelocityAccelerationFiltersSet",
+     "PositionerName,CurrentVelocityCutOffFrequency,CurrentAccelerationCutOffFrequency",
+     "",
+     "Set current velocity and acceleration cut off frequencies"),
+    ("PositionerCurrentVelocityAccelerationFiltersGet", "PositionerName",
+     "double *,double *",
+     "Get current velocity and acceleration cut off frequencies"),
+    ("PositionerDriverFiltersGet", "PositionerName",
+     "double *,double *,double *,double *,double *",
+     "Get driver filters parameters"),
+    ("PositionerDriverFiltersSet",
+     "PositionerName,KI,NotchFrequency,NotchBandwidth,NotchGain,LowpassFrequency",
+     "",
+     "Set driver filters parameters"),
+    ("PositionerDriverPositionOffsetsGet", "PositionerName",
+     "double *,double *",
+     "Get driver stage and gage position offset"),
+    ("PositionerDriverStatusGet", "PositionerName", "int *",
+     "Read positioner driver status"),
+    ("PositionerDriverStatusStringGet", "PositionerDriverStatus", "char *",
+     "Return the positioner driver status string corresponding to the "
+     "positioner error code"),
+    ("PositionerEncoderAmplitudeValuesGet", "PositionerName",
+     "double *,double *,double *,double *",
+     "Read analog interpolated encoder amplitude values"),
+    ("PositionerEncoderCalibrationParametersGet", "PositionerName",
+     "double *,double *,double *,double *",
+     "Read analog interpolated encoder calibration parameters"),
+    ("PositionerErrorGet", "PositionerName", "int *",
+     "Read and clear positioner error code"),
+    ("PositionerErrorRead", "PositionerName", "int *",
+     "Read only positioner error code without clear it"),
+    ("PositionerErrorStringGet", "PositionerErrorCode", "char *",
+     "Return the positioner status string corresponding to the positioner "
+     "error code"),
+    ("PositionerExcitationSignalGet", "PositionerName",
+     "int *,double *,double *,double *",
+     "Get excitation signal mode"),
+    ("PositionerExcitationSignalSet",
+     "PositionerName,Mode,Frequency,Amplitude,Time",
+     "",
+     "Set excitation signal mode"),
+    ("PositionerHardwareStatusGet", "PositionerName", "int *",
+     "Read positioner hardware status"),
+    ("PositionerHardwareStatusStringGet", "PositionerHardwareStatus", "char *",
+     "Return the positioner hardware status string corresponding to the "
+     "positioner error code"),
+    ("PositionerHardInterpolatorFactorGet", "PositionerName", "int *",
+     "Get hard interpolator parameters"),
+    ("PositionerHardInterpolatorFactorSet",
+     "PositionerName,InterpolationFactor",
+     "",
+     "Set hard interpolator parameters"),
+    ("PositionerHardInterpolatorPositionGet", "PositionerName", "double *",
+     "Read external latch position"),
+    ("PositionerMaximumVelocityAndAccelerationGet", "PositionerName",
+     "double *,double *",
+     "Return maximum velocity and acceleration of the positioner"),
+    ("PositionerMotionDoneGet", "PositionerName",
+     "double *,double *,double *,double *,double *",
+     "Read motion done parameters"),
+    ("PositionerMotionDoneSet",
+     "PositionerName,PositionWindow,VelocityWindow,CheckingTime,MeanPeriod,TimeOut",
+     "",
+     "Update motion done parameters"),
+    ("PositionerPositionCompareAquadBAlwaysEnable", "PositionerName", "",
+     "Enable AquadB signal in always mode"),
+    ("PositionerPositionCompareAquadBWindowedGet", "PositionerName",
+     "double *,double *,bool *",
+     "Read position compare AquadB windowed parameters"),
+    ("PositionerPositionCompareAquadBWindowedSet",
+     "PositionerName,MinimumPosition,MaximumPosition",
+     "",
+     "Set position compare AquadB windowed parameters"),
+    ("PositionerPositionCompareGet", "PositionerName",
+     "double *,double *,double *,bool *",
+     "Read position compare parameters"),
+    ("PositionerPositionCompareSet",
+     "PositionerName,MinimumPosition,MaximumPosition,PositionStep",
+     "",
+     "Set position compare parameters"),
+    ("PositionerPositionCompareEnable", "PositionerName", "",
+     "Enable position compare"),
+    ("PositionerPositionCompareDisable", "PositionerName", "",
+     "Disable position compare"),
+    ("PositionerPositionComparePulseParametersGet", "PositionerName",
+     "double *,double *",
+     "Get position compare PCO pulse parameters"),
+    ("PositionerPositionComparePulseParametersSet",
+     "PositionerName,PCOPulseWidth,EncoderSettlingTime",
+     "",
+     "Set position compare PCO pulse parameters"),
+    ("PositionerPositionCompareScanAccelerationLimitGet", "PositionerName",
+     "double *",
+     "Get position compare scan acceleration limit"),
+    ("PositionerPositionCompareScanAccelerationLimitSet",
+     "PositionerName,ScanAccelerationLimit",
+     "",
+     "Set position compare scan acceleration limit"),
+    ("PositionerPreCorrectorExcitationSignalGet", "PositionerName",
+     "double *,double *,double *",
+     "Get pre-corrector excitation signal mode"),
+    ("PositionerPreCorrectorExcitationSignalSet",
+     "PositionerName,Frequency,Amplitude,Time",
+     "",
+     "Set pre-corrector excitation signal mode"),
+    ("PositionerRawEncoderPositionGet", "PositionerName,UserEncoderPosition",
+     "double *",
+     "Get the raw encoder position"),
+    ("PositionersEncoderIndexDifferenceGet", "PositionerName", "double *",
+     "Return the difference between index of primary axis and secondary axis "
+     "(only after homesearch)"),
+    ("PositionerSGammaExactVelocityAjustedDisplacementGet",
+     "PositionerName,DesiredDisplacement",
+     "double *",
+     "Return adjusted displacement to get exact velocity"),
+    ("PositionerSGammaParametersGet", "PositionerName",
+     "double *,double *,double *,double *",
+     "Read dynamic parameters for one axe of a group for a future "
+     "displacement"),
+    ("PositionerSGammaParametersSet",
+     "PositionerName,Velocity,Acceleration,MinimumTjerkTime,MaximumTjerkTime",
+     "",
+     "Update dynamic parameters for one axe of a group for a future "
+     "displacement"),
+    ("PositionerSGammaPreviousMotionTimesGet", "PositionerName",
+     "double *,double *",
+     "Read SettingTime and SettlingTime"),
+    ("PositionerStageParameterGet", "PositionerName,ParameterName", "char *",
+     "Return the stage parameter"),
+    ("PositionerStageParameterSet",
+     "PositionerName,ParameterName,ParameterValue",
+     "",
+     "Save the stage parameter"),
+    ("PositionerTimeFlasherGet", "PositionerName",
+     "double *,double *,double *,bool *",
+     "Read time flasher parameters"),
+    ("PositionerTimeFlasherSet",
+     "PositionerName,MinimumPosition,MaximumPosition,TimeInterval",
+     "",
+     "Set time flasher parameters"),
+    ("PositionerTimeFlasherEnable", "PositionerName", "",
+     "Enable time flasher"),
+    ("PositionerTimeFlasherDisable", "PositionerName", "",
+     "Disable time flasher"),
+    ("PositionerUserTravelLimitsGet", "PositionerName", "double *,double *",
+     "Read UserMinimumTarget and UserMaximumTarget"),
+    ("PositionerUserTravelLimitsSet",
+     "PositionerName,UserMinimumTarget,UserMaximumTarget",
+     "",
+     "Update UserMinimumTarget and UserMaximumTarget"),
+    ("PositionerWarningFollowingErrorSet",
+     "PositionerName,WarningFollowingError",
+     "",
+     "Set positioner warning following error limit"),
+    ("PositionerWarningFollowingErrorGet", "PositionerName", "double *",
+     "Get positioner warning following error limit"),
+    ("PositionerCorrectorAutoTuning", "PositionerName,TuningMode",
+     "double *,double *,double *",
+     "Astrom&Hagglund based auto-tuning"),
+    ("PositionerAccelerationAutoScaling", "PositionerName", "double *",
+     "Astrom&Hagglund based auto-scaling"),
+    ("MultipleAxesPVTVerification", "GroupName,TrajectoryFileName", "",
+     "Multiple axes PVT trajectory verification"),
+    ("MultipleAxesPVTVerificationResultGet", "PositionerName",
+     "char *,double *,double *,double *,double *",
+     "Multiple axes PVT trajectory verification result get"),
+    ("MultipleAxesPVTExecution",
+     "GroupName,TrajectoryFileName,ExecutionNumber",
+     "",
+     "Multiple axes PVT trajectory execution"),
+    ("MultipleAxesPVTParametersGet", "GroupName", "char *,int *",
+     "Multiple axes PVT trajectory get parameters"),
+    ("MultipleAxesPVTPulseOutputSet",
+     "GroupName,StartElement,EndElement,TimeInterval",
+     "",
+     "Configure pulse output on trajectory"),
+    ("MultipleAxesPVTPulseOutputGet", "GroupName", "int *,int *,double *",
+     "Get pulse output on trajectory configuration"),
+    ("MultipleAxesPVTLoadToMemory", "GroupName,TrajectoryPart", "",
+     "Multiple Axes Load PVT trajectory through function"),
+    ("MultipleAxesPVTResetInMemory", "GroupName", "",
+     "Multiple Axes PVT trajectory reset in memory"),
+    ("SingleAxisSlaveModeEnable", "GroupName", "",
+     "Enable the slave mode"),
+    ("SingleAxisSlaveModeDisable", "GroupName", "",
+     "Disable the slave mode"),
+    ("SingleAxisSlaveParametersSet", "GroupName,PositionerName,Ratio", "",
+     "Set slave parameters"),
+    ("SingleAxisSlaveParametersGet", "GroupName", "char *,double *",
+     "Get slave parameters"),
+    ("SingleAxisThetaClampDisable", "GroupName", "",
+     "Set clamping disable on selected group"),
+    ("SingleAxisThetaClampEnable", "GroupName", "",
+     "Set clamping enable on selected group"),
+    ("SingleAxisThetaSlaveModeEnable", "GroupName", "",
+     "Enable the slave mode"),
+    ("SingleAxisThetaSlaveModeDisable", "GroupName", "",
+     "Disable the slave mode"),
+    ("SingleAxisThetaSlaveParametersSet", "GroupName,PositionerName,Ratio", "",
+     "Set slave parameters"),
+    ("SingleAxisThetaSlaveParametersGet", "GroupName", "char *,double *",
+     "Get slave parameters"),
+    ("SpindleSlaveModeEnable", "GroupName", "",
+     "Enable the slave mode"),
+    ("SpindleSlaveModeDisable", "GroupName", "",
+     "Disable the slave mode"),
+    ("SpindleSlaveParametersSet", "GroupName,PositionerName,Ratio", "",
+     "Set slave parameters"),
+    ("SpindleSlaveParametersGet", "GroupName", "char *,double *",
+     "Get slave parameters"),
+    ("GroupSpinParametersSet", "GroupName,Velocity,Acceleration", "",
+     "Modify Spin parameters on selected group and activate the continuous "
+     "move"),
+    ("GroupSpinParametersGet", "GroupName", "double *,double *",
+     "Get Spin parameters on selected group"),
+    ("GroupSpinCurrentGet", "GroupName", "double *,double *",
+     "Get Spin current on selected group"),
+    ("GroupSpinModeStop", "GroupName,Acceleration", "",
+     "Stop Spin mode on selected group with specified acceleration"),
+    ("XYLineArcVerification", "GroupName,TrajectoryFileName", "",
+     "XY trajectory verification"),
+    ("XYLineArcVerificationResultGet", "PositionerName",
+     "char *,double *,double *,double *,double *",
+     "XY trajectory verification result get"),
+    ("XYLineArcExecution",
+     "GroupName,TrajectoryFileName,Velocity,Acceleration,ExecutionNumber",
+     "",
+     "XY trajectory execution"),
+    ("XYLineArcParametersGet", "GroupName", "char *,double *,double *,int *",
+     "XY trajectory get parameters"),
+    ("XYLineArcPulseOutputSet",
+     "GroupName,StartLength,EndLength,PathLengthInterval",
+     "",
+     "Configure pulse output on trajectory"),
+    ("XYLineArcPulseOutputGet", "GroupName", "double *,double *,double *",
+     "Get pulse output on trajectory configuration"),
+    ("XYPVTVerification", "GroupName,TrajectoryFileName", "",
+     "XY PVT trajectory verification"),
+    ("XYPVTVerificationResultGet", "PositionerName",
+     "char *,double *,double *,double *,double *",
+     "XY PVT trajectory verification result get"),
+    ("XYPVTExecution", "GroupName,TrajectoryFileName,ExecutionNumber", "",
+     "XY PVT trajectory execution"),
+    ("XYPVTParametersGet", "GroupName", "char *,int *",
+     "XY PVT trajectory get parameters"),
+    ("XYPVTPulseOutputSet", "GroupName,StartElement,EndElement,TimeInterval",
+     "",
+     "Configure pulse output on trajectory"),
+    ("XYPVTPulseOutputGet", "GroupName", "int *,int *,double *",
+     "Get pulse output on trajectory configuration"),
+    ("XYPVTLoadToMemory", "GroupName,TrajectoryPart", "",
+     "XY Load PVT trajectory through function"),
+    ("XYPVTResetInMemory", "GroupName", "",
+     "XY PVT trajectory reset in memory"),
+    ("XYZGroupPositionCorrectedProfilerGet",
+     "GroupName,PositionX,PositionY,PositionZ",
+     "double *,double *,double *",
+     "Return corrected profiler positions"),
+    ("XYZGroupPositionPCORawEncoderGet",
+     "GroupName,PositionX,PositionY,PositionZ",
+     "double *,double *,double *",
+     "Return PCO raw encoder positions"),
+    ("XYZSplineVerification", "GroupName,TrajectoryFileName", "",
+     "XYZ trajectory verifivation"),
+    ("XYZSplineVerificationResultGet", "PositionerName",
+     "char *,double *,double *,double *,double *",
+     "XYZ trajectory verification result get"),
+    ("XYZSplineExecution",
+     "GroupName,TrajectoryFileName,Velocity,Acceleration",
+     "",
+     "XYZ trajectory execution"),
+    ("XYZSplineParametersGet", "GroupName", "char *,double *,double *,int *",
+     "XYZ trajectory get parameters"),
+    ("TZPVTVerification", "GroupName,TrajectoryFileName", "",
+     "TZ PVT trajectory verification"),
+    ("TZPVTVerificationResultGet", "PositionerName",
+     "char *,double *,double *,double *,double *",
+     "TZ PVT trajectory verification result get"),
+    ("TZPVTExecution", "GroupName,TrajectoryFileName,ExecutionNumber", "",
+     "TZ PVT trajectory execution"),
+    ("TZPVTParametersGet", "GroupName", "char *,int *",
+     "TZ PVT trajectory get parameters"),
+    ("TZPVTPulseOutputSet", "GroupName,StartElement,EndElement,TimeInterval",
+     "",
+     "Configure pulse output on trajectory"),
+    ("TZPVTPulseOutputGet", "GroupName", "int *,int *,double *",
+     "Get pulse output on trajectory configuration"),
+    ("TZPVTLoadToMemory", "GroupName,TrajectoryPart", "",
+     "TZ Load PVT trajectory through function"),
+    ("TZPVTResetInMemory", "GroupName", "",
+     "TZ PVT trajectory reset in memory"),
+    ("TZFocusModeEnable", "GroupName", "",
+     "Enable the focus mode"),
+    ("TZFocusModeDisable", "GroupName", "",
+     "Disable the focus mode"),
+    ("TZTrackingUserMaximumZZZTargetDifferenceGet", "GroupName", "double *",
+     "Get user maximum ZZZ target difference for tracking control"),
+    ("TZTrackingUserMaximumZZZTargetDifferenceSet",
+     "GroupName,UserMaximumZZZTargetDifference",
+     "",
+     "Set user maximum ZZZ target difference for tracking control"),
+    ("FocusProcessSocketReserve", "", "",
+     "Set user maximum ZZZ target difference for tracking control"),
+    ("FocusProcessSocketFree", "", "",
+     "Set user maximum ZZZ target difference for tracking control"),
+    ("PositionerMotorOutputOffsetGet", "PositionerName",
+     "double *,double *,double *,double *",
+     "Get soft (user defined) motor output DAC offsets"),
+    ("PositionerMotorOutputOffsetSet",
+     "PositionerName,PrimaryDAC1,PrimaryDAC2,SecondaryDAC1,SecondaryDAC2",
+     "",
+     "Set soft (user defined) motor output DAC offsets"),
+    ("SingleAxisThetaPositionRawGet", "GroupName",
+     "double *,double *,double *",
+     "Get raw encoder positions for single axis theta encoder"),
+    ("EEPROMCIESet", "CardNumber,ReferenceString", "",
+     "Get raw encoder positions for single axis theta encoder"),
+    ("EEPROMDACOffsetCIESet", "PlugNumber,DAC1Offset,DAC2Offset", "",
+     "Get raw encoder positions for single axis theta encoder"),
+    ("EEPROMDriverSet", "PlugNumber,ReferenceString", "",
+     "Get raw encoder positions for single axis theta encoder"),
+    ("EEPROMINTSet", "CardNumber,ReferenceString", "",
+     "Get raw encoder positions for single axis theta encoder"),
+    ("CPUCoreAndBoardSupplyVoltagesGet", "",
+     "double *,double *,double *,double *,double *,double *,double *,double *",
+     "Get CPU core and board supply voltages"),
+    ("CPUTemperatureAndFanSpeedGet", "", "double *,double *",
+     "Get CPU temperature and fan speed"),
+    ("ActionListGet", "", "char *",
+     "Action list"),
+    ("ActionExtendedListGet", "", "char *",
+     "Action extended list"),
+    ("APIExtendedListGet", "", "char *",
+     "API method list"),
+    ("APIListGet", "", "char *",
+     "API method list without extended API"),
+    ("ControllerStatusListGet", "", "char *",
+     "Controller status list"),
+    ("ErrorListGet", "", "char *",
+     "Error list"),
+    ("EventListGet", "", "char *",
+     "General event list"),
+    ("GatheringListGet", "", "char *",
+     "Gathering type list"),
+    ("GatheringExtendedListGet", "", "char *",
+     "Gathering type extended list"),
+    ("GatheringExternalListGet", "", "char *",
+     "External Gathering type list"),
+    ("GroupStatusListGet", "", "char *",
+     "Group status list"),
+    ("HardwareInternalListGet", "", "char *",
+     "Internal hardware list"),
+    ("HardwareDriverAndStageGet", "PlugNumber", "char *,char *",
+     "Smart hardware"),
+    ("ObjectsListGet", "", "char *",
+     "Group name and positioner name"),
+    ("PositionerErrorListGet", "", "char *",
+     "Positioner error list"),
+    ("PositionerHardwareStatusListGet", "", "char *",
+     "Positioner hardware status list"),
+    ("PositionerDriverStatusListGet", "", "char *",
+     "Positioner driver status list"),
+    ("ReferencingActionListGet", "", "char *",
+     "Get referencing action list"),
+    ("ReferencingSensorListGet", "", "char *",
+     "Get referencing sensor list"),
+    ("PrepareForUpdate", "", "",
+     "Prepare for update controller"),
+    ("GatheringUserDatasGet", "",
+     "double *,double *,double *,double *,double *,double *,double *,double *",
+     "Return UserDatas values"),
+    ("ControllerMotionKernelMinMaxTimeLoadGet", "",
+     "double *,double *,double *,double *,double *,double *,double *,double *",
+     "Get controller motion kernel minimum and maximum time load"),
+    ("ControllerMotionKernelMinMaxTimeLoadReset", "", "",
+     "Reset controller motion kernel min/max time load"),
+    ("ControllerMotionKernelPeriodMinMaxGet", "",
+     "double *,double *,double *,double *,double *,double *",
+     "Get controller motion kernel min/max periods"),
+    ("ControllerMotionKernelPeriodMinMaxReset", "", "",
+     "Reset controller motion kernel min/max periods"),
+    ("SocketsStatusGet", "", "char *",
+     "Get sockets current status"),
+    ("TestTCP", "InputString", "char *",
+     "Test TCP/IP transfert"),
+    ("ISRCorrectorCompensateOverrunNumberGet", "", "int *,int *",
+     "Get ISR Corrector Compensate Overrun Number"),
+    ("ISRCorrectorCompensateOverrunNumberReset", "", "",
+     "Reset ISR Corrector Compensate Overrun Number"),
+    ("OptionalModuleExecute", "ModuleFileName", "",
+     "Execute an optional module"),
+    ("OptionalModuleKill", "TaskName", "",
+     "Kill an optional module"),
+)
+
+# Functions returning their outputs once per element of a group, generated
+# from this table of (name, outputs of an element, description). See
+# common.element_method.
+_ELEMENT_FUNCTIONS = (
+    ("GroupAccelerationSetpointGet", "double *",
+     "Return setpoint accelerations"),
+    ("GroupCorrectorOutputGet", "double *",
+     "Return corrector outputs"),
+    ("GroupCurrentFollowingErrorGet", "double *",
+     "Return current following errors"),
+    ("GroupJogParametersGet", "double *,double *",
+     "Get Jog parameters on selected group"),
+    ("GroupJogCurrentGet", "double *,double *",
+     "Get Jog current on selected group"),
+    ("GroupMotionStatusGet", "int *",
+     "Return group or positioner status"),
+    ("GroupPositionCurrentGet", "double *",
+     "Return current positions"),
+    ("GroupPositionSetpointGet", "double *",
+     "Return setpoint positions"),
+    ("GroupPositionTargetGet", "double *",
+     "Return target positions"),
+    ("GroupVelocityCurrentGet", "double *",
+     "Return current velocities"),
+)
+
+add_functions(XPS, [spec for spec in _FUNCTIONS if spec[0] not in XPS._CACHE_TTL])
+add_functions(XPS, [spec for spec in _FUNCTIONS if spec[0] in XPS._CACHE_TTL],
+              call="_cached_call")
+add_element_functions(XPS, _ELEMENT_FUNCTIONS)
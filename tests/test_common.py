@@ -0,0 +1,364 @@
+import asyncio
+import inspect
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'bin'))
+
+from devices.newport import common, hxp, xps
+from devices.newport.common import ConnectionPool, ControllerProtocol, prototype_parser
+
+
+class MockController:
+    """Mock controller answering the first `commands` commands it gets by
+    writing `chunks` one read at a time, then closing the connection if
+    `close` is set."""
+
+    def __init__(self, chunks, commands=1, close=False):
+        self.chunks = chunks
+        self.commands = commands
+        self.close = close
+        self.server = None
+
+    async def start(self):
+        self.server = await asyncio.start_server(self.handle, '127.0.0.1', 0)
+        return self.server.sockets[0].getsockname()[1]
+
+    async def handle(self, reader, writer):
+        received = b''
+        while received.count(b')') < self.commands:
+            data = await reader.read(4096)
+            if not data:
+                writer.close()
+                return
+            received += data
+        for i, chunk in enumerate(self.chunks):
+            if i:
+                # Let the client read every chunk on its own.
+                await asyncio.sleep(0.02)
+            writer.write(chunk)
+            await writer.drain()
+        if not self.close:
+            await reader.read()
+        writer.close()
+
+
+class TestControllerProtocol(unittest.TestCase):
+    """Returns are cut out of the reads in order, wherever the reads split."""
+
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+
+    def tearDown(self):
+        self.loop.close()
+
+    def run_commands(self, controller, commands):
+        """Send `commands` back-to-back to `controller`.
+
+        Returns: the list of their raw returns, or of their exceptions.
+        """
+        async def main():
+            port = await controller.start()
+            _, protocol = await self.loop.create_connection(
+                lambda: ControllerProtocol(self.loop), '127.0.0.1', port)
+            try:
+                futures = protocol.send_many(commands)
+                return await asyncio.wait_for(
+                    asyncio.gather(*futures, return_exceptions=True), 5)
+            finally:
+                protocol.close()
+                controller.server.close()
+                await controller.server.wait_closed()
+                await protocol.closed
+                await asyncio.sleep(0.01)
+        return self.loop.run_until_complete(main())
+
+    def test_whole_return(self):
+        controller = MockController([b'0,1.5,EndOfAPI'])
+        self.assertEqual(self.run_commands(controller, [b'GroupStatusGet(G1,int *)']),
+                         [b'0,1.5,EndOfAPI'])
+
+    def test_return_split_across_reads(self):
+        controller = MockController([b'0,1.5,', b'2.5', b',EndOfAPI'])
+        self.assertEqual(self.run_commands(controller, [b'Get(double *,double *)']),
+                         [b'0,1.5,2.5,EndOfAPI'])
+
+    def test_returns_in_one_read(self):
+        controller = MockController([b'0,1,EndOfAPI0,2,EndOfAPI-17,EndOfAPI'], commands=3)
+        self.assertEqual(self.run_commands(controller, [b'A()', b'B()', b'C()']),
+                         [b'0,1,EndOfAPI', b'0,2,EndOfAPI', b'-17,EndOfAPI'])
+
+    def test_return_split_inside_sentinel(self):
+        controller = MockController([b'0,1,End', b'OfAPI0,2,', b'EndOfAPI0,3', b',EndOfAPI'],
+                                    commands=3)
+        self.assertEqual(self.run_commands(controller, [b'A()', b'B()', b'C()']),
+                         [b'0,1,EndOfAPI', b'0,2,EndOfAPI', b'0,3,EndOfAPI'])
+
+    def test_connection_lost_with_pending_commands(self):
+        controller = MockController([b'0,1,EndOfAPI0,2,End'], commands=3, close=True)
+        rets = self.run_commands(controller, [b'A()', b'B()', b'C()'])
+        self.assertEqual(rets[0], b'0,1,EndOfAPI')
+        self.assertIsInstance(rets[1], ConnectionError)
+        self.assertIsInstance(rets[2], ConnectionError)
+
+    def test_send_after_connection_lost(self):
+        async def main():
+            controller = MockController([], commands=1, close=True)
+            port = await controller.start()
+            _, protocol = await self.loop.create_connection(
+                lambda: ControllerProtocol(self.loop), '127.0.0.1', port)
+            future = protocol.send(b'A()')
+            with self.assertRaises(ConnectionError):
+                await asyncio.wait_for(future, 5)
+            await protocol.closed
+            with self.assertRaises(ConnectionError):
+                protocol.send(b'B()')
+            controller.server.close()
+            await controller.server.wait_closed()
+            await asyncio.sleep(0.01)
+        self.loop.run_until_complete(main())
+
+
+class Recorder:
+    """Stands in for a device, generated methods return the command they
+    would send."""
+
+    def _call(self, function, args):
+        return function.format(args)
+
+    _cached_call = _call
+
+
+# Calls of generated XPS methods and the commands the hand-written methods
+# used to send for them.
+COMMANDS = [
+    ("FirmwareVersionGet", (), b'FirmwareVersionGet(char *)'),
+    ("GroupStatusGet", ("GROUP1",), b'GroupStatusGet(GROUP1,int *)'),
+    ("PositionerUserTravelLimitsGet", ("GROUP1.POS",),
+     b'PositionerUserTravelLimitsGet(GROUP1.POS,double *,double *)'),
+    ("EventExtendedRemove", (3,), b'EventExtendedRemove(3)'),
+    ("GPIODigitalSet", ("GPIO1.DO", 255, 1), b'GPIODigitalSet(GPIO1.DO,255,1)'),
+    ("PositionerSGammaParametersSet", ("GROUP1.POS", 20.0, 80.5, 0.005, 0.05),
+     b'PositionerSGammaParametersSet(GROUP1.POS,20.0,80.5,0.005,0.05)'),
+    ("GroupMoveAbsolute", ("GROUP1", [1.0, -2.5, 0.1]),
+     b'GroupMoveAbsolute(GROUP1,1.0,-2.5,0.1)'),
+    ("GroupMoveRelative", ("GROUP1", (0.1 + 0.2,)),
+     b'GroupMoveRelative(GROUP1,0.30000000000000004)'),
+]
+
+# Output prototypes, returned bytes after the error code and their parsed
+# returns.
+PARSES = [
+    ("", b'', (0, '')),
+    ("int *", b'12', (0, 12)),
+    ("unsigned short *", b'3', (0, 3)),
+    ("double *,double *", b'1.5,-2e-3', (0, 1.5, -0.002)),
+    ("bool *,bool *,bool *", b'1,0,true', (0, True, False, True)),
+    ("char *", b'XPS-D 1.0, build 3', (0, 'XPS-D 1.0, build 3')),
+    ("double *,int *,bool *,char *", b'0.25,7,0,a,b', (0, 0.25, 7, False, 'a,b')),
+]
+
+# Output prototypes and returned bytes with a wrong number of fields.
+BAD_PARSES = [
+    ("double *,double *", b'1.5'),
+    ("double *", b'1.5,2.5'),
+    ("int *,int *", b'1,2,3'),
+    ("int *", b''),
+]
+
+
+class TestFunctions(unittest.TestCase):
+    """Methods generated from the function tables build the same commands as
+    the hand-written ones did, and their parsers convert every output."""
+
+    def test_commands(self):
+        for name, args, command in COMMANDS:
+            with self.subTest(name=name):
+                method = getattr(xps.XPS, name)
+                self.assertEqual(method(Recorder(), *args), command)
+                # Name-only commands are cached, the cache must not change them.
+                self.assertEqual(method(Recorder(), *args), command)
+
+    def test_parsers(self):
+        for returns, returnedBytes, parsed in PARSES:
+            with self.subTest(returns=returns):
+                self.assertEqual(prototype_parser(returns)(0, returnedBytes), parsed)
+
+    def test_empty_return(self):
+        loop = asyncio.new_event_loop()
+        try:
+            device = xps.XPS(loop=loop)
+            for name in ("GroupKill", "EventExtendedRemove", "Login"):
+                with self.subTest(name=name):
+                    function = device._functions[name]
+                    self.assertEqual(function.parse(*device._split_return(b'0,EndOfAPI')),
+                                     (0, ''))
+        finally:
+            loop.close()
+
+    def test_wrong_field_count(self):
+        for returns, returnedBytes in BAD_PARSES:
+            with self.subTest(returns=returns, returnedBytes=returnedBytes):
+                with self.assertRaises(ValueError):
+                    prototype_parser(returns)(0, returnedBytes)
+
+    def test_signatures(self):
+        for module, cls in ((xps, xps.XPS), (hxp, hxp.HXP)):
+            for name, args, returns, doc in module._FUNCTIONS:
+                with self.subTest(cls=cls.__name__, name=name):
+                    method = getattr(cls, name)
+                    params = ['self'] + [arg.lstrip('*') for arg in args.split(',') if arg]
+                    self.assertEqual(list(inspect.signature(method).parameters), params)
+                    self.assertEqual(method.__doc__, doc)
+                    self.assertEqual(method.__qualname__, cls.__name__ + '.' + name)
+                    self.assertEqual(cls._functions[name].returns,
+                                     returns.split(',') if returns else [])
+            for name, output, doc in module._ELEMENT_FUNCTIONS:
+                with self.subTest(cls=cls.__name__, name=name):
+                    self.assertEqual(list(inspect.signature(getattr(cls, name)).parameters),
+                                     ['self', 'GroupName', 'nbElement'])
+
+
+class MockServer:
+    """Mock controller which only accepts connections and counts them."""
+
+    def __init__(self):
+        self.opened = 0
+        self.writers = []
+        self.server = None
+
+    async def start(self):
+        self.server = await asyncio.start_server(self.handle, '127.0.0.1', 0)
+        return self.server.sockets[0].getsockname()[1]
+
+    async def handle(self, reader, writer):
+        self.opened += 1
+        self.writers.append(writer)
+        await reader.read()
+        writer.close()
+
+
+class TestConnectionPool(unittest.TestCase):
+    """Pools burst under load, shrink back, are shared between devices and
+    closed with their last one."""
+
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        self.controller = MockServer()
+        self.port = self.loop.run_until_complete(self.controller.start())
+
+    def tearDown(self):
+        for pool in list(common._POOLS.values()):
+            pool.close()
+        common._CLOSING.clear()
+        self.controller.server.close()
+        for writer in self.controller.writers:
+            writer.close()
+        self.loop.run_until_complete(asyncio.sleep(0.01))
+        self.loop.close()
+
+    def acquire(self, size, burst=0):
+        return ConnectionPool.acquire(self.loop, '127.0.0.1', self.port, size, 5, burst)
+
+    def test_burst_and_shrink(self):
+        async def main():
+            pool = await self.acquire(2, burst=1)
+            a, b = pool.queue.get_nowait(), pool.queue.get_nowait()
+            c = await pool.get()
+            self.assertEqual(len(pool.protocols), 3)
+            # No more burst connections, wait for one to be given back.
+            waiting = asyncio.ensure_future(pool.get())
+            await asyncio.sleep(0.05)
+            self.assertFalse(waiting.done())
+            pool.put(a)
+            self.assertIs(await waiting, a)
+            pool.put(b)
+            # Another connection is idle, the burst one is closed.
+            pool.put(c)
+            self.assertNotIn(c, pool.protocols)
+            await c.closed
+            pool.put(a)
+            self.assertEqual(len(pool.protocols), 2)
+            self.assertEqual(pool.queue.qsize(), 2)
+            self.assertEqual(self.controller.opened, 3)
+            pool.release()
+        self.loop.run_until_complete(main())
+
+    def test_refused_burst_waits(self):
+        async def main():
+            pool = await self.acquire(1, burst=1)
+            a = pool.queue.get_nowait()
+            # Stop accepting connections, as a controller out of sockets.
+            self.controller.server.close()
+            waiting = asyncio.ensure_future(pool.get())
+            await asyncio.sleep(0.05)
+            self.assertFalse(waiting.done())
+            self.assertEqual(pool.protocols, [a])
+            pool.put(a)
+            self.assertIs(await waiting, a)
+            pool.release()
+        self.loop.run_until_complete(main())
+
+    def test_shared_between_devices(self):
+        async def main():
+            first = await self.acquire(2)
+            second = await self.acquire(2)
+            self.assertIs(first, second)
+            self.assertEqual(first.users, 2)
+            self.assertEqual(self.controller.opened, 2)
+            protocols = list(first.protocols)
+            first.release()
+            self.assertEqual(first.protocols, protocols)
+            self.assertIs(common._POOLS[first.key], first)
+            second.release()
+            self.assertEqual(first.protocols, [])
+            self.assertNotIn(first.key, common._POOLS)
+            await asyncio.wait_for(asyncio.gather(*[p.closed for p in protocols]), 5)
+        self.loop.run_until_complete(main())
+
+    def test_reconnect_waits_for_closed_pool(self):
+        async def main():
+            pool = await self.acquire(3)
+            closed = [protocol.closed for protocol in pool.protocols]
+            pool.release()
+            self.assertFalse(all(future.done() for future in closed))
+            self.assertIn(pool.key, common._CLOSING)
+            new = await self.acquire(3)
+            self.assertIsNot(new, pool)
+            self.assertTrue(all(future.done() for future in closed))
+            self.assertNotIn(pool.key, common._CLOSING)
+            self.assertEqual(self.controller.opened, 6)
+            new.release()
+        self.loop.run_until_complete(main())
+
+    def test_device_warned_of_shared_sizes(self):
+        async def main():
+            first = xps.XPS(loop=self.loop, queue_size=2)
+            second = hxp.HXP(loop=self.loop, queue_size=4)
+            warnings = []
+            second._log_warning = warnings.append
+            for device in (first, second):
+                device.init_device = lambda: asyncio.sleep(0)
+                await device.open_connection('127.0.0.1', self.port)
+            self.assertIs(first._pool, second._pool)
+            self.assertEqual(first._pool.size, 2)
+            self.assertEqual(len(warnings), 1)
+            first.close_connection()
+            second.close_connection()
+        self.loop.run_until_complete(main())
+
+    def test_failed_connection(self):
+        async def main():
+            self.controller.server.close()
+            await self.controller.server.wait_closed()
+            with self.assertRaises(OSError):
+                await self.acquire(2)
+            self.assertNotIn(('127.0.0.1', self.port), common._POOLS)
+        self.loop.run_until_complete(main())
+
+
+if __name__ == '__main__':
+    unittest.main()
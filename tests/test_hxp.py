@@ -0,0 +1,185 @@
+import asyncio
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'bin'))
+
+from devices.newport.hxp import HXP
+
+
+class MockHXP:
+    """Mock HXP controller with a single axis. GroupMoveAbsolute only returns
+    once the move ends, like the real one, and position reads take `delay`
+    seconds to be answered with the position at the time they were read."""
+
+    def __init__(self, move_time=0.1, delay=0.0):
+        self.position = 0.0
+        self.move_time = move_time
+        self.delay = delay
+        # Commands answered with an error code.
+        self.errors = set()
+        # Number of position reads answered.
+        self.reads = 0
+        self.server = None
+
+    async def start(self):
+        self.server = await asyncio.start_server(self.handle, '127.0.0.1', 0)
+        return self.server.sockets[0].getsockname()[1]
+
+    async def handle(self, reader, writer):
+        buffer = b''
+        while True:
+            data = await reader.read(4096)
+            if not data:
+                break
+            buffer += data
+            while b')' in buffer:
+                command, _, buffer = buffer.partition(b')')
+                await self.answer(command, writer)
+
+    async def answer(self, command, writer):
+        if command + b')' in self.errors:
+            writer.write(b'-17,EndOfAPI')
+        elif command.startswith(b'GroupMoveAbsolute('):
+            await asyncio.sleep(self.move_time)
+            self.position = float(command.rsplit(b',', 1)[1])
+            writer.write(b'0,EndOfAPI')
+        elif command.startswith(b'GroupPositionCurrentGet('):
+            self.reads += 1
+            position = self.position
+            await asyncio.sleep(self.delay)
+            writer.write(b'0,%r,EndOfAPI' % position)
+        elif command.startswith(b'GroupStatusGet('):
+            writer.write(b'0,12,EndOfAPI')
+        else:
+            writer.write(b'0,EndOfAPI')
+
+
+class TestReadsAfterMove(unittest.TestCase):
+    """Reads of the position after a move returned must see its end."""
+
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+
+    def tearDown(self):
+        self.loop.close()
+
+    def run_move(self, controller, read_at):
+        async def main():
+            port = await controller.start()
+            hxp = HXP(loop=self.loop, max_age=1)
+            hxp.init_device = lambda: asyncio.sleep(0)
+            await hxp.open_connection('127.0.0.1', port)
+            try:
+                move = asyncio.ensure_future(hxp.GroupMoveAbsolute('HEXAPOD', [5.0]))
+                await asyncio.sleep(read_at)
+                during = asyncio.ensure_future(hxp.GroupPositionCurrentGet('HEXAPOD.X', 1))
+                await move
+                after = await hxp.GroupPositionCurrentGet('HEXAPOD.X', 1)
+                await during
+                return after
+            finally:
+                hxp.close_connection()
+                controller.server.close()
+                await controller.server.wait_closed()
+                await asyncio.sleep(0.01)
+        return self.loop.run_until_complete(main())
+
+    def test_read_during_move_is_not_cached(self):
+        self.assertEqual(self.run_move(MockHXP(), read_at=0.05), (0, 5.0))
+
+    def test_read_in_flight_at_move_end_is_not_joined(self):
+        self.assertEqual(self.run_move(MockHXP(delay=0.1), read_at=0.05), (0, 5.0))
+
+    def test_only_commands_which_may_move_forget_reads(self):
+        async def main():
+            controller = MockHXP()
+            port = await controller.start()
+            hxp = HXP(loop=self.loop, max_age=1)
+            hxp.init_device = lambda: asyncio.sleep(0)
+            await hxp.open_connection('127.0.0.1', port)
+            try:
+                await hxp.GroupPositionCurrentGet('HEXAPOD.X', 1)
+                await hxp._receive(b'PositionerErrorRead(HEXAPOD.1,int *)')
+                await hxp.call_many([("GroupStatusGet", ["HEXAPOD"])])
+                await hxp.GroupPositionCurrentGet('HEXAPOD.X', 1)
+                self.assertEqual(controller.reads, 1)
+                await hxp.GroupMotionDisable('HEXAPOD')
+                await hxp.GroupPositionCurrentGet('HEXAPOD.X', 1)
+                self.assertEqual(controller.reads, 2)
+            finally:
+                hxp.close_connection()
+                controller.server.close()
+                await controller.server.wait_closed()
+                await asyncio.sleep(0.01)
+        self.loop.run_until_complete(main())
+
+
+class TestQuery(unittest.TestCase):
+    """A bad reply to the status poll only affects the value it was for."""
+
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+
+    def tearDown(self):
+        self.loop.close()
+
+    def test_bad_reply_keeps_other_groups(self):
+        async def main():
+            controller = MockHXP()
+            controller.position = 3.0
+            controller.errors.add(b'GroupStatusGet(HEXAPOD.Y,int *)')
+            port = await controller.start()
+            hxp = HXP(loop=self.loop, interval=0.01, idle_interval=0.01)
+            errors, warnings = [], []
+            hxp._log_error, hxp._log_warning = errors.append, warnings.append
+            await hxp.open_connection('127.0.0.1', port)
+            try:
+                await asyncio.sleep(0.1)
+                self.assertEqual(hxp._work_status, [12, 0, 12, 12, 12, 12])
+                self.assertEqual(hxp._work_positions, [3.0] * 6)
+                self.assertGreater(hxp._work_positions_time, float('-inf'))
+
+                controller.errors.add(b'GroupPositionCurrentGet(HEXAPOD.Z,double *)')
+                controller.position = 4.0
+                read_at = self.loop.time()
+                await asyncio.sleep(0.1)
+                self.assertEqual(hxp._work_positions, [4.0, 4.0, 3.0, 4.0, 4.0, 4.0])
+                # Positions are only fresh once all of them were read.
+                self.assertLess(hxp._work_positions_time, read_at)
+                # Bad replies are only warned about, at most once an interval.
+                self.assertEqual(errors, [])
+                self.assertEqual(len(warnings), 1)
+            finally:
+                hxp.close_connection()
+                controller.server.close()
+                await controller.server.wait_closed()
+                await asyncio.sleep(0.01)
+        self.loop.run_until_complete(main())
+
+
+    def test_motion_command_wakes_idle_poll(self):
+        async def main():
+            controller = MockHXP(move_time=0.05)
+            port = await controller.start()
+            hxp = HXP(loop=self.loop, interval=0.01, idle_interval=10)
+            await hxp.open_connection('127.0.0.1', port)
+            try:
+                # Nothing changes, polling slows down to the idle interval.
+                await asyncio.sleep(0.1)
+                await hxp.GroupMoveAbsolute('HEXAPOD', [5.0])
+                await asyncio.sleep(0.05)
+                self.assertEqual(hxp._work_positions, [5.0] * 6)
+            finally:
+                hxp.close_connection()
+                controller.server.close()
+                await controller.server.wait_closed()
+                await asyncio.sleep(0.01)
+        self.loop.run_until_complete(main())
+
+
+if __name__ == '__main__':
+    unittest.main()